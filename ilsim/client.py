@@ -1,26 +1,62 @@
 import socket
 import sys
+from typing import Iterable
 
 
-def main() -> None:
+def send_many(
+  commands: Iterable[bytes],
+  host: str = "localhost",
+  port: int = 9999,
+) -> list[bytes]:
   """
-  Entry point for clients.
+  Send multiple commands over a single connection and return one reply
+  per command.
+
+  Commands are pipelined in a single sendall and replies are collected
+  by b"\\r\\n" framing, so scripted scenarios pay the TCP handshake once
+  instead of once per command.
   """
-  HOST, PORT = "localhost", 9999
-  arg = " ".join(sys.argv[1:])
+  command_list: list[bytes] = list(commands)
+  if not command_list:
+    return []
 
+  buffer = bytearray()
   # Create a socket (SOCK_STREAM means a TCP socket)
   with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-    # Connect to server and send data
-    sock.connect((HOST, PORT))
-    data = bytes(arg + "\r\n", "utf-8")
-    sock.sendall(data)
+    # Protocol frames are short and latency-sensitive, don't let the
+    # kernel batch them up
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    # Connect to server and send all commands at once
+    sock.connect((host, port))
+    if hasattr(socket, "TCP_QUICKACK"):  # Linux only
+      sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+    sock.sendall(b"\r\n".join(command_list) + b"\r\n")
+
+    # Receive data from the server into a reusable buffer until every
+    # command got its framed reply
+    chunk = bytearray(4096)
+    while buffer.count(b"\r\n") < len(command_list):
+      received_length = sock.recv_into(chunk)
+      if received_length == 0:
+        break
+      buffer += chunk[:received_length]
+
+  return [reply + b"\r\n" for reply in bytes(buffer).split(b"\r\n")[:-1]]
 
-    # Receive data from the server and shut down
-    received = sock.recv(1024)
 
-  print(f"Sent:     {data!r}")
-  print(f"Received: {received!r}")
+def main() -> None:
+  """
+  Entry point for clients.
+
+  Every command line argument is sent as its own command; all commands
+  share a single connection.
+  """
+  commands = [bytes(arg, "utf-8") for arg in sys.argv[1:]]
+  replies = send_many(commands)
+  for command, reply in zip(commands, replies):
+    frame = command + b"\r\n"
+    print(f"Sent:     {frame!r}")
+    print(f"Received: {reply!r}")
 
 
 if __name__ == "__main__":
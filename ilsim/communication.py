@@ -1,25 +1,53 @@
 
 
 # native imports
-import re
 from enum import IntEnum
-from functools import partial
 from typing import Callable
+from typing import ClassVar
+from typing import Final
 from typing import Iterable
 
 # internal imports
 from .errors import CommandFormatError
 from .errors import CommunicationException
 from .errors import GeneralSystemError
+from .errors import ID_OUTSIDE_VALID_RANGE_ERROR
 from .errors import IDOutsideValidRangeError
 from .errors import InaccessibleIDOrQueryError
 from .errors import QueryOutsideValidRangeError
 from .errors import QueryReadProtectedError
 from .errors import QueryWriteProtectedError
-from .errors import WriteDataOutsideValidRangeError
+from .errors import WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
 from .sensor import SensorUnit
 
 
+# Constants
+_ID_BYTES: Final = tuple(b"%02d" % i for i in range(100))
+"""Pre-formatted two-digit ID field for SR/SW/FR replies."""
+_QUERY_BYTES: Final = tuple(b"%03d" % q for q in range(1180))
+"""Pre-formatted three-digit data-number field for SR/SW/FR replies."""
+ErrCode = int
+"""
+Protocol error code carried as plain data, see
+errors.CommunicationErrorCodes for the meaning of each value.
+"""
+NO_ERROR: Final[ErrCode] = 0
+"""ErrCode value signalling success."""
+CRLF: Final = b'\r\n'
+"""Protocol frame trailer, appended once per reply in handle_query."""
+# Error codes hoisted to plain ints: IntEnum .value goes through a
+# DynamicClassAttribute descriptor, which is too slow to re-resolve on
+# every failed request. The exception types remain the public API.
+_ERR_FORMAT: Final[ErrCode] = int(CommandFormatError.error_code)
+_ERR_SYSTEM: Final[ErrCode] = int(GeneralSystemError.error_code)
+_ERR_ID_RANGE: Final[ErrCode] = int(IDOutsideValidRangeError.error_code)
+_ERR_QUERY_RANGE: Final[ErrCode] = int(QueryOutsideValidRangeError.error_code)
+_ERR_READ_PROTECTED: Final[ErrCode] = int(QueryReadProtectedError.error_code)
+_ERR_WRITE_PROTECTED: Final[ErrCode] = int(QueryWriteProtectedError.error_code)
+_ERR_INACCESSIBLE: Final[ErrCode] = int(InaccessibleIDOrQueryError.error_code)
+# ------------------------------------------------------------------------------
+
+
 class DLEN1Error(IntEnum):
   """
   Internal error codes for communication unit.
@@ -132,61 +160,94 @@ class CommunicationUnit:
   Simulates communication unit
   """
   # ----------------------------------------------------------------------------
+  # All instance attributes are known up front, so slot them: no
+  # per-instance __dict__ and faster attribute loads in the handlers.
+  __slots__ = (
+    'connected_sensors',
+    'internal_error',
+    'mask_sensor_status',
+    '_error_mask_cache',
+    '_reply_buf',
+  )
+  # ----------------------------------------------------------------------------
   connected_sensors: list[SensorUnit]
   internal_error: DLEN1Error
-  valid_query_regex: re.Pattern[str]
   mask_sensor_status: bool
-  read_mapping: dict[int, Callable[[], int]]
-  write_mapping: dict[int, Callable[[int], None]]
+  _error_mask_cache: int | None
+  _reply_buf: bytearray
+  # ----------------------------------------------------------------------------
+  # Dispatch tables for SR and SW commands, built once at class-definition
+  # time. Handlers are stored by name and resolved with getattr at call
+  # time, so no per-instance dicts or bound partials are needed.
+  _READ_DISPATCH: ClassVar[dict[int, str]] = {
+    0: 'read_000_status',
+    1: 'read_001_sensor_error_status',
+    2: 'read_002_warning_status',
+    4: 'read_004_current_value_0_property',
+    8: 'read_008_error_id_number',
+    9: 'read_009_error_code',
+    10: 'read_010_warning_id_number',
+    11: 'read_011_warning_code',
+    16: 'read_016_output_1_high',
+    17: 'read_017_output_2_low',
+    18: 'read_018_output_3_go',
+    19: 'read_019_output_4_alarm',
+    20: 'read_020_output_5',
+    38: 'read_038_current_value_0_invalid',
+    39: 'read_039_current_value_0_under_range',
+    40: 'read_040_current_value_0_over_range',
+    76: 'read_076_sensor_status_mask_setting',
+    77: 'read_077_sensor_connected_number',
+    668: 'read_668_error_code_id_00',
+  }
+  _WRITE_DISPATCH: ClassVar[dict[int, str]] = {
+    76: 'write_076_sensor_status_mask_setting',
+  }
+  # Command prefix to handler; each handler validates its own fixed-width
+  # layout and replies in a single pass.
+  _COMMAND_DISPATCH: ClassVar[dict[bytes, str]] = {
+    b'M0': '_handle_M0',
+    b'MS': '_handle_MS',
+    b'SR': '_handle_SR',
+    b'SW': '_handle_SW',
+    b'FR': '_handle_FR',
+  }
   # ----------------------------------------------------------------------------
 
   def __init__(self) -> None:
     self.connected_sensors = []
     self.internal_error = DLEN1Error.NO_ERROR
-    self.valid_query_regex = re.compile(
-      r"(?:M0|MS|SR,(\d{2}),(\d{3})|SW,(\d{2}),(\d{3}),([+-]\d{9})"
-      r"|FR,(\d{2}),(\d{3}))\r\n"
-    )
     self.mask_sensor_status = False
-    self.init_mappings()
-  # ----------------------------------------------------------------------------
-
-  def init_mappings(self) -> None:
-    """
-    Create the function mappings for SR and SW commands.
-    """
-    self.read_mapping = {
-      0: self.read_000_status,
-      1: self.read_001_sensor_error_status,
-      2: self.read_002_warning_status,
-      4: self.read_004_current_value_0_property,
-      8: self.read_008_error_id_number,
-      9: self.read_009_error_code,
-      10: self.read_010_warning_id_number,
-      11: self.read_011_warning_code,
-      16: self.read_016_output_1_high,
-      17: self.read_017_output_2_low,
-      18: self.read_018_output_3_go,
-      19: self.read_019_output_4_alarm,
-      20: self.read_020_output_5,
-      38: self.read_038_current_value_0_invalid,
-      39: self.read_039_current_value_0_under_range,
-      40: self.read_040_current_value_0_over_range,
-      76: self.read_076_sensor_status_mask_setting,
-      77: self.read_077_sensor_connected_number,
-      668: self.read_668_error_code_id_00,
-    }
-    self.write_mapping = {
-      76: self.write_076_sensor_status_mask_setting
-    }
-    # Add 044-058 and 669-683 to the mapping
-    for i in range(15):
-      self.read_mapping[44 + i] = partial(
-        self.read_044_to_058_current_value_id_Y, i
-      )
-      self.read_mapping[669 + i] = partial(
-        self.read_669_to_683_error_code_id_Y, i
-      )
+    self._error_mask_cache = None
+    # Reusable scratch buffer for multi-part replies; reused across
+    # handle_query calls. Not safe for concurrent queries by itself:
+    # ilsim.server serializes handle_query behind
+    # DLEN1TCPHandler._query_lock, and any other embedder sharing one
+    # CommunicationUnit across threads must do the same.
+    self._reply_buf = bytearray(64)
+  # ----------------------------------------------------------------------------
+
+  def _error_mask(self) -> int:
+    """
+    ID-indexed bitmap of erroring sensors, memoized between error-state
+    changes.
+
+    Status polls typically read data numbers 000/001/008/009 in sequence;
+    the mask feeding all of them is computed once and reused until the
+    sensor population changes or a connected amplifier's error state is
+    updated, which the sensors report through _error_subscribers.
+    """
+    if self._error_mask_cache is None:
+      self._error_mask_cache = self._bitmap(SensorUnit.has_error)
+    return self._error_mask_cache
+  # ----------------------------------------------------------------------------
+
+  def _invalidate_error_mask(self) -> None:
+    """
+    Drop the memoized error bitmap; registered with each connected
+    sensor so any error-state update rebuilds it on the next read.
+    """
+    self._error_mask_cache = None
   # ----------------------------------------------------------------------------
 
   def assign_main_unit(self) -> None:
@@ -211,6 +272,8 @@ class CommunicationUnit:
     Add a single sensor unit to the communication unit.
     """
     self.connected_sensors.append(unit)
+    unit._error_subscribers.append(self._invalidate_error_mask)
+    self._error_mask_cache = None
     self.assign_main_unit()
   # ----------------------------------------------------------------------------
 
@@ -218,7 +281,10 @@ class CommunicationUnit:
     """
     Add an iteralbe of one or more sensor units to the communication unit.
     """
-    self.connected_sensors.extend(units)
+    for unit in units:
+      self.connected_sensors.append(unit)
+      unit._error_subscribers.append(self._invalidate_error_mask)
+    self._error_mask_cache = None
     self.assign_main_unit()
   # ----------------------------------------------------------------------------
 
@@ -246,249 +312,310 @@ class CommunicationUnit:
       sensor.apply_uncertainty()
   # ----------------------------------------------------------------------------
 
+  @staticmethod
+  def error_reply(query: bytes, error_code: ErrCode) -> bytes:
+    """
+    Build an ER reply for the given command prefix and error code.
+    """
+    return b'ER,%s,%03d' % (query, error_code)
+  # ----------------------------------------------------------------------------
+
+  def _malformed(self, raw_query: bytes) -> bytes:
+    """
+    Report a malformed command frame and build its ER reply.
+    """
+    print(f"Invalid query! {raw_query!r}")
+    return self.error_reply(
+      raw_query[0:2], _ERR_FORMAT
+    )
+  # ----------------------------------------------------------------------------
+
   def handle_query(self, raw_query: bytes) -> bytes:
     """
     Handle incoming command from client communicating with sensors.
+
+    The caller hands in a complete frame with the CRLF trailer already
+    stripped; the trailer is appended to the reply exactly once here.
+    Commands are fixed-width ASCII frames; the two-byte prefix picks the
+    per-command handler, which validates the layout, extracts the fields
+    and replies in one pass. Parsing and reply building stay on bytes
+    end-to-end; nothing is decoded or re-encoded.
     """
-    reply: str
-    translated_query: str = raw_query.decode('utf-8')
-    query: str = translated_query[0:2]
-    mo: re.Match[str] | None = (
-      self.valid_query_regex.fullmatch(translated_query)
-    )
-    if mo is None:
-      print(f"Invalid query! {translated_query}")
-      reply = f'ER,{query},{CommandFormatError.error_code.value:0>3}\r\n'
-      return reply.encode('utf-8')
+    handler_name = self._COMMAND_DISPATCH.get(raw_query[0:2])
+    if handler_name is None:
+      return self._malformed(raw_query) + CRLF
+    handler_function: Callable[[bytes], bytes] = getattr(self, handler_name)
+    return handler_function(raw_query) + CRLF
+  # ----------------------------------------------------------------------------
+
+  def _handle_M0(self, raw_query: bytes) -> bytes:
+    """
+    Validate an M0 frame and reply.
+    """
+    if len(raw_query) != 2:
+      return self._malformed(raw_query)
+    if self.internal_error != DLEN1Error.NO_ERROR:
+      return self.error_reply(b'M0', _ERR_SYSTEM)
+    self.apply_sensor_uncertainty()
+    return self.response_M0()
+  # ----------------------------------------------------------------------------
 
+  def _handle_MS(self, raw_query: bytes) -> bytes:
+    """
+    Validate an MS frame and reply.
+    """
+    if len(raw_query) != 2:
+      return self._malformed(raw_query)
     if self.internal_error != DLEN1Error.NO_ERROR:
-      reply = f'ER,{query},{GeneralSystemError.error_code.value:0>3}\r\n'
-      return reply.encode('utf-8')
-
-    id: str | None = None
-    query_data: str | None = None
-    setting_data: str | None = None
-    if query == 'SR':
-      id = mo.group(1)
-      query_data = mo.group(2)
-    elif query == 'SW':
-      id = mo.group(3)
-      query_data = mo.group(4)
-      setting_data = mo.group(5)
-    elif query == 'FR':
-      id = mo.group(6)
-      query_data = mo.group(7)
+      return self.error_reply(b'MS', _ERR_SYSTEM)
+    self.apply_sensor_uncertainty()
+    return self.response_MS()
+  # ----------------------------------------------------------------------------
 
-    try:
-      reply = self.response(query, id, query_data, setting_data)
-    except CommunicationException as e:
-      reply = f'ER,{query},{e.error_code.value:0>3}\r\n'
-    except Exception:
-      reply = f'ER,{query},{GeneralSystemError.error_code.value:0>3}\r\n'
-      raise
-    return reply.encode('utf-8')
+  def _handle_SR(self, raw_query: bytes) -> bytes:
+    """
+    Validate an SR frame, e.g. b'SR,01,038', and reply.
+    """
+    if (
+      len(raw_query) != 9
+      or raw_query[2:3] != b','
+      or raw_query[5:6] != b','
+      or not raw_query[3:5].isdigit()
+      or not raw_query[6:9].isdigit()
+    ):
+      return self._malformed(raw_query)
+    if self.internal_error != DLEN1Error.NO_ERROR:
+      return self.error_reply(b'SR', _ERR_SYSTEM)
+    return self.response_SR(int(raw_query[3:5]), int(raw_query[6:9]))
   # ----------------------------------------------------------------------------
 
-  def response(
-    self,
-    query: str,
-    id: str | None = None,
-    query_data: str | None = None,
-    setting_data: str | None = None,
-  ) -> str:
-    """
-    Preapre resposne for known commands.
-    """
-    if query == 'M0':
-      self.apply_sensor_uncertainty()
-      return self.response_M0()
-    if query == 'MS':
-      self.apply_sensor_uncertainty()
-      return self.response_MS()
-    if query == 'SR':
-      assert id is not None
-      assert query_data is not None
-      return self.response_SR(id, query_data)
-    if query == 'SW':
-      assert id is not None
-      assert query_data is not None
-      assert setting_data is not None
-      return self.response_SW(id, query_data, setting_data)
-    if query == 'FR':
-      assert id is not None
-      assert query_data is not None
-      return self.response_FR(id, query_data)
-
-    return "MISSING_RESPONSE!\r\n"
-  # ----------------------------------------------------------------------------
-
-  def response_M0(self) -> str:
+  def _handle_SW(self, raw_query: bytes) -> bytes:
+    """
+    Validate an SW frame, e.g. b'SW,01,065,+000005000', and reply.
+    """
+    if (
+      len(raw_query) != 20
+      or raw_query[2:3] != b','
+      or raw_query[5:6] != b','
+      or raw_query[9:10] != b','
+      or raw_query[10:11] not in (b'+', b'-')
+      or not raw_query[3:5].isdigit()
+      or not raw_query[6:9].isdigit()
+      or not raw_query[11:20].isdigit()
+    ):
+      return self._malformed(raw_query)
+    if self.internal_error != DLEN1Error.NO_ERROR:
+      return self.error_reply(b'SW', _ERR_SYSTEM)
+    return self.response_SW(
+      int(raw_query[3:5]), int(raw_query[6:9]), int(raw_query[10:20])
+    )
+  # ----------------------------------------------------------------------------
+
+  def _handle_FR(self, raw_query: bytes) -> bytes:
+    """
+    Validate an FR frame, e.g. b'FR,01,001', and reply.
+    """
+    if (
+      len(raw_query) != 9
+      or raw_query[2:3] != b','
+      or raw_query[5:6] != b','
+      or not raw_query[3:5].isdigit()
+      or not raw_query[6:9].isdigit()
+    ):
+      return self._malformed(raw_query)
+    if self.internal_error != DLEN1Error.NO_ERROR:
+      return self.error_reply(b'FR', _ERR_SYSTEM)
+    return self.response_FR(int(raw_query[3:5]), int(raw_query[6:9]))
+  # ----------------------------------------------------------------------------
+
+  def response_M0(self) -> bytes:
     """
     M0 command
 
     The measured values of all the connected sensor amplifiers are read.
     """
-    values = ','.join(u.stringified_value for u in self.connected_sensors)
-    return f"M0,{values}\r\n"
+    buf = self._reply_buf
+    del buf[:]
+    buf += b"M0"
+    for u in self.connected_sensors:
+      buf += b","
+      buf += u.stringified_value_bytes
+    return bytes(buf)
   # ----------------------------------------------------------------------------
 
-  def response_MS(self) -> str:
+  def response_MS(self) -> bytes:
     """
     MS command
 
     The measured values and output statuses of all the
     connected sensor amplifiers are read.
     """
-    values = ','.join(
-      f"{u.stringified_state},{u.stringified_value}"
-      for u in self.connected_sensors
-    )
-    return f"MS,{values}\r\n"
+    buf = self._reply_buf
+    del buf[:]
+    buf += b"MS"
+    for u in self.connected_sensors:
+      buf += b","
+      buf += u.stringified_pair_bytes
+    return bytes(buf)
   # ----------------------------------------------------------------------------
 
-  def response_SR(self, id: int | str, query_data: int | str) -> str:
+  def response_SR(self, id: int, query_data: int) -> bytes:
     """
     SR command
 
     The data of the specified connected sensor amplifier is read.
     """
-    try:
-      id = int(id)
-    except ValueError:
-      raise CommandFormatError
-    try:
-      query_data = int(query_data)
-    except ValueError:
-      raise CommandFormatError
     output: int | str
     if id == 0:
       # handle on communication unit
       try:
-        output = self.handle_read(query_data)
+        ok, output = self.handle_read(query_data)
       except NotImplementedError:
-        return "NOT_IMPLEMENTED!"
+        return b"NOT_IMPLEMENTED!"
+      if not ok:
+        assert isinstance(output, int)
+        return self.error_reply(b'SR', output)
     else:
       # handle on sensor
-      try:
-        relevant_sensor = self.connected_sensors[id - 1]
-      except IndexError:
-        raise IDOutsideValidRangeError
+      if id > len(self.connected_sensors):
+        return self.error_reply(b'SR', _ERR_ID_RANGE)
+      relevant_sensor = self.connected_sensors[id - 1]
       try:
         output = relevant_sensor.handle_read(query_data)
       except NotImplementedError:
-        return "NOT_IMPLEMENTED!"
+        return b"NOT_IMPLEMENTED!"
+      except CommunicationException as e:
+        # Sensor handlers still signal protocol failures by raising;
+        # wrap them into an ER reply at this boundary.
+        return self.error_reply(b'SR', e.error_code)
 
     if isinstance(output, str):
-      return f"SR,{id:0>2},{query_data:0>3},{output}\r\n"
-    return f"SR,{id:0>2},{query_data:0>3},{output:+010d}\r\n"
+      return b"SR,%s,%s,%s" % (
+        _ID_BYTES[id], _QUERY_BYTES[query_data], output.encode('ascii')
+      )
+    return b"SR,%s,%s,%+010d" % (
+      _ID_BYTES[id], _QUERY_BYTES[query_data], output
+    )
   # ----------------------------------------------------------------------------
 
   def response_SW(
     self,
-    id: int | str,
-    query_data: int | str,
-    setting_data: int | str
-  ) -> str:
+    id: int,
+    query_data: int,
+    setting_data: int
+  ) -> bytes:
     """
     SW command
 
     Data is written to the specified connected sensor amplifier.
     """
-    try:
-      id = int(id)
-    except ValueError:
-      raise CommandFormatError
-    try:
-      query_data = int(query_data)
-    except ValueError:
-      raise CommandFormatError
-    try:
-      setting_data = int(setting_data)
-    except ValueError:
-      raise CommandFormatError
     if id == 0:
       # handle on communication unit
       try:
-        self.handle_write(query_data, setting_data)
+        error_code = self.handle_write(query_data, setting_data)
       except NotImplementedError:
-        return "NOT_IMPLEMENTED!"
-      return f"SW,{id:0>2},{query_data:0>3}\r\n"
+        return b"NOT_IMPLEMENTED!"
+      if error_code != NO_ERROR:
+        return self.error_reply(b'SW', error_code)
+      return b"SW,%s,%s" % (_ID_BYTES[id], _QUERY_BYTES[query_data])
     else:
       # handle on sensor
-      try:
-        relevant_sensor = self.connected_sensors[id - 1]
-      except IndexError:
-        raise IDOutsideValidRangeError
+      if id > len(self.connected_sensors):
+        return self.error_reply(b'SW', _ERR_ID_RANGE)
+      relevant_sensor = self.connected_sensors[id - 1]
       try:
         relevant_sensor.handle_write(query_data, setting_data)
       except NotImplementedError:
-        return "NOT_IMPLEMENTED!"
-      return f"SW,{id:0>2},{query_data:0>3}\r\n"
+        return b"NOT_IMPLEMENTED!"
+      except CommunicationException as e:
+        # Sensor handlers still signal protocol failures by raising;
+        # wrap them into an ER reply at this boundary.
+        return self.error_reply(b'SW', e.error_code)
+      return b"SW,%s,%s" % (_ID_BYTES[id], _QUERY_BYTES[query_data])
   # ----------------------------------------------------------------------------
 
-  def response_FR(self, id: int | str, query_data: int | str) -> str:
+  def response_FR(self, id: int, query_data: int) -> bytes:
     """
     FR command
 
     The decimal position of the specified connected sensor
     amplifier is read.
     """
-    try:
-      id = int(id)
-    except ValueError:
-      raise CommandFormatError
-    try:
-      query_data = int(query_data)
-    except ValueError:
-      raise CommandFormatError
-    if id == 0:
-      raise IDOutsideValidRangeError
+    if id == 0 or id > len(self.connected_sensors):
+      return self.error_reply(b'FR', _ERR_ID_RANGE)
     else:
       # handle on sensor
-      try:
-        relevant_sensor = self.connected_sensors[id - 1]
-      except IndexError:
-        raise IDOutsideValidRangeError
+      relevant_sensor = self.connected_sensors[id - 1]
       try:
         # TODO: Investigate if the real sensor gives different decimal position
         # for different query_data arguments
         # e.g. analog output, integer values, boolean 0/1
         output: int = relevant_sensor.decimal_position
       except NotImplementedError:
-        return "NOT_IMPLEMENTED!"
-      return f"FR,{id:0>2},{query_data:0>3},{output:+010d}\r\n"
+        return b"NOT_IMPLEMENTED!"
+      return b"FR,%s,%s,%+010d" % (
+        _ID_BYTES[id], _QUERY_BYTES[query_data], output
+      )
   # ----------------------------------------------------------------------------
 
-  def handle_read(self, query_data: int) -> int:
+  def handle_read(self, query_data: int) -> tuple[bool, int | ErrCode]:
     """
     Dispatch read calls for SR commands.
+
+    Returns (True, value) on success and (False, error_code) on protocol
+    failures. Carrying the failure as data keeps invalid or protected
+    queries as cheap as valid ones; no exception or traceback object is
+    constructed on this path.
     """
     if query_data > 1179:
-      raise QueryOutsideValidRangeError
-    handler_function = self.read_mapping.get(query_data)
-    if handler_function is None:
-      if query_data in self.write_mapping:
-        # Write-Only function
-        raise QueryReadProtectedError
-      # System-reserved:
-      raise InaccessibleIDOrQueryError
-    return handler_function()
+      return False, _ERR_QUERY_RANGE
+    handler_name = self._READ_DISPATCH.get(query_data)
+    if handler_name is not None:
+      handler_function: Callable[[], int] = getattr(self, handler_name)
+      return True, handler_function()
+    # Data numbers 044-058 and 669-683 are ID-indexed reads; a range
+    # check plus offset replaces per-entry table rows here.
+    if 44 <= query_data <= 58 or 669 <= query_data <= 683:
+      try:
+        if query_data <= 58:
+          return True, self.read_044_to_058_current_value_id_Y(query_data - 44)
+        return True, self.read_669_to_683_error_code_id_Y(query_data - 669)
+      except CommunicationException as e:
+        # e.g. reading the current value of an ID with no sensor behind it
+        return False, int(e.error_code)
+    if query_data in self._WRITE_DISPATCH:
+      # Write-Only function
+      return False, _ERR_READ_PROTECTED
+    # System-reserved:
+    return False, _ERR_INACCESSIBLE
   # ----------------------------------------------------------------------------
 
-  def handle_write(self, query_data: int, setting_data: int) -> None:
+  def handle_write(self, query_data: int, setting_data: int) -> ErrCode:
     """
     Dispatch write calls for SW commands.
+
+    Returns NO_ERROR on success and the protocol error code on failure,
+    mirroring handle_read's data-based failure path.
     """
     if query_data > 1179:
-      raise QueryOutsideValidRangeError
-    handler_function = self.write_mapping.get(query_data)
-    if handler_function is None:
-      if query_data in self.read_mapping:
+      return _ERR_QUERY_RANGE
+    handler_name = self._WRITE_DISPATCH.get(query_data)
+    if handler_name is None:
+      if (
+        query_data in self._READ_DISPATCH
+        or 44 <= query_data <= 58
+        or 669 <= query_data <= 683
+      ):
         # Read-Only function
-        raise QueryWriteProtectedError
+        return _ERR_WRITE_PROTECTED
       # System-reserved:
-      raise InaccessibleIDOrQueryError
-    handler_function(setting_data)
+      return _ERR_INACCESSIBLE
+    handler_function: Callable[[int], None] = getattr(self, handler_name)
+    try:
+      handler_function(setting_data)
+    except CommunicationException as e:
+      return int(e.error_code)
+    return NO_ERROR
   # ----------------------------------------------------------------------------
 
   def read_000_status(self) -> int:
@@ -501,8 +628,21 @@ class CommunicationUnit:
     Bit15: Error Status
     """
     output: int = 0
-    output += 2**0 * (self.internal_error != DLEN1Error.NO_ERROR)
-    output += 2**15 * any(s.has_error() for s in self.connected_sensors)
+    if self.internal_error != DLEN1Error.NO_ERROR:
+      output |= 1 << 0
+    if self._error_mask() != 0:
+      output |= 1 << 15
+    return output
+  # ----------------------------------------------------------------------------
+
+  def _bitmap(self, flag: Callable[[SensorUnit], bool]) -> int:
+    """
+    Fold a per-sensor boolean into an ID-indexed bitmap (bit 0 = ID 1).
+    """
+    output: int = 0
+    for i, sensor in enumerate(self.connected_sensors):
+      if flag(sensor):
+        output |= 1 << i
     return output
   # ----------------------------------------------------------------------------
 
@@ -514,10 +654,7 @@ class CommunicationUnit:
     Bit 0 to bit 14: ID number 1 to ID number 15
     Bit15: Reserved for system
     """
-    output: int = 0
-    for i, sensor in enumerate(self.connected_sensors):
-      output += 2**i * sensor.has_error()
-    return output
+    return self._error_mask()
   # ----------------------------------------------------------------------------
 
   def read_002_warning_status(self) -> int:
@@ -537,10 +674,7 @@ class CommunicationUnit:
     Bit 0 to bit 14: ID number 1 to ID number 15
     Bit15: Reserved for system
     """
-    output: int = 0
-    for i, sensor in enumerate(self.connected_sensors):
-      output += 2**i * sensor.is_out_of_range()
-    return output
+    return self._bitmap(SensorUnit.is_out_of_range)
   # ----------------------------------------------------------------------------
 
   def read_008_error_id_number(self) -> int:
@@ -550,10 +684,9 @@ class CommunicationUnit:
     """
     if self.internal_error != DLEN1Error.NO_ERROR:
       return 0  # error in communication unit
-    for i, sensor in enumerate(self.connected_sensors):
-      if sensor.has_error():
-        return (i + 1)
-    return 0  # No Error
+    # bit_length of the lowest set bit gives the first erroring ID
+    error_mask: int = self._error_mask()
+    return (error_mask & -error_mask).bit_length()
   # ----------------------------------------------------------------------------
 
   def read_009_error_code(self) -> int:
@@ -563,10 +696,11 @@ class CommunicationUnit:
     """
     if self.internal_error != DLEN1Error.NO_ERROR:
       return self.internal_error
-    for sensor in self.connected_sensors:
-      if sensor.has_error():
-        return sensor.error_code
-    return 0
+    error_mask: int = self._error_mask()
+    if error_mask == 0:
+      return 0
+    first_error_id: int = (error_mask & -error_mask).bit_length()
+    return self.connected_sensors[first_error_id - 1].error_code
   # ----------------------------------------------------------------------------
 
   def read_010_warning_id_number(self) -> int:
@@ -594,10 +728,7 @@ class CommunicationUnit:
     Bit 0 to bit 14: ID number 1 to ID number 15
     Bit15: Reserved for system
     """
-    output: int = 0
-    for i, sensor in enumerate(self.connected_sensors):
-      output += 2**i * sensor.high_output
-    return output
+    return self._bitmap(lambda sensor: sensor.high_output)
   # ----------------------------------------------------------------------------
 
   def read_017_output_2_low(self) -> int:
@@ -608,10 +739,7 @@ class CommunicationUnit:
     Bit 0 to bit 14: ID number 1 to ID number 15
     Bit15: Reserved for system
     """
-    output: int = 0
-    for i, sensor in enumerate(self.connected_sensors):
-      output += 2**i * sensor.low_output
-    return output
+    return self._bitmap(lambda sensor: sensor.low_output)
   # ----------------------------------------------------------------------------
 
   def read_018_output_3_go(self) -> int:
@@ -622,10 +750,7 @@ class CommunicationUnit:
     Bit 0 to bit 14: ID number 1 to ID number 15
     Bit15: Reserved for system
     """
-    output: int = 0
-    for i, sensor in enumerate(self.connected_sensors):
-      output += 2**i * sensor.go_output
-    return output
+    return self._bitmap(lambda sensor: sensor.go_output)
   # ----------------------------------------------------------------------------
 
   def read_019_output_4_alarm(self) -> int:
@@ -638,10 +763,7 @@ class CommunicationUnit:
 
     ** Alarm output for IL sensors
     """
-    output: int = 0
-    for i, sensor in enumerate(self.connected_sensors):
-      output += 2**i * sensor.alarm_output
-    return output
+    return self._bitmap(lambda sensor: sensor.alarm_output)
   # ----------------------------------------------------------------------------
 
   def read_020_output_5(self) -> int:
@@ -664,10 +786,7 @@ class CommunicationUnit:
     Bit 0 to bit 14: ID number 1 to ID number 15
     Bit15: Reserved for system
     """
-    output: int = 0
-    for i, sensor in enumerate(self.connected_sensors):
-      output += 2**i * sensor.value_invalid
-    return output
+    return self._bitmap(lambda sensor: sensor.value_invalid)
   # ----------------------------------------------------------------------------
 
   def read_039_current_value_0_under_range(self) -> int:
@@ -678,10 +797,7 @@ class CommunicationUnit:
     Bit 0 to bit 14: ID number 1 to ID number 15
     Bit15: Reserved for system
     """
-    output: int = 0
-    for i, sensor in enumerate(self.connected_sensors):
-      output += 2**i * sensor.value_under_range
-    return output
+    return self._bitmap(lambda sensor: sensor.value_under_range)
   # ----------------------------------------------------------------------------
 
   def read_040_current_value_0_over_range(self) -> int:
@@ -692,10 +808,7 @@ class CommunicationUnit:
     Bit 0 to bit 14: ID number 1 to ID number 15
     Bit15: Reserved for system
     """
-    output: int = 0
-    for i, sensor in enumerate(self.connected_sensors):
-      output += 2**i * sensor.value_over_range
-    return output
+    return self._bitmap(lambda sensor: sensor.value_over_range)
   # ----------------------------------------------------------------------------
 
   def read_044_to_058_current_value_id_Y(self, id: int) -> int:
@@ -705,9 +818,10 @@ class CommunicationUnit:
     -999999999 to +999999999 (initial value: 0)
     """
     try:
-      return self.connected_sensors[id].judgment_value_for_communication_unit()
+      relevant_sensor = self.connected_sensors[id]
     except IndexError:
-      raise IDOutsideValidRangeError
+      raise ID_OUTSIDE_VALID_RANGE_ERROR
+    return relevant_sensor.judgment_value_for_communication_unit()
   # ----------------------------------------------------------------------------
 
   def read_076_sensor_status_mask_setting(self) -> int:
@@ -734,7 +848,7 @@ class CommunicationUnit:
     1: Mask
     """
     if setting_data != 0 and setting_data != 1:
-      raise WriteDataOutsideValidRangeError
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
     self.mask_sensor_status = bool(setting_data)
   # ----------------------------------------------------------------------------
 
@@ -762,5 +876,5 @@ class CommunicationUnit:
     try:
       return self.connected_sensors[id].internal_error
     except IndexError:
-      raise IDOutsideValidRangeError
+      raise ID_OUTSIDE_VALID_RANGE_ERROR
   # ----------------------------------------------------------------------------
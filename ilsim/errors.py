@@ -3,6 +3,7 @@
 # native imports
 from enum import IntEnum
 from typing import Any
+from typing import Final
 
 
 def raise_NotImplementedError(*args: Any) -> Any:
@@ -188,3 +189,19 @@ class CommandFormatError(CommunicationException):
   The command format is not correct.
   """
   error_code = CommunicationErrorCodes.ERROR_255
+
+
+# Interned singleton instances.
+#
+# These exceptions carry no per-raise state beyond their class-level
+# error_code, so hot protocol paths raise the same instance repeatedly
+# instead of allocating a fresh exception per failed request.
+WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR: Final = WriteDataOutsideValidRangeError()
+NON_EXECUTABLE_STATE_ERROR: Final = NonExecutableStateError()
+QUERY_WRITE_PROTECTED_ERROR: Final = QueryWriteProtectedError()
+QUERY_READ_PROTECTED_ERROR: Final = QueryReadProtectedError()
+QUERY_OUTSIDE_VALID_RANGE_ERROR: Final = QueryOutsideValidRangeError()
+ID_OUTSIDE_VALID_RANGE_ERROR: Final = IDOutsideValidRangeError()
+INACCESSIBLE_ID_OR_QUERY_ERROR: Final = InaccessibleIDOrQueryError()
+GENERAL_SYSTEM_ERROR: Final = GeneralSystemError()
+COMMAND_FORMAT_ERROR: Final = CommandFormatError()
@@ -1,35 +1,83 @@
 
 
 # native imports
+import asyncio
+import atexit
 import time
+from array import array
+from concurrent.futures import Future
 from dataclasses import dataclass
-from dataclasses import field
 from enum import IntEnum
 from enum import IntFlag
 from enum import StrEnum
 from enum import auto
-from functools import partial
-from random import uniform
+from functools import cache
+from random import Random
 from threading import Lock
 from threading import Thread
+from typing import Any
 from typing import Callable
+from typing import ClassVar
 from typing import Final
 from typing import Literal
+from typing import NoReturn
 from typing import Self
 from typing import TypeAlias
+from typing import TypeVar
 
 # internal imports
-from .errors import IDOutsideValidRangeError
-from .errors import InaccessibleIDOrQueryError
-from .errors import NonExecutableStateError
-from .errors import QueryOutsideValidRangeError
-from .errors import QueryReadProtectedError
-from .errors import QueryWriteProtectedError
-from .errors import WriteDataOutsideValidRangeError
+from .errors import ID_OUTSIDE_VALID_RANGE_ERROR
+from .errors import INACCESSIBLE_ID_OR_QUERY_ERROR
+from .errors import NON_EXECUTABLE_STATE_ERROR
+from .errors import QUERY_OUTSIDE_VALID_RANGE_ERROR
+from .errors import QUERY_READ_PROTECTED_ERROR
+from .errors import QUERY_WRITE_PROTECTED_ERROR
+from .errors import WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
 
 
 # Constants
 THREAD_SLEEP_DURATION: Final = 0.01
+
+_EnumT = TypeVar('_EnumT', bound=IntEnum)
+
+
+@cache
+def _cached_member(enum_type: type[_EnumT], value: int) -> _EnumT:
+  """
+  Memoized Enum(value) coercion.
+
+  Enum.__call__ is Python-level machinery on every call; the member
+  sets here are tiny and immutable, so after a few writes every
+  coercion in the SW handlers is a single dict hit.
+  """
+  return enum_type(value)
+
+
+_background_loop: asyncio.AbstractEventLoop | None = None
+_background_loop_lock = Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+  """
+  Return the shared background event loop, starting it lazily.
+
+  All sensors schedule their EEPROM and input tasks on this one loop,
+  so N sensors cost one OS thread instead of 2 * N.
+  """
+  global _background_loop
+  loop = _background_loop
+  if loop is None:
+    with _background_loop_lock:
+      loop = _background_loop
+      if loop is None:
+        loop = asyncio.new_event_loop()
+        Thread(
+          target=loop.run_forever,
+          daemon=True,
+          name='ilsim-background'
+        ).start()
+        _background_loop = loop
+  return loop
 # ------------------------------------------------------------------------------
 
 
@@ -52,6 +100,12 @@ class OutputState(IntEnum):
 # ------------------------------------------------------------------------------
 
 
+# Pre-rendered two-digit MS state fields, keyed by OutputState member;
+# saves re-running the numeric formatter on every state cache rebuild.
+_STATE_STR: Final = {state: f"{state.value:0>2}" for state in OutputState}
+_STATE_BYTES: Final = {state: b"%02d" % state for state in OutputState}
+
+
 class ILError(IntFlag):
     """
     Internal error codes for sensor units.
@@ -74,6 +128,16 @@ class ILError(IntFlag):
     Calculation = 0b0010_0000_0000_0000  # Bit 13
     ERROR_0F = 0b0100_0000_0000_0000  # Bit 14, reserved
     ERROR_10 = 0b1000_0000_0000_0000  # Bit 15, reserved
+
+
+# Plain-int mirrors of the ILError bits touched on hot paths.
+# internal_error is stored as a plain int so the per-sample state checks
+# use C-level int compares/ands instead of IntFlag operator methods,
+# which allocate a new flag instance per operation.
+_ILE_NO_ERROR: Final = int(ILError.NO_ERROR)
+_ILE_OVERCURRENT: Final = int(ILError.Overcurrent)
+_ILE_EEPROM: Final = int(ILError.EEPROM)
+_ILE_SENSOR_HEAD: Final = int(ILError.Sensor_Head)
 # ------------------------------------------------------------------------------
 
 
@@ -107,6 +171,15 @@ class OperationResult(IntEnum):
 # ------------------------------------------------------------------------------
 
 
+# Pre-bound members for the write handlers: every operation command
+# stores a result at least twice, and the module-level binding skips the
+# enum attribute lookup on each store.
+_OPR_OPERATING: Final = OperationResult.OPERATING
+_OPR_NORMAL: Final = OperationResult.NORMAL_TERMINATION
+_OPR_ABNORMAL: Final = OperationResult.ABNORMAL_TERMINATION
+# ------------------------------------------------------------------------------
+
+
 class TransistorMode(IntEnum):
   """
   NPN (0) or PNP (1) mode
@@ -128,6 +201,11 @@ class AnalogOutputMode(IntEnum):
 # ------------------------------------------------------------------------------
 
 
+# Analog range bounds (Volts/Amps) indexed by AnalogOutputMode value.
+_MAX_ANALOG_BY_MODE: Final = (0, 5, 5, 5, 20)
+_MIN_ANALOG_BY_MODE: Final = (0, 0, -5, 1, 4)
+
+
 class SubdisplayScreenMode(IntEnum):
   """
   Contents of the sub display screen
@@ -173,6 +251,11 @@ class SamplingCycle(IntEnum):
 # ------------------------------------------------------------------------------
 
 
+# Sampling rate in milliseconds, indexed by SamplingCycle value; None
+# marks DEFAULT, which resolves to the head-specific default cycle.
+_SAMPLING_RATE_BY_CYCLE: Final = (None, 0.33, 1.0, 2.0, 5.0)
+
+
 class FilterSetting(IntEnum):
   """
   The filter settings used after sampling.
@@ -229,6 +312,13 @@ class AnalogOutputScalingMode(IntEnum):
 # ------------------------------------------------------------------------------
 
 
+# Pre-bound members for the analog-limit properties, which branch on the
+# scaling mode for every analog read; identity compares against these
+# skip the Enum.__eq__ dispatch (same idea as the _ILE_* constants).
+_AOSM_BANK: Final = AnalogOutputScalingMode.BANK
+_AOSM_FREE_RANGE: Final = AnalogOutputScalingMode.FREE_RANGE
+
+
 class ExternalInput1Setting(IntEnum):
   """
   Function assigned to external input 1.
@@ -288,6 +378,11 @@ class DisplayDigit(IntEnum):
 # ------------------------------------------------------------------------------
 
 
+# Display digits indexed by DisplayDigit value; None marks DEFAULT,
+# which resolves to the head-specific default digit count.
+_DISPLAY_DIGITS_BY_SETTING: Final = (None, 3, 2, 1, 0)
+
+
 class DisplayColor(IntEnum):
   """
   Display color of amplifier unit.
@@ -381,6 +476,21 @@ class LEDColor(IntEnum):
 # ------------------------------------------------------------------------------
 
 
+@dataclass(slots=True)
+class _Calc3pState:
+  """
+  Staged "before" samples of one calculated value three-point
+  calibration procedure: SET1 is captured by data number 023, SET2 by
+  data number 024, and both are consumed by data number 025.
+  """
+  set_1_calc: float
+  set_1_rv_main: float
+  set_1_rv_expansion: float
+  set_2_calc: float | None = None
+  set_2_rv_main: float | None = None
+  set_2_rv_expansion: float | None = None
+
+
 def get_scale_values(
   x1: float,
   y1: float,
@@ -413,17 +523,245 @@ def scale_values(
 # ------------------------------------------------------------------------------
 
 
+# Per-model constructor parameters, keyed by sensor head code.
+_SENSOR_HEAD_SPECS: dict[SensorHeadCode, dict[str, Any]] = {
+  SensorHeadCode.IL_S025: {
+    "initial_value": 0.000,
+    "measurement_range_max": 30.000,
+    "measurement_range_min": 20.000,
+    "reference_distance": 25.000,
+    "reference_distance_tolerance": 0.250,
+    "reference_distance_analog_tolerance": 5.000,
+    "decimal_position": 3,
+    "uncertainty": 0.010,
+    "default_analog_upper_limit": 5.000,
+    "default_analog_lower_limit": -5.000,
+    "default_tolerance_setting_range": 0.200,
+    "default_threshold_high": 5.000,
+    "default_threshold_low": -5.000,
+    "default_auto_trigger_level": 1.00,
+    "default_bank_analog_upper_limit": 10.000,
+    "default_bank_analog_lower_limit": -10.000,
+    "default_sampling_cycle": 1.000,
+    "default_display_digit": 2,
+    "connected_sensor_head": SensorHeadCode.IL_S025,
+  },
+  SensorHeadCode.IL_030: {
+    "initial_value": 0.000,
+    "measurement_range_max": 45.000,
+    "measurement_range_min": 20.000,
+    "reference_distance": 30.000,
+    "reference_distance_tolerance": 0.250,
+    "reference_distance_analog_tolerance": 5.000,
+    "decimal_position": 3,
+    "uncertainty": 0.010,
+    "default_analog_upper_limit": 5.000,
+    "default_analog_lower_limit": -5.000,
+    "default_tolerance_setting_range": 0.200,
+    "default_threshold_high": 5.000,
+    "default_threshold_low": -5.000,
+    "default_auto_trigger_level": 1.00,
+    "default_bank_analog_upper_limit": 10.000,
+    "default_bank_analog_lower_limit": -10.000,
+    "default_sampling_cycle": 1.000,
+    "default_display_digit": 2,
+    "connected_sensor_head": SensorHeadCode.IL_030,
+  },
+  SensorHeadCode.IL_065: {
+    "initial_value": 0.000,
+    "measurement_range_max": 105.000,
+    "measurement_range_min": 55.000,
+    "reference_distance": 65.000,
+    "reference_distance_tolerance": 0.500,
+    "reference_distance_analog_tolerance": 10.000,
+    "decimal_position": 3,
+    "uncertainty": 0.020,
+    "default_analog_upper_limit": 10.000,
+    "default_analog_lower_limit": -10.000,
+    "default_tolerance_setting_range": 0.200,
+    "default_threshold_high": 5.000,
+    "default_threshold_low": -5.000,
+    "default_auto_trigger_level": 1.00,
+    "default_bank_analog_upper_limit": 10.000,
+    "default_bank_analog_lower_limit": -10.000,
+    "default_sampling_cycle": 1.000,
+    "default_display_digit": 2,
+    "connected_sensor_head": SensorHeadCode.IL_065,
+  },
+  SensorHeadCode.IL_S065: {
+    "initial_value": 0.000,
+    "measurement_range_max": 75.000,
+    "measurement_range_min": 55.000,
+    "reference_distance": 65.000,
+    "reference_distance_tolerance": 0.500,
+    "reference_distance_analog_tolerance": 10.000,
+    "decimal_position": 3,
+    "uncertainty": 0.020,
+    "default_analog_upper_limit": 10.000,
+    "default_analog_lower_limit": -10.000,
+    "default_tolerance_setting_range": 0.200,
+    "default_threshold_high": 5.000,
+    "default_threshold_low": -5.000,
+    "default_auto_trigger_level": 1.00,
+    "default_bank_analog_upper_limit": 10.000,
+    "default_bank_analog_lower_limit": -10.000,
+    "default_sampling_cycle": 1.000,
+    "default_display_digit": 2,
+    "connected_sensor_head": SensorHeadCode.IL_S065,
+  },
+  SensorHeadCode.IL_100: {
+    "initial_value": 0.000,
+    "measurement_range_max": 130.000,
+    "measurement_range_min": 75.000,
+    "reference_distance": 100.000,
+    "reference_distance_tolerance": 1.000,
+    "reference_distance_analog_tolerance": 20.000,
+    "decimal_position": 3,
+    "uncertainty": 0.040,
+    "default_analog_upper_limit": 20.000,
+    "default_analog_lower_limit": -20.000,
+    "default_tolerance_setting_range": 0.200,
+    "default_threshold_high": 5.000,
+    "default_threshold_low": -5.000,
+    "default_auto_trigger_level": 1.00,
+    "default_bank_analog_upper_limit": 10.000,
+    "default_bank_analog_lower_limit": -10.000,
+    "default_sampling_cycle": 1.000,
+    "default_display_digit": 2,
+    "connected_sensor_head": SensorHeadCode.IL_100,
+  },
+  SensorHeadCode.IL_300: {
+    "initial_value": 0.00,
+    "measurement_range_max": 450.00,
+    "measurement_range_min": 160.00,
+    "reference_distance": 300.00,
+    "reference_distance_tolerance": 7.00,
+    "reference_distance_analog_tolerance": 140.00,
+    "decimal_position": 2,
+    "uncertainty": 0.30,
+    "default_analog_upper_limit": 140.00,
+    "default_analog_lower_limit": -140.00,
+    "default_tolerance_setting_range": 2.00,
+    "default_threshold_high": 50.00,
+    "default_threshold_low": -50.00,
+    "default_auto_trigger_level": 10.00,
+    "default_bank_analog_upper_limit": 100.00,
+    "default_bank_analog_lower_limit": -100.00,
+    "default_sampling_cycle": 2.000,
+    "default_display_digit": 1,
+    "connected_sensor_head": SensorHeadCode.IL_300,
+  },
+  SensorHeadCode.IL_600: {
+    "initial_value": 0.00,
+    "measurement_range_max": 1000.00,
+    "measurement_range_min": 200.00,
+    "reference_distance": 600.00,
+    "reference_distance_tolerance": 20.00,
+    "reference_distance_analog_tolerance": 400.00,
+    "decimal_position": 2,
+    "uncertainty": 0.50,
+    "default_analog_upper_limit": 400.00,
+    "default_analog_lower_limit": -400.00,
+    "default_tolerance_setting_range": 2.00,
+    "default_threshold_high": 50.00,
+    "default_threshold_low": -50.00,
+    "default_auto_trigger_level": 10.00,
+    "default_bank_analog_upper_limit": 100.00,
+    "default_bank_analog_lower_limit": -100.00,
+    "default_sampling_cycle": 2.000,
+    "default_display_digit": 1,
+    "connected_sensor_head": SensorHeadCode.IL_600,
+  },
+  SensorHeadCode.IL_2000: {
+    "initial_value": 0.0,
+    "measurement_range_max": 3500.0,
+    "measurement_range_min": 1000.0,
+    "reference_distance": 2000.0,
+    "reference_distance_tolerance": 50.0,
+    "reference_distance_analog_tolerance": 1000.0,
+    "decimal_position": 1,
+    "uncertainty": 1.0,
+    "default_analog_upper_limit": 1000.0,
+    "default_analog_lower_limit": -1000.0,
+    "default_tolerance_setting_range": 20.0,
+    "default_threshold_high": 500.0,
+    "default_threshold_low": -500.0,
+    "default_auto_trigger_level": 100.0,
+    "default_bank_analog_upper_limit": 1000.0,
+    "default_bank_analog_lower_limit": -1000.0,
+    "default_sampling_cycle": 5.000,
+    "default_display_digit": 0,
+    "connected_sensor_head": SensorHeadCode.IL_2000,
+  },
+}
+# ------------------------------------------------------------------------------
+
+
 # Bank data
-@dataclass
+# Column layout of the packed bank storage (see SensorUnit._bank_data).
+_BANK_FIELD_COUNT: Final = 5
+_THRESHOLD_HIGH: Final = 0
+_THRESHOLD_LOW: Final = 1
+_SHIFT_TARGET: Final = 2
+_ANALOG_UPPER_LIMIT: Final = 3
+_ANALOG_LOWER_LIMIT: Final = 4
+
+
 class Bank:
   """
   Stores banked values.
+
+  The four banks of a sensor share one contiguous array of C doubles
+  (4 rows x 5 columns) instead of four objects holding boxed floats;
+  each Bank is a thin view that indexes its row, so the attribute API
+  is unchanged while the storage stays compact and bulk resets become
+  a single slice assignment.
   """
-  threshold_high: float = field(default=5)
-  threshold_low: float = field(default=-5)
-  shift_target: float = field(default=0)
-  analog_upper_limit: float = field(default=10)
-  analog_lower_limit: float = field(default=-10)
+  __slots__ = ('_data', '_base')
+
+  def __init__(self, data: 'array[float]', index: int) -> None:
+    self._data = data
+    self._base = index * _BANK_FIELD_COUNT
+
+  @property
+  def threshold_high(self) -> float:
+    return self._data[self._base + _THRESHOLD_HIGH]
+
+  @threshold_high.setter
+  def threshold_high(self, value: float) -> None:
+    self._data[self._base + _THRESHOLD_HIGH] = value
+
+  @property
+  def threshold_low(self) -> float:
+    return self._data[self._base + _THRESHOLD_LOW]
+
+  @threshold_low.setter
+  def threshold_low(self, value: float) -> None:
+    self._data[self._base + _THRESHOLD_LOW] = value
+
+  @property
+  def shift_target(self) -> float:
+    return self._data[self._base + _SHIFT_TARGET]
+
+  @shift_target.setter
+  def shift_target(self, value: float) -> None:
+    self._data[self._base + _SHIFT_TARGET] = value
+
+  @property
+  def analog_upper_limit(self) -> float:
+    return self._data[self._base + _ANALOG_UPPER_LIMIT]
+
+  @analog_upper_limit.setter
+  def analog_upper_limit(self, value: float) -> None:
+    self._data[self._base + _ANALOG_UPPER_LIMIT] = value
+
+  @property
+  def analog_lower_limit(self) -> float:
+    return self._data[self._base + _ANALOG_LOWER_LIMIT]
+
+  @analog_lower_limit.setter
+  def analog_lower_limit(self, value: float) -> None:
+    self._data[self._base + _ANALOG_LOWER_LIMIT] = value
 # ------------------------------------------------------------------------------
 
 
@@ -433,6 +771,9 @@ class SensorUnit:
   Simulates sensor head + amplifier unit
   """
   # ----------------------------------------------------------------------------
+  # Slot order is layout order: the sampling-loop fields are annotated
+  # first (together with the calibration coefficients applied to every
+  # sample) so their slot pointers sit adjacent in each instance.
   _error_during_sampling: bool
   _raw_value: float | None
   _r_v_value: float | None
@@ -441,51 +782,62 @@ class SensorUnit:
   _hold_value: float | None
   _hold_bottom: float | None
   _hold_peak: float | None
+  calibration_tilt: float
+  calibration_offset: float
+  calculation_tilt: float
+  calculation_offset: float
   _two_point_high_side_1st_point: float | None
   _two_point_low_side_1st_point: float | None
   _two_point_diff_count_1st_point: float | None
   _calc_2p_calibration_set_1_before_calc: float | None
-  _calc_3p_calibration_set_1_before_calc: float | None
-  _calc_3p_calibration_set_1_before_rv_main: float | None
-  _calc_3p_calibration_set_1_before_rv_expansion: float | None
-  _calc_3p_calibration_set_2_before_calc: float | None
-  _calc_3p_calibration_set_2_before_rv_main: float | None
-  _calc_3p_calibration_set_2_before_rv_expansion: float | None
+  _calc_3p_state: _Calc3pState | None
   _calibration_set_1_before: float | None
-  _eeprom_thread: Thread
-  _eeprom_lock: Lock
-  _input_thread: Thread
+  _analog_scale_cache: tuple[float, float, float, float, float, float] | None
+  _stringified_state_cache: bytes | None
+  _stringified_value_cache: bytes | None
+  _stringified_pair_cache: bytes | None
+  _loop: asyncio.AbstractEventLoop
+  _eeprom_future: Future[None]
+  _eeprom_event: asyncio.Event
+  _eeprom_dirty: bool
+  _eeprom_deadline_hint: float
+  _input_future: Future[None]
+  _input_event: asyncio.Event
   _keep_threads_alive: bool
-  _next_eeprom_write: float | None
   _timing_input: bool
   abnormal_settings: bool
-  active_bank_setting: BANK_INDEX
+  _active_bank_setting: BANK_INDEX
+  _active_bank: Bank
   alarm_count: int
   alarm_setting: AlarmSetting
-  analog_output_mode: AnalogOutputMode
+  _analog_output_mode: AnalogOutputMode
+  _analog_read_scale: int
   analog_output_scaling_mode: AnalogOutputScalingMode
   auto_trigger_level: float
   banks: tuple[Bank, Bank, Bank, Bank]
+  _bank_data: 'array[float]'
   calc_2p_calibration_set_1: float
   calc_2p_calibration_set_2: float
   calc_3p_calibration_set_1: float
   calc_3p_calibration_set_3: float
   calc_calibration_mode: CalculationCalibrationMode
-  calculation_mode: CalculationMode
-  calculation_tilt: float
-  calculation_offset: float
+  _calculation_mode: CalculationMode
+  _calc_fn: Callable[[], float | None]
   calibration_result: OperationResult
-  calibration_tilt: float
-  calibration_offset: float
   calibration_set_1: float
   calibration_set_2: float
   calibration_set_1_real: float
   calibration_set_2_real: float
   calibration_use_user_settings: bool
-  connected_sensor_head: SensorHeadCode
-  connected_amplifier: Self | None
+  _connected_sensor_head: SensorHeadCode
+  _connected_sensor_head_int: int
+  _connected_amplifier: Self | None
+  _calc_subscribers: list[Callable[[], None]]
+  _error_subscribers: list[Callable[[], None]]
   currently_sampling: bool
-  decimal_position: int
+  _decimal_position: int
+  _mm_scale: float
+  _int_scale: float
   default_analog_lower_limit: float
   default_analog_upper_limit: float
   default_auto_trigger_level: float
@@ -502,39 +854,58 @@ class SensorUnit:
   default_display_digit: int
   display_digit_setting: DisplayDigit
   eeprom_write_result: OperationResult
-  external_input_1: bool
-  external_input_1_setting: ExternalInput1Setting
-  external_input_2: bool
-  external_input_2_setting: ExternalInput2Setting
-  external_input_3: bool
-  external_input_3_setting: ExternalInput3Setting
-  external_input_4: bool
-  external_input_4_setting: ExternalInput4Setting
-  external_input_use_user_settings: bool
+  _external_input_1: bool
+  _external_input_1_setting: ExternalInput1Setting
+  _external_input_2: bool
+  _external_input_2_setting: ExternalInput2Setting
+  _external_input_3: bool
+  _external_input_3_setting: ExternalInput3Setting
+  _external_input_4: bool
+  _external_input_4_setting: ExternalInput4Setting
+  _ext_stop_active: bool
+  _timing_source_is_ext3: bool
+  _external_input_use_user_settings: bool
   filter_setting: FilterSetting
-  free_analog_lower_limit: float
-  free_analog_upper_limit: float
+  _free_analog_lower_limit: float
+  _free_analog_lower_limit_raw: int
+  _free_analog_upper_limit: float
+  _free_analog_upper_limit_raw: int
   future_analog_output_mode: AnalogOutputMode
   future_transistor_mode: TransistorMode
   head_display_mode: HeadDisplayMode
   high_pass_cutoff_frequency: HighPassCutoffFrequency
-  hold_function_setting: HoldFunctionSetting
-  hysteresis: float
-  internal_error: ILError
-  is_main_unit: bool
+  _hold_function_setting: HoldFunctionSetting
+  _hold_fn: Callable[['SensorUnit'], None]
+  _hysteresis: float
+  _hysteresis_raw: int
+  _internal_error: int
+  _err_overcurrent: bool
+  _err_blocking: bool
+  _err_any: bool
+  _error_code: int
+  _is_main_unit: bool
+  _product_code: int
+  _product_name: str
   key_locked: bool
   lower_bound: float
-  measurement_range_max: float
-  measurement_range_min: float
+  _measurement_range_max: float
+  _measurement_range_min: float
   mutual_interference_prevention_active: bool
-  output_mode_normally_closed: bool
+  _output_mode_normally_closed: bool
   power_saving_mode: PowerSavingMode
   randomized: bool
-  randomized_upper_limit: float
-  randomized_lower_limit: float
-  reference_distance: float
-  reference_distance_analog_tolerance: float
-  reference_distance_tolerance: float
+  _randomized_upper_limit: float
+  _randomized_lower_limit: float
+  _rand_lo: float
+  _rand_span: float
+  _rng: Random
+  _reference_distance: float
+  _reference_distance_analog_tolerance: float
+  _reference_distance_tolerance: float
+  _ref_lo: float
+  _ref_hi: float
+  _ref_analog_lo: float
+  _ref_analog_hi: float
   reset_request_result: OperationResult
   reversed_measurement_direction: bool
   revision: int
@@ -555,8 +926,19 @@ class SensorUnit:
   zero_shift_saved_in_memory: bool
   zero_shifting_result: OperationResult
   # ----------------------------------------------------------------------------
-  read_mapping: dict[int, Callable[[], int | str]]
-  write_mapping: dict[int, Callable[[int], None]]
+  # Flat dispatch tables indexed by data number (None = no handler), so
+  # SR/SW dispatch is a single C-level list index.
+  # ----------------------------------------------------------------------------
+  # Every instance attribute is annotated above, so slot them all: no
+  # per-instance __dict__ hash table, C-level descriptor access and
+  # roughly half the memory per simulated sensor.
+  __slots__ = tuple(__annotations__)
+
+  # Dispatch tables are built once per class by init_mappings and shared
+  # by every instance, so they live outside __slots__ (annotated after
+  # the slot tuple is formed).
+  _read_table: ClassVar[list[Callable[['SensorUnit'], int | str] | None]]
+  _write_table: ClassVar[list[Callable[['SensorUnit', int], None] | None]]
   # ----------------------------------------------------------------------------
 
   def __init__(
@@ -590,16 +972,11 @@ class SensorUnit:
     self.init_mappings()
 
     self._keep_threads_alive = True
-    self._next_eeprom_write = None
-    self._eeprom_thread = Thread(
-      target=self.perform_eeprom_writes,
-      daemon=True
-    )
-    self._input_thread = Thread(
-      target=self.perform_input_updates,
-      daemon=True
-    )
-    self._eeprom_lock = Lock()
+    self._loop = _get_background_loop()
+    self._eeprom_dirty = False
+    self._eeprom_deadline_hint = 0.0
+    self._eeprom_event = asyncio.Event()
+    self._input_event = asyncio.Event()
 
     self.calibration_tilt = 1.0
     self.calibration_offset = 0.0
@@ -638,28 +1015,37 @@ class SensorUnit:
     self.calibration_use_user_settings = False
 
     self.randomized = False
-    self.randomized_upper_limit = (
-      self.reference_distance - self.measurement_range_min
-    )
-    self.randomized_lower_limit = (
-      self.reference_distance - self.measurement_range_max
-    )
+    # Dedicated generator: avoids contention on the shared module-level
+    # random state when many sensors randomize concurrently.
+    self._rng = Random()
     self.is_main_unit = True
+    self._calc_subscribers = []
+    self._error_subscribers = []
     self.connected_amplifier = None
     self._timing_input = False
     self.abnormal_settings = False
     self.currently_sampling = True
-    self.eeprom_write_result = OperationResult.NORMAL_TERMINATION
-    self.tuning_result = OperationResult.NORMAL_TERMINATION
-    self.zero_shifting_result = OperationResult.NORMAL_TERMINATION
-    self.reset_request_result = OperationResult.NORMAL_TERMINATION
-    self.calibration_result = OperationResult.NORMAL_TERMINATION
-    self.internal_error = ILError.NO_ERROR
+    self.eeprom_write_result = _OPR_NORMAL
+    self.tuning_result = _OPR_NORMAL
+    self.zero_shifting_result = _OPR_NORMAL
+    self.reset_request_result = _OPR_NORMAL
+    self.calibration_result = _OPR_NORMAL
+    self.internal_error = _ILE_NO_ERROR
     self.device_type = 0
     self.revision = 0x0101
     self.series_version = 1
 
     self._error_during_sampling = False
+    self._analog_scale_cache = None
+    self._stringified_state_cache = None
+    self._stringified_value_cache = None
+    self._stringified_pair_cache = None
+    # Seed the sample slots so the unchanged-value guards in
+    # _recompute_from_raw can compare against them on the first sample.
+    self._raw_value = None
+    self._r_v_value = None
+    self._calc_value = None
+    self._p_v_value = None
 
     self.restore_default_settings()
 
@@ -668,186 +1054,202 @@ class SensorUnit:
     self.set_system_parameters()
 
     self.raw_value = initial_value
-    self._eeprom_thread.start()
-    self._input_thread.start()
-  # ----------------------------------------------------------------------------
-
-  def init_mappings(self) -> None:
-    """
-    Create the function mappings for SR and SW commands.
-    """
-    self.read_mapping = {
-      33: self.read_033_sensor_amplifier_error,
-      36: self.read_036_judgment_alarm_output,
-      37: self.read_037_judgment_value,
-      38: self.read_038_internal_measurement_value,
-      39: self.read_039_peak_hold_value_during_hold_period,
-      40: self.read_040_bottom_hold_value_during_hold_period,
-      41: self.read_041_calculation_value,
-      42: self.read_042_analog_output_value,
-      43: self.read_043_bank_status,
-      44: self.read_044_timing_status,
-      50: self.read_050_laser_emission_stop_status,
-      51: self.read_051_abnormal_setting,
-      52: self.read_052_external_input_status,
-      53: self.read_053_eeprom_write_result,
-      54: self.read_054_zero_shift_zero_shift_reset_result,
-      55: self.read_055_reset_request_result,
-      56: self.read_056_current_system_parameters,
-      60: self.read_060_tuning_result,
-      61: self.read_061_calibraiton_result,
-      97: self.read_097_key_lock_function,
-      98: self.read_098_bank_function,
-      99: self.read_099_timing_input,
-      100: self.read_100_laser_emission_on_stop_input,
-      104: self.read_104_sub_display_screen,
-      105: self.read_105_system_parameter_settings,
-      106: self.read_106_tolerance_tuning_setting_range,
-      107: self.read_107_calibration_function,
-      108: self.read_108_calibration_function_set_1,
-      109: self.read_109_calibration_function_set_2,
-      110: self.read_110_calculated_value_calibration_function,
-      111: self.read_111_calculated_value_two_point_set_1,
-      112: self.read_112_calculated_value_two_point_set_2,
-      113: self.read_113_calculated_value_three_point_set_1,
-      114: self.read_114_calculated_value_three_point_set_3,
-      129: self.read_129_calculation_function,
-      131: self.read_131_measurement_direction,
-      132: self.read_132_sampling_cycle,
-      133: self.read_133_averaging_diff_count_high_pass_filter,
-      134: self.read_134_output_mode,
-      136: self.read_136_hold_function_setting,
-      137: self.read_137_auto_hold_trigger_level,
-      138: self.read_138_timing_input_setting,
-      139: self.read_139_delay_timer,
-      140: self.read_140_timer_duration,
-      141: self.read_141_hyseresis,
-      142: self.read_142_analog_output_scaling,
-      143: self.read_143_analog_output_upper_limit_value,
-      144: self.read_144_analog_output_lower_limit_value,
-      145: self.read_145_external_input,
-      146: self.read_146_external_input_1,
-      147: self.read_147_external_input_2,
-      148: self.read_148_external_input_3,
-      149: self.read_149_external_input_4,
-      150: self.read_150_bank_switching_method,
-      152: self.read_152_zero_shift_value_memory_function,
-      153: self.read_153_mutual_interference_prevention_function,
-      154: self.read_154_display_digit,
-      155: self.read_155_power_saving_function,
-      156: self.read_156_head_display_mode,
-      157: self.read_157_display_color,
-      158: self.read_158_timer_duration_diff_count_filter,
-      159: self.read_159_cutoff_frequency_high_pass_filter,
-      161: self.read_161_alarm_setting,
-      162: self.read_162_alarm_count,
-      193: self.read_193_product_code,
-      194: self.read_194_revision,
-      195: self.read_195_connected_sensor_head,
-      200: self.read_200_product_name,
-      215: self.read_215_series_code,
-      216: self.read_216_series_version,
-      217: self.read_217_device_type,
+    # Both tasks run on the shared background loop; this sensor adds no
+    # OS threads of its own.
+    self._eeprom_future = asyncio.run_coroutine_threadsafe(
+      self.perform_eeprom_writes(), self._loop
+    )
+    self._input_future = asyncio.run_coroutine_threadsafe(
+      self.perform_input_updates(), self._loop
+    )
+    # Clean shutdown even if the owner never calls stop_threads: atexit
+    # callbacks run while the daemonic loop thread is still alive, so
+    # the tasks are signalled and awaited instead of being killed
+    # mid-EEPROM-write.
+    atexit.register(self.stop_threads)
+  # ----------------------------------------------------------------------------
+
+  @classmethod
+  def init_mappings(cls) -> None:
+    """
+    Create the dispatch tables for SR and SW commands.
+
+    Handlers live in flat lists indexed by data number; the hot-path
+    lookup is a plain list index instead of a dict hash plus, for the
+    bank family, a partial() trampoline.
+
+    The tables hold plain (unbound) functions shared class-wide; they
+    are built once on the class at first instantiation instead of being
+    rebuilt for every instance.
+    """
+    if '_read_table' in cls.__dict__:
+      return
+    read_mapping: dict[int, Callable[['SensorUnit'], int | str]] = {
+      33: cls.read_033_sensor_amplifier_error,
+      36: cls.read_036_judgment_alarm_output,
+      37: cls.read_037_judgment_value,
+      38: cls.read_038_internal_measurement_value,
+      39: cls.read_039_peak_hold_value_during_hold_period,
+      40: cls.read_040_bottom_hold_value_during_hold_period,
+      41: cls.read_041_calculation_value,
+      42: cls.read_042_analog_output_value,
+      43: cls.read_043_bank_status,
+      44: cls.read_044_timing_status,
+      50: cls.read_050_laser_emission_stop_status,
+      51: cls.read_051_abnormal_setting,
+      52: cls.read_052_external_input_status,
+      53: cls.read_053_eeprom_write_result,
+      54: cls.read_054_zero_shift_zero_shift_reset_result,
+      55: cls.read_055_reset_request_result,
+      56: cls.read_056_current_system_parameters,
+      60: cls.read_060_tuning_result,
+      61: cls.read_061_calibraiton_result,
+      97: cls.read_097_key_lock_function,
+      98: cls.read_098_bank_function,
+      99: cls.read_099_timing_input,
+      100: cls.read_100_laser_emission_on_stop_input,
+      104: cls.read_104_sub_display_screen,
+      105: cls.read_105_system_parameter_settings,
+      106: cls.read_106_tolerance_tuning_setting_range,
+      107: cls.read_107_calibration_function,
+      108: cls.read_108_calibration_function_set_1,
+      109: cls.read_109_calibration_function_set_2,
+      110: cls.read_110_calculated_value_calibration_function,
+      111: cls.read_111_calculated_value_two_point_set_1,
+      112: cls.read_112_calculated_value_two_point_set_2,
+      113: cls.read_113_calculated_value_three_point_set_1,
+      114: cls.read_114_calculated_value_three_point_set_3,
+      129: cls.read_129_calculation_function,
+      131: cls.read_131_measurement_direction,
+      132: cls.read_132_sampling_cycle,
+      133: cls.read_133_averaging_diff_count_high_pass_filter,
+      134: cls.read_134_output_mode,
+      136: cls.read_136_hold_function_setting,
+      137: cls.read_137_auto_hold_trigger_level,
+      138: cls.read_138_timing_input_setting,
+      139: cls.read_139_delay_timer,
+      140: cls.read_140_timer_duration,
+      141: cls.read_141_hyseresis,
+      142: cls.read_142_analog_output_scaling,
+      143: cls.read_143_analog_output_upper_limit_value,
+      144: cls.read_144_analog_output_lower_limit_value,
+      145: cls.read_145_external_input,
+      146: cls.read_146_external_input_1,
+      147: cls.read_147_external_input_2,
+      148: cls.read_148_external_input_3,
+      149: cls.read_149_external_input_4,
+      150: cls.read_150_bank_switching_method,
+      152: cls.read_152_zero_shift_value_memory_function,
+      153: cls.read_153_mutual_interference_prevention_function,
+      154: cls.read_154_display_digit,
+      155: cls.read_155_power_saving_function,
+      156: cls.read_156_head_display_mode,
+      157: cls.read_157_display_color,
+      158: cls.read_158_timer_duration_diff_count_filter,
+      159: cls.read_159_cutoff_frequency_high_pass_filter,
+      161: cls.read_161_alarm_setting,
+      162: cls.read_162_alarm_count,
+      193: cls.read_193_product_code,
+      194: cls.read_194_revision,
+      195: cls.read_195_connected_sensor_head,
+      200: cls.read_200_product_name,
+      215: cls.read_215_series_code,
+      216: cls.read_216_series_version,
+      217: cls.read_217_device_type,
     }
-    self.write_mapping = {
-      1: self.write_001_zero_shift_execution_request,
-      2: self.write_002_zero_shift_reset_request,
-      3: self.write_003_reset_request,
-      5: self.write_005_initial_reset_request,
-      6: self.write_006_system_parameters_set_request,
-      14: self.write_014_tolerance_tuning_request,
-      15: self.write_015_2point_high_1st_point_request,
-      16: self.write_016_2point_high_2nd_point_request,
-      17: self.write_017_2point_low_1st_point_request,
-      18: self.write_018_2point_low_2nd_point_request,
-      19: self.write_019_calibration_set_1_request,
-      20: self.write_020_calibration_set_2_request,
-      21: self.write_021_calc_2point_calibration_set_1_request,
-      22: self.write_022_calc_2point_calibration_set_2_request,
-      23: self.write_023_calc_3point_calibration_set_1_request,
-      24: self.write_024_calc_3point_calibration_set_2_request,
-      25: self.write_025_calc_3point_calibration_set_3_request,
-      26: self.write_026_diff_count_filter_1point_tuning_request,
-      27: self.write_027_diff_count_filter_2point_1st_point_request,
-      28: self.write_028_diff_count_filter_2point_2nd_point_request,
-      97: self.write_097_key_lock_function,
-      98: self.write_098_bank_function,
-      99: self.write_099_timing_input,
-      100: self.write_100_laser_emission_on_stop_input,
-      104: self.write_104_sub_display_screen,
-      105: self.write_105_system_parameter_settings,
-      106: self.write_106_tolerance_tuning_setting_range,
-      107: self.write_107_calibration_function,
-      108: self.write_108_calibration_function_set_1,
-      109: self.write_109_calibration_function_set_2,
-      110: self.write_110_calculated_value_calibration_function,
-      111: self.write_111_calculated_value_two_point_set_1,
-      112: self.write_112_calculated_value_two_point_set_2,
-      113: self.write_113_calculated_value_three_point_set_1,
-      114: self.write_114_calculated_value_three_point_set_3,
-      129: self.write_129_calculation_function,
-      131: self.write_131_measurement_direction,
-      132: self.write_132_sampling_cycle,
-      133: self.write_133_averaging_diff_count_high_pass_filter,
-      134: self.write_134_output_mode,
-      136: self.write_136_hold_function_setting,
-      137: self.write_137_auto_hold_trigger_level,
-      138: self.write_138_timing_input_setting,
-      139: self.write_139_delay_timer,
-      140: self.write_140_timer_duration,
-      141: self.write_141_hyseresis,
-      142: self.write_142_analog_output_scaling,
-      143: self.write_143_analog_output_upper_limit_value,
-      144: self.write_144_analog_output_lower_limit_value,
-      145: self.write_145_external_input,
-      146: self.write_146_external_input_1,
-      147: self.write_147_external_input_2,
-      148: self.write_148_external_input_3,
-      149: self.write_149_external_input_4,
-      150: self.write_150_bank_switching_method,
-      152: self.write_152_zero_shift_value_memory_function,
-      153: self.write_153_mutual_interference_prevention_function,
-      154: self.write_154_display_digit,
-      155: self.write_155_power_saving_function,
-      156: self.write_156_head_display_mode,
-      157: self.write_157_display_color,
-      158: self.write_158_timer_duration_diff_count_filter,
-      159: self.write_159_cutoff_frequency_high_pass_filter,
-      161: self.write_161_alarm_setting,
-      162: self.write_162_alarm_count,
+    write_mapping: dict[int, Callable[['SensorUnit', int], None]] = {
+      1: cls.write_001_zero_shift_execution_request,
+      2: cls.write_002_zero_shift_reset_request,
+      3: cls.write_003_reset_request,
+      5: cls.write_005_initial_reset_request,
+      6: cls.write_006_system_parameters_set_request,
+      14: cls.write_014_tolerance_tuning_request,
+      15: cls.write_015_2point_high_1st_point_request,
+      16: cls.write_016_2point_high_2nd_point_request,
+      17: cls.write_017_2point_low_1st_point_request,
+      18: cls.write_018_2point_low_2nd_point_request,
+      19: cls.write_019_calibration_set_1_request,
+      20: cls.write_020_calibration_set_2_request,
+      21: cls.write_021_calc_2point_calibration_set_1_request,
+      22: cls.write_022_calc_2point_calibration_set_2_request,
+      23: cls.write_023_calc_3point_calibration_set_1_request,
+      24: cls.write_024_calc_3point_calibration_set_2_request,
+      25: cls.write_025_calc_3point_calibration_set_3_request,
+      26: cls.write_026_diff_count_filter_1point_tuning_request,
+      27: cls.write_027_diff_count_filter_2point_1st_point_request,
+      28: cls.write_028_diff_count_filter_2point_2nd_point_request,
+      97: cls.write_097_key_lock_function,
+      98: cls.write_098_bank_function,
+      99: cls.write_099_timing_input,
+      100: cls.write_100_laser_emission_on_stop_input,
+      104: cls.write_104_sub_display_screen,
+      105: cls.write_105_system_parameter_settings,
+      106: cls.write_106_tolerance_tuning_setting_range,
+      107: cls.write_107_calibration_function,
+      108: cls.write_108_calibration_function_set_1,
+      109: cls.write_109_calibration_function_set_2,
+      110: cls.write_110_calculated_value_calibration_function,
+      111: cls.write_111_calculated_value_two_point_set_1,
+      112: cls.write_112_calculated_value_two_point_set_2,
+      113: cls.write_113_calculated_value_three_point_set_1,
+      114: cls.write_114_calculated_value_three_point_set_3,
+      129: cls.write_129_calculation_function,
+      131: cls.write_131_measurement_direction,
+      132: cls.write_132_sampling_cycle,
+      133: cls.write_133_averaging_diff_count_high_pass_filter,
+      134: cls.write_134_output_mode,
+      136: cls.write_136_hold_function_setting,
+      137: cls.write_137_auto_hold_trigger_level,
+      138: cls.write_138_timing_input_setting,
+      139: cls.write_139_delay_timer,
+      140: cls.write_140_timer_duration,
+      141: cls.write_141_hyseresis,
+      142: cls.write_142_analog_output_scaling,
+      143: cls.write_143_analog_output_upper_limit_value,
+      144: cls.write_144_analog_output_lower_limit_value,
+      145: cls.write_145_external_input,
+      146: cls.write_146_external_input_1,
+      147: cls.write_147_external_input_2,
+      148: cls.write_148_external_input_3,
+      149: cls.write_149_external_input_4,
+      150: cls.write_150_bank_switching_method,
+      152: cls.write_152_zero_shift_value_memory_function,
+      153: cls.write_153_mutual_interference_prevention_function,
+      154: cls.write_154_display_digit,
+      155: cls.write_155_power_saving_function,
+      156: cls.write_156_head_display_mode,
+      157: cls.write_157_display_color,
+      158: cls.write_158_timer_duration_diff_count_filter,
+      159: cls.write_159_cutoff_frequency_high_pass_filter,
+      161: cls.write_161_alarm_setting,
+      162: cls.write_162_alarm_count,
     }
-    for i in (0, 1, 2, 3):
-      self.read_mapping[65 + 5 * i + 0] = partial(
-        self.read_06X_high_setting_value_bank_Y, i
-      )
-      self.read_mapping[65 + 5 * i + 1] = partial(
-        self.read_06X_low_setting_value_bank_Y, i
-      )
-      self.read_mapping[65 + 5 * i + 2] = partial(
-        self.read_06X_shift_target_value_bank_Y, i
-      )
-      self.read_mapping[65 + 5 * i + 3] = partial(
-        self.read_06X_analog_output_upper_limit_bank_Y, i
-      )
-      self.read_mapping[65 + 5 * i + 4] = partial(
-        self.read_06X_analog_output_lower_limit_bank_Y, i
-      )
+    # Bank family 65..84: generate one named, zero-index-argument handler
+    # per (operation, bank) pair with the bank index baked in as a
+    # constant. This replaces closures that carried the index as a
+    # default argument, and the generated names show up in profiles.
+    namespace: dict[str, Callable[..., Any]] = {}
+    for offset, stem in enumerate((
+      'high_setting_value',
+      'low_setting_value',
+      'shift_target_value',
+      'analog_output_upper_limit',
+      'analog_output_lower_limit',
+    )):
+      for i in (0, 1, 2, 3):
+        query = 65 + 5 * i + offset
+        exec(
+          f"def read_{query:03d}(self):\n"
+          f"  return self.read_06X_{stem}_bank_Y({i})\n"
+          f"def write_{query:03d}(self, setting_data):\n"
+          f"  return self.write_06X_{stem}_bank_Y({i}, setting_data)\n",
+          namespace
+        )
+        read_mapping[query] = namespace[f'read_{query:03d}']
+        write_mapping[query] = namespace[f'write_{query:03d}']
 
-      self.write_mapping[65 + 5 * i + 0] = partial(
-        self.write_06X_high_setting_value_bank_Y, i
-      )
-      self.write_mapping[65 + 5 * i + 1] = partial(
-        self.write_06X_low_setting_value_bank_Y, i
-      )
-      self.write_mapping[65 + 5 * i + 2] = partial(
-        self.write_06X_shift_target_value_bank_Y, i
-      )
-      self.write_mapping[65 + 5 * i + 3] = partial(
-        self.write_06X_analog_output_upper_limit_bank_Y, i
-      )
-      self.write_mapping[65 + 5 * i + 4] = partial(
-        self.write_06X_analog_output_lower_limit_bank_Y, i
-      )
+    cls._read_table = [read_mapping.get(q) for q in range(224)]
+    cls._write_table = [write_mapping.get(q) for q in range(224)]
   # ----------------------------------------------------------------------------
 
   def restore_default_settings(self) -> None:
@@ -858,21 +1260,20 @@ class SensorUnit:
     self._hold_bottom = None
     self._hold_peak = None
 
-    def create_bank() -> Bank:
-      return Bank(
-        threshold_high=self.default_threshold_high,
-        threshold_low=self.default_threshold_low,
-        shift_target=self.default_shift_target,
-        analog_upper_limit=self.default_bank_analog_upper_limit,
-        analog_lower_limit=self.default_bank_analog_lower_limit,
-      )
-
-    self.banks = (
-      create_bank(),
-      create_bank(),
-      create_bank(),
-      create_bank(),
-    )  # Create 4 banks with default values
+    # The 4 banks are created once and reused across resets; only their
+    # packed backing store is restored, in one slice assignment.
+    try:
+      data = self._bank_data
+    except AttributeError:
+      data = self._bank_data = array('d', bytes(8 * 4 * _BANK_FIELD_COUNT))
+      self.banks = (Bank(data, 0), Bank(data, 1), Bank(data, 2), Bank(data, 3))
+    data[:] = array('d', (
+      self.default_threshold_high,
+      self.default_threshold_low,
+      self.default_shift_target,
+      self.default_bank_analog_upper_limit,
+      self.default_bank_analog_lower_limit,
+    ) * 4)
 
     self.active_bank_setting = 0
 
@@ -887,12 +1288,7 @@ class SensorUnit:
     self._two_point_diff_count_1st_point = None
     self._calibration_set_1_before = None
     self._calc_2p_calibration_set_1_before_calc = None
-    self._calc_3p_calibration_set_1_before_calc = None
-    self._calc_3p_calibration_set_1_before_rv_main = None
-    self._calc_3p_calibration_set_1_before_rv_expansion = None
-    self._calc_3p_calibration_set_2_before_calc = None
-    self._calc_3p_calibration_set_2_before_rv_main = None
-    self._calc_3p_calibration_set_2_before_rv_expansion = None
+    self._calc_3p_state = None
 
     self.alarm_count = 7
     self.alarm_setting = AlarmSetting.INITIAL
@@ -930,7 +1326,6 @@ class SensorUnit:
     self.sampling_cycle = SamplingCycle.DEFAULT
     self.stored_timing_input = False
     self.subdisplay_screen_mode = SubdisplayScreenMode.RAW_VALUE
-    self.subdisplay_screen_mode = SubdisplayScreenMode.RAW_VALUE
     self.switch_banks_via_external_input = False
     self.timer_duration = 60  # ms
     self.timing_input_on_edge = False
@@ -968,32 +1363,57 @@ class SensorUnit:
     # TODO: Implement real reset
   # ----------------------------------------------------------------------------
 
-  def perform_input_updates(self) -> None:
+  async def perform_input_updates(self) -> None:
     """
-    Thread entry point for _input_thread.
+    Background task scheduled on the shared loop.
 
     Simulates changing internal variables on external input changes.
     """
     while self._keep_threads_alive:
       self.update_timing_input_status()
-      time.sleep(THREAD_SLEEP_DURATION)
+      # Sleep until an input-changing write wakes us; the timeout is
+      # only a fallback for direct attribute pokes from outside.
+      try:
+        await asyncio.wait_for(self._input_event.wait(), timeout=1.0)
+      except TimeoutError:
+        pass
+      self._input_event.clear()
   # ----------------------------------------------------------------------------
 
-  def perform_eeprom_writes(self) -> None:
+  async def perform_eeprom_writes(self) -> None:
     """
-    Thread entry point for _eeprom_thread.
+    Background task scheduled on the shared loop.
 
     Simulates the write operation after 2 seconds of inactivity.
+
+    Producers coalesce onto a dirty flag plus a deadline hint (plain,
+    GIL-atomic attribute stores); only the clean-to-dirty transition
+    wakes this task, so a burst of setting changes costs one wake-up
+    total instead of one loop hop per change.
     """
     while self._keep_threads_alive:
-      with self._eeprom_lock:
-        if self._next_eeprom_write and self._next_eeprom_write <= time.time():
-          if self.internal_error == ILError.EEPROM:
-            self.eeprom_write_result = OperationResult.ABNORMAL_TERMINATION
+      if not self._eeprom_dirty:
+        # Idle: sleep until start_eeprom_write flags a pending write.
+        timeout = 1.0
+      else:
+        timeout = self._eeprom_deadline_hint - time.monotonic()
+        if timeout <= 0:
+          # Clear first, then re-check: a change landing between the
+          # deadline read and this clear re-dirties and is retried.
+          self._eeprom_dirty = False
+          if time.monotonic() < self._eeprom_deadline_hint:
+            self._eeprom_dirty = True
+            continue
+          if self.internal_error == _ILE_EEPROM:
+            self.eeprom_write_result = _OPR_ABNORMAL
           else:
-            self.eeprom_write_result = OperationResult.NORMAL_TERMINATION
-          self._next_eeprom_write = None
-      time.sleep(THREAD_SLEEP_DURATION)
+            self.eeprom_write_result = _OPR_NORMAL
+          continue
+      try:
+        await asyncio.wait_for(self._eeprom_event.wait(), timeout=timeout)
+      except TimeoutError:
+        pass
+      self._eeprom_event.clear()
   # ----------------------------------------------------------------------------
 
   def start_eeprom_write(self, write_duration: float = 2.0) -> None:
@@ -1005,21 +1425,38 @@ class SensorUnit:
 
     *) 2 seconds by default, can be changed via parameter `write_duration`
     """
-    self.eeprom_write_result = OperationResult.OPERATING
-    next_write: float = time.time() + write_duration
-    with self._eeprom_lock:
-      if (
-        self._next_eeprom_write is None
-        or self._next_eeprom_write < next_write
-      ):
-        self._next_eeprom_write = next_write
+    self.eeprom_write_result = _OPR_OPERATING
+    self._eeprom_deadline_hint = time.monotonic() + write_duration
+    if not self._eeprom_dirty:
+      self._eeprom_dirty = True
+      self._loop.call_soon_threadsafe(self._eeprom_event.set)
   # ----------------------------------------------------------------------------
 
   def stop_threads(self) -> None:
     """
-    Stops all sub-threads.
+    Stops the background tasks and waits for them to finish.
+
+    Safe to call more than once; the atexit hook re-invokes it at
+    interpreter shutdown.
     """
     self._keep_threads_alive = False
+    # Wake both tasks so they exit immediately instead of waiting out
+    # their timeouts.
+    self._loop.call_soon_threadsafe(self._eeprom_event.set)
+    self._loop.call_soon_threadsafe(self._input_event.set)
+    try:
+      self._eeprom_future.result(timeout=1.0)
+      self._input_future.result(timeout=1.0)
+    except TimeoutError:
+      pass
+  # ----------------------------------------------------------------------------
+
+  @classmethod
+  def from_head(cls, code: SensorHeadCode) -> Self:
+    """
+    Create SensorUnit with the parameters of the given sensor head.
+    """
+    return cls(**_SENSOR_HEAD_SPECS[code])
   # ----------------------------------------------------------------------------
 
   @classmethod
@@ -1027,27 +1464,7 @@ class SensorUnit:
     """
     Create SensorUnit with IL-S025 parameters.
     """
-    return cls(
-      initial_value=0.000,
-      measurement_range_max=30.000,
-      measurement_range_min=20.000,
-      reference_distance=25.000,
-      reference_distance_tolerance=0.250,
-      reference_distance_analog_tolerance=5.000,
-      decimal_position=3,
-      uncertainty=0.010,
-      default_analog_upper_limit=5.000,
-      default_analog_lower_limit=-5.000,
-      default_tolerance_setting_range=0.200,
-      default_threshold_high=5.000,
-      default_threshold_low=-5.000,
-      default_auto_trigger_level=1.00,
-      default_bank_analog_upper_limit=10.000,
-      default_bank_analog_lower_limit=-10.000,
-      default_sampling_cycle=1.000,
-      default_display_digit=2,
-      connected_sensor_head=SensorHeadCode.IL_S025,
-    )
+    return cls.from_head(SensorHeadCode.IL_S025)
   # ----------------------------------------------------------------------------
 
   @classmethod
@@ -1055,27 +1472,7 @@ class SensorUnit:
     """
     Create SensorUnit with IL-030 parameters.
     """
-    return cls(
-      initial_value=0.000,
-      measurement_range_max=45.000,
-      measurement_range_min=20.000,
-      reference_distance=30.000,
-      reference_distance_tolerance=0.250,
-      reference_distance_analog_tolerance=5.000,
-      decimal_position=3,
-      uncertainty=0.010,
-      default_analog_upper_limit=5.000,
-      default_analog_lower_limit=-5.000,
-      default_tolerance_setting_range=0.200,
-      default_threshold_high=5.000,
-      default_threshold_low=-5.000,
-      default_auto_trigger_level=1.00,
-      default_bank_analog_upper_limit=10.000,
-      default_bank_analog_lower_limit=-10.000,
-      default_sampling_cycle=1.000,
-      default_display_digit=2,
-      connected_sensor_head=SensorHeadCode.IL_030,
-    )
+    return cls.from_head(SensorHeadCode.IL_030)
   # ----------------------------------------------------------------------------
 
   @classmethod
@@ -1083,27 +1480,7 @@ class SensorUnit:
     """
     Create SensorUnit with IL-065 parameters.
     """
-    return cls(
-      initial_value=0.000,
-      measurement_range_max=105.000,
-      measurement_range_min=55.000,
-      reference_distance=65.000,
-      reference_distance_tolerance=0.500,
-      reference_distance_analog_tolerance=10.000,
-      decimal_position=3,
-      uncertainty=0.020,
-      default_analog_upper_limit=10.000,
-      default_analog_lower_limit=-10.000,
-      default_tolerance_setting_range=0.200,
-      default_threshold_high=5.000,
-      default_threshold_low=-5.000,
-      default_auto_trigger_level=1.00,
-      default_bank_analog_upper_limit=10.000,
-      default_bank_analog_lower_limit=-10.000,
-      default_sampling_cycle=1.000,
-      default_display_digit=2,
-      connected_sensor_head=SensorHeadCode.IL_065,
-    )
+    return cls.from_head(SensorHeadCode.IL_065)
   # ----------------------------------------------------------------------------
 
   @classmethod
@@ -1111,27 +1488,7 @@ class SensorUnit:
     """
     Create SensorUnit with IL-S065 parameters.
     """
-    return cls(
-      initial_value=0.000,
-      measurement_range_max=75.000,
-      measurement_range_min=55.000,
-      reference_distance=65.000,
-      reference_distance_tolerance=0.500,
-      reference_distance_analog_tolerance=10.000,
-      decimal_position=3,
-      uncertainty=0.020,
-      default_analog_upper_limit=10.000,
-      default_analog_lower_limit=-10.000,
-      default_tolerance_setting_range=0.200,
-      default_threshold_high=5.000,
-      default_threshold_low=-5.000,
-      default_auto_trigger_level=1.00,
-      default_bank_analog_upper_limit=10.000,
-      default_bank_analog_lower_limit=-10.000,
-      default_sampling_cycle=1.000,
-      default_display_digit=2,
-      connected_sensor_head=SensorHeadCode.IL_S065,
-    )
+    return cls.from_head(SensorHeadCode.IL_S065)
   # ----------------------------------------------------------------------------
 
   @classmethod
@@ -1139,27 +1496,7 @@ class SensorUnit:
     """
     Create SensorUnit with IL-100 parameters.
     """
-    return cls(
-      initial_value=0.000,
-      measurement_range_max=130.000,
-      measurement_range_min=75.000,
-      reference_distance=100.000,
-      reference_distance_tolerance=1.000,
-      reference_distance_analog_tolerance=20.000,
-      decimal_position=3,
-      uncertainty=0.040,
-      default_analog_upper_limit=20.000,
-      default_analog_lower_limit=-20.000,
-      default_tolerance_setting_range=0.200,
-      default_threshold_high=5.000,
-      default_threshold_low=-5.000,
-      default_auto_trigger_level=1.00,
-      default_bank_analog_upper_limit=10.000,
-      default_bank_analog_lower_limit=-10.000,
-      default_sampling_cycle=1.000,
-      default_display_digit=2,
-      connected_sensor_head=SensorHeadCode.IL_100,
-    )
+    return cls.from_head(SensorHeadCode.IL_100)
   # ----------------------------------------------------------------------------
 
   @classmethod
@@ -1167,27 +1504,7 @@ class SensorUnit:
     """
     Create SensorUnit with IL-300 parameters.
     """
-    return cls(
-      initial_value=0.00,
-      measurement_range_max=450.00,
-      measurement_range_min=160.00,
-      reference_distance=300.00,
-      reference_distance_tolerance=7.00,
-      reference_distance_analog_tolerance=140.00,
-      decimal_position=2,
-      uncertainty=0.30,
-      default_analog_upper_limit=140.00,
-      default_analog_lower_limit=-140.00,
-      default_tolerance_setting_range=2.00,
-      default_threshold_high=50.00,
-      default_threshold_low=-50.00,
-      default_auto_trigger_level=10.00,
-      default_bank_analog_upper_limit=100.00,
-      default_bank_analog_lower_limit=-100.00,
-      default_sampling_cycle=2.000,
-      default_display_digit=1,
-      connected_sensor_head=SensorHeadCode.IL_300,
-    )
+    return cls.from_head(SensorHeadCode.IL_300)
   # ----------------------------------------------------------------------------
 
   @classmethod
@@ -1195,27 +1512,7 @@ class SensorUnit:
     """
     Create SensorUnit with IL-600 parameters.
     """
-    return cls(
-      initial_value=0.00,
-      measurement_range_max=1000.00,
-      measurement_range_min=200.00,
-      reference_distance=600.00,
-      reference_distance_tolerance=20.00,
-      reference_distance_analog_tolerance=400.00,
-      decimal_position=2,
-      uncertainty=0.50,
-      default_analog_upper_limit=400.00,
-      default_analog_lower_limit=-400.00,
-      default_tolerance_setting_range=2.00,
-      default_threshold_high=50.00,
-      default_threshold_low=-50.00,
-      default_auto_trigger_level=10.00,
-      default_bank_analog_upper_limit=100.00,
-      default_bank_analog_lower_limit=-100.00,
-      default_sampling_cycle=2.000,
-      default_display_digit=1,
-      connected_sensor_head=SensorHeadCode.IL_600,
-    )
+    return cls.from_head(SensorHeadCode.IL_600)
   # ----------------------------------------------------------------------------
 
   @classmethod
@@ -1223,27 +1520,27 @@ class SensorUnit:
     """
     Create SensorUnit with IL-2000 parameters.
     """
-    return cls(
-      initial_value=0.0,
-      measurement_range_max=3500.0,
-      measurement_range_min=1000.0,
-      reference_distance=2000.0,
-      reference_distance_tolerance=50.0,
-      reference_distance_analog_tolerance=1000.0,
-      decimal_position=1,
-      uncertainty=1.0,
-      default_analog_upper_limit=1000.0,
-      default_analog_lower_limit=-1000.0,
-      default_tolerance_setting_range=20.0,
-      default_threshold_high=500.0,
-      default_threshold_low=-500.0,
-      default_auto_trigger_level=100.0,
-      default_bank_analog_upper_limit=1000.0,
-      default_bank_analog_lower_limit=-1000.0,
-      default_sampling_cycle=5.000,
-      default_display_digit=0,
-      connected_sensor_head=SensorHeadCode.IL_2000,
-    )
+    return cls.from_head(SensorHeadCode.IL_2000)
+  # ----------------------------------------------------------------------------
+
+  @staticmethod
+  def _recalibrate(
+    old_tilt: float,
+    old_offset: float,
+    p1_before: float,
+    p1_after: float,
+    p2_before: float,
+    p2_after: float
+  ) -> tuple[float, float]:
+    """
+    Shared two-point calibration fit for calibrate_sensor and
+    calibrate_calc: back-transform both points to raw values under the
+    old coefficients, then fit the new tilt and offset through them.
+    """
+    p1_raw: float = (p1_before - old_offset) / old_tilt
+    p2_raw: float = (p2_before - old_offset) / old_tilt
+    new_tilt: float = (p2_after - p1_after) / (p2_raw - p1_raw)
+    return new_tilt, p1_after - new_tilt * p1_raw
   # ----------------------------------------------------------------------------
 
   def calibrate_sensor(
@@ -1256,15 +1553,10 @@ class SensorUnit:
     """
     Calibrate sensor with two points p1 and p2.
     """
-    # Back-transform to raw values without calibration
-    old_tilt: float = self.calibration_tilt
-    old_offset: float = self.calibration_offset
-    p1_raw: float = (p1_before - old_offset) / old_tilt
-    p2_raw: float = (p2_before - old_offset) / old_tilt
-    # Calculate and set new calibration coefficents
-    new_tilt, new_offset = get_scale_values(p1_raw, p1_after, p2_raw, p2_after)
-    self.calibration_tilt = new_tilt
-    self.calibration_offset = new_offset
+    self.calibration_tilt, self.calibration_offset = self._recalibrate(
+      self.calibration_tilt, self.calibration_offset,
+      p1_before, p1_after, p2_before, p2_after
+    )
     # How do calibration and zero shifting interact?
     # Does calibration change the interal shifiting values so the shifted
     # pointed stays the same, or does is the shifitng also affected by
@@ -1284,35 +1576,48 @@ class SensorUnit:
     """
     Calibrate sensor with two points p1 and p2.
     """
-    # Back-transform to raw values without calibration
-    old_tilt: float = self.calculation_tilt
-    old_offset: float = self.calculation_offset
-    p1_raw: float = (p1_before - old_offset) / old_tilt
-    p2_raw: float = (p2_before - old_offset) / old_tilt
-    # Calculate and set new calibration coefficents
-    new_tilt, new_offset = get_scale_values(p1_raw, p1_after, p2_raw, p2_after)
-    self.calculation_tilt = new_tilt
-    self.calculation_offset = new_offset
+    self.calculation_tilt, self.calculation_offset = self._recalibrate(
+      self.calculation_tilt, self.calculation_offset,
+      p1_before, p1_after, p2_before, p2_after
+    )
+  # ----------------------------------------------------------------------------
+
+  @property
+  def decimal_position(self) -> int:
+    """
+    Number of decimal places used by Protocol integers.
+
+    Implemented as a property so assigning a new position refreshes the
+    cached conversion scales used by mm_to_int and int_to_mm.
+    """
+    return self._decimal_position
+
+  @decimal_position.setter
+  def decimal_position(self, value: int) -> None:
+    self._decimal_position = value
+    self._int_scale = float(10 ** value)
+    self._mm_scale = 1.0 / self._int_scale
   # ----------------------------------------------------------------------------
 
   def mm_to_int(self, value: float | None) -> int:
     """
     Convert millimeter values to Protocol integers.
+
+    The in-range case returns after a single combined check; None and
+    saturation are handled in the cold tail.
     """
+    if value is not None and self.lower_bound <= value <= self.upper_bound:
+      return int(value * self._int_scale)
     if value is None:
       return -99998
-    if value > self.upper_bound:
-      return 99999
-    if value < self.lower_bound:
-      return -99999
-    return int(value * 10**self.decimal_position)
+    return 99999 if value > self.upper_bound else -99999
   # ----------------------------------------------------------------------------
 
   def int_to_mm(self, value: int) -> float:
     """
     Convert Protocol integers to millimeter values.
     """
-    return float(value / 10**self.decimal_position)
+    return value * self._mm_scale
   # ----------------------------------------------------------------------------
 
   def change_low_threshold(
@@ -1455,59 +1760,254 @@ class SensorUnit:
     self.start_eeprom_write()
   # ----------------------------------------------------------------------------
 
+  @property
+  def internal_error(self) -> int:
+    """
+    Get the amplifier error bitmask (see ILError).
+    """
+    return self._internal_error
+  # ----------------------------------------------------------------------------
+
+  @internal_error.setter
+  def internal_error(self, value: int) -> None:
+    """
+    Set the amplifier error bitmask and refresh the derived booleans the
+    output-state properties branch on, so each read costs one attribute
+    load instead of re-deriving them from the mask.
+    """
+    self._internal_error = value
+    self._err_any = value != _ILE_NO_ERROR
+    self._err_overcurrent = bool(value & _ILE_OVERCURRENT)
+    self._err_blocking = value != _ILE_NO_ERROR and value != _ILE_EEPROM
+    self._error_code = (-value & value).bit_length()
+    for notify_listener in self._error_subscribers:
+      notify_listener()
+  # ----------------------------------------------------------------------------
+
   def set_error(self, error_code: int) -> None:
     """
     Influence the internal error state.
     """
-    self.internal_error = ILError(error_code)
+    # Round-trip through the enum to validate the bit pattern, but
+    # store the plain int.
+    self.internal_error = int(ILError(error_code))
   # ----------------------------------------------------------------------------
 
   def clear_error(self) -> None:
     """
     Remove all internal errors.
     """
-    self.internal_error = ILError.NO_ERROR
+    self.internal_error = _ILE_NO_ERROR
   # ----------------------------------------------------------------------------
 
   def has_error(self) -> bool:
     """
     Does the Sensor have an interal error state?
     """
-    return self.internal_error != ILError.NO_ERROR
+    return self._err_any
   # ----------------------------------------------------------------------------
 
   def is_out_of_range(self) -> bool:
     """
     Is there a valid measurement available?
     """
+    # Cheap P.V. checks first; laser_active decodes the external-input
+    # settings and is by far the most expensive term, so it goes last.
+    jv = self._p_v_value
     return (
-      not self.laser_active
-      or not isinstance(self.judgment_value, (int, float))
-      or self.judgment_value > self.upper_bound
-      or self.judgment_value < self.lower_bound
+      jv is None
+      or jv > self.upper_bound
+      or jv < self.lower_bound
+      or not self.laser_active
     )
   # ----------------------------------------------------------------------------
 
+  def _drop_stringified_caches(self) -> None:
+    """
+    Invalidate the cached protocol byte strings after a new measurement.
+    """
+    self._stringified_state_cache = None
+    self._stringified_value_cache = None
+    self._stringified_pair_cache = None
+  # ----------------------------------------------------------------------------
+
+  @property
+  def reference_distance(self) -> float:
+    """
+    Distance between sensor and reference surface.
+
+    Setting it refreshes the derived randomization bounds.
+    """
+    return self._reference_distance
+
+  @reference_distance.setter
+  def reference_distance(self, value: float) -> None:
+    self._reference_distance = value
+    self._refresh_randomized_limits()
+    self._refresh_reference_bounds()
+  # ----------------------------------------------------------------------------
+
+  @property
+  def reference_distance_tolerance(self) -> float:
+    """
+    Tolerance band around the reference distance for the head LED.
+
+    Setting it refreshes the cached LED bounds.
+    """
+    return self._reference_distance_tolerance
+
+  @reference_distance_tolerance.setter
+  def reference_distance_tolerance(self, value: float) -> None:
+    self._reference_distance_tolerance = value
+    self._refresh_reference_bounds()
+  # ----------------------------------------------------------------------------
+
+  @property
+  def reference_distance_analog_tolerance(self) -> float:
+    """
+    Tolerance band around the reference distance for the analog LED.
+
+    Setting it refreshes the cached LED bounds.
+    """
+    return self._reference_distance_analog_tolerance
+
+  @reference_distance_analog_tolerance.setter
+  def reference_distance_analog_tolerance(self, value: float) -> None:
+    self._reference_distance_analog_tolerance = value
+    self._refresh_reference_bounds()
+  # ----------------------------------------------------------------------------
+
+  def _refresh_reference_bounds(self) -> None:
+    """
+    Recompute the reference-distance LED bounds from their inputs.
+
+    A no-op until __init__ has set all three inputs.
+    """
+    try:
+      ref = self._reference_distance
+      tol = self._reference_distance_tolerance
+      analog_tol = self._reference_distance_analog_tolerance
+    except AttributeError:
+      return
+    self._ref_lo = ref - tol
+    self._ref_hi = ref + tol
+    self._ref_analog_lo = ref - analog_tol
+    self._ref_analog_hi = ref + analog_tol
+  # ----------------------------------------------------------------------------
+
+  @property
+  def measurement_range_min(self) -> float:
+    """
+    Lower end of the measurement range.
+
+    Setting it refreshes the derived randomization bounds.
+    """
+    return self._measurement_range_min
+
+  @measurement_range_min.setter
+  def measurement_range_min(self, value: float) -> None:
+    self._measurement_range_min = value
+    self._refresh_randomized_limits()
+  # ----------------------------------------------------------------------------
+
+  @property
+  def measurement_range_max(self) -> float:
+    """
+    Upper end of the measurement range.
+
+    Setting it refreshes the derived randomization bounds.
+    """
+    return self._measurement_range_max
+
+  @measurement_range_max.setter
+  def measurement_range_max(self, value: float) -> None:
+    self._measurement_range_max = value
+    self._refresh_randomized_limits()
+  # ----------------------------------------------------------------------------
+
+  def _refresh_randomized_limits(self) -> None:
+    """
+    Recompute the randomization bounds from their inputs.
+
+    A no-op until __init__ has set all three inputs.
+    """
+    try:
+      self.randomized_upper_limit = (
+        self._reference_distance - self._measurement_range_min
+      )
+      self.randomized_lower_limit = (
+        self._reference_distance - self._measurement_range_max
+      )
+    except AttributeError:
+      pass
+  # ----------------------------------------------------------------------------
+
+  @property
+  def randomized_upper_limit(self) -> float:
+    """
+    Upper bound for randomized "measurements".
+
+    Setting it refreshes the per-sample scaling constants.
+    """
+    return self._randomized_upper_limit
+
+  @randomized_upper_limit.setter
+  def randomized_upper_limit(self, value: float) -> None:
+    self._randomized_upper_limit = value
+    self._refresh_rand_scale()
+  # ----------------------------------------------------------------------------
+
+  @property
+  def randomized_lower_limit(self) -> float:
+    """
+    Lower bound for randomized "measurements".
+
+    Setting it refreshes the per-sample scaling constants.
+    """
+    return self._randomized_lower_limit
+
+  @randomized_lower_limit.setter
+  def randomized_lower_limit(self, value: float) -> None:
+    self._randomized_lower_limit = value
+    self._refresh_rand_scale()
+  # ----------------------------------------------------------------------------
+
+  def _refresh_rand_scale(self) -> None:
+    """
+    Precompute offset and span so each sample is one multiply and one
+    add on top of random() instead of a uniform() call.
+
+    A no-op until both bounds are set.
+    """
+    try:
+      self._rand_lo = self._randomized_lower_limit
+      self._rand_span = (
+        self._randomized_upper_limit - self._randomized_lower_limit
+      )
+    except AttributeError:
+      pass
+  # ----------------------------------------------------------------------------
+
   def randomize_value(self) -> None:
     """
     Do a randomized "measurement".
     """
-    self.raw_value = uniform(
-      self.randomized_upper_limit,
-      self.randomized_lower_limit
-    )
+    self.raw_value = self._rand_lo + self._rand_span * self._rng.random()
+    self._drop_stringified_caches()
   # ----------------------------------------------------------------------------
 
   def apply_uncertainty(self) -> None:
     """
     Simulate measurement uncertainty.
     """
-    if isinstance(self.raw_value, (int, float)):
+    if self.raw_value is not None:
       if self.randomized:
         self.randomize_value()
       self.raw_value = (
-        self.raw_value + uniform(-1 * self.uncertainty, self.uncertainty)
+        self.raw_value
+        + self._rng.uniform(-1 * self.uncertainty, self.uncertainty)
       )
+    self._drop_stringified_caches()
   # ----------------------------------------------------------------------------
 
   def judgment_value_for_communication_unit(self) -> int:
@@ -1528,7 +2028,7 @@ class SensorUnit:
     CONSTANT_OVERRANGE: Final = +99999999
     CONSTANT_UNDERRANGE: Final = +99999999
     value: int
-    if self.internal_error != ILError.NO_ERROR:
+    if self.internal_error != _ILE_NO_ERROR:
       value = CONSTANT_ERROR
     elif self.value_invalid:
       value = CONSTANT_INVALID
@@ -1537,18 +2037,58 @@ class SensorUnit:
     elif self.value_under_range:
       value = CONSTANT_UNDERRANGE
     else:
-      assert isinstance(self.judgment_value, (int, float))
+      assert self.judgment_value is not None
       value = self.mm_to_int(self.judgment_value)
     return value
   # ----------------------------------------------------------------------------
 
+  @property
+  def calculation_mode(self) -> CalculationMode:
+    """
+    Get the CALC mode (OFF / addition / subtraction).
+    """
+    return self._calculation_mode
+  # ----------------------------------------------------------------------------
+
+  @calculation_mode.setter
+  def calculation_mode(self, value: CalculationMode) -> None:
+    """
+    Set the CALC mode and resolve the matching CALC implementation once,
+    so get_calculated_value dispatches without re-testing the mode on
+    every sample.
+    """
+    self._calculation_mode = value
+    if value is CalculationMode.OFF:
+      self._calc_fn = self._calc_value_off
+    elif value is CalculationMode.ADDITION:
+      self._calc_fn = self._calc_value_addition
+    elif value is CalculationMode.SUBTRACTION:
+      self._calc_fn = self._calc_value_subtraction
+    else:
+      # Should never be here
+      raise ValueError(f"Invalid calculation mode {value}")
+  # ----------------------------------------------------------------------------
+
   def get_calculated_value(self) -> float | None:
     """
     Calculate Value based on connected amplifier
     """
-    calc_mode = self.calculation_mode
+    return self._calc_fn()
+  # ----------------------------------------------------------------------------
+
+  def _calc_value_off(self) -> float | None:
+    """
+    get_calculated_value implementation for CalculationMode.OFF
+    """
+    return self.measurement_value
+  # ----------------------------------------------------------------------------
+
+  def _calc_value_addition(self) -> float | None:
+    """
+    get_calculated_value implementation for CalculationMode.ADDITION
+    """
     sub_unit = self.connected_amplifier
-    if calc_mode == CalculationMode.OFF or sub_unit is None:
+    if sub_unit is None:
       return self.measurement_value
     if self.measurement_value is None or sub_unit.measurement_value is None:
       return None
@@ -1558,17 +2098,29 @@ class SensorUnit:
     if self.calibration_use_user_settings:
       tilt = self.calculation_tilt
       offset = self.calculation_offset
+    return (
+      tilt * (self.measurement_value + sub_unit.measurement_value) + offset
+    )
+  # ----------------------------------------------------------------------------
 
-    if calc_mode == CalculationMode.ADDITION:
-      return (
-        tilt * (self.measurement_value + sub_unit.measurement_value) + offset
-      )
-    if calc_mode == CalculationMode.SUBTRACTION:
-      return (
-        tilt * (self.measurement_value - sub_unit.measurement_value) + offset
-      )
-    # Should never be here
-    raise ValueError(f"Invalid calculation mode {calc_mode}")
+  def _calc_value_subtraction(self) -> float | None:
+    """
+    get_calculated_value implementation for CalculationMode.SUBTRACTION
+    """
+    sub_unit = self.connected_amplifier
+    if sub_unit is None:
+      return self.measurement_value
+    if self.measurement_value is None or sub_unit.measurement_value is None:
+      return None
+
+    tilt: float = 1.0
+    offset: float = 0.0
+    if self.calibration_use_user_settings:
+      tilt = self.calculation_tilt
+      offset = self.calculation_offset
+    return (
+      tilt * (self.measurement_value - sub_unit.measurement_value) + offset
+    )
   # ----------------------------------------------------------------------------
 
   @property
@@ -1576,6 +2128,10 @@ class SensorUnit:
     """
     Returns the current active bank index, switching method included.
     """
+    # Fast path: with external-input switching off (the default), the
+    # index is just the stored setting; skip the whole input decode.
+    # Note the decoded bank_index below is computed but not yet
+    # returned - external-input switching is not wired in.
     if self.switch_banks_via_external_input:
       ext_1_setting = self.external_input_1_setting
       ext_2_setting = self.external_input_2_setting
@@ -1592,18 +2148,18 @@ class SensorUnit:
 
       bank_a: bool = (
         self.external_input_use_user_settings and (
-          (ext_1_setting == EXT_1_BANK_A and self.external_input_1)
-          or (ext_2_setting == EXT_2_BANK_A and self.external_input_2)
-          or (ext_3_setting == EXT_3_BANK_A and self.external_input_3)
-          or (ext_4_setting == EXT_4_BANK_A and self.external_input_4)
+          (ext_1_setting is EXT_1_BANK_A and self.external_input_1)
+          or (ext_2_setting is EXT_2_BANK_A and self.external_input_2)
+          or (ext_3_setting is EXT_3_BANK_A and self.external_input_3)
+          or (ext_4_setting is EXT_4_BANK_A and self.external_input_4)
         )
       )
       bank_b: bool = (
         self.external_input_use_user_settings and (
-          (ext_1_setting == EXT_1_BANK_B and self.external_input_1)
-          or (ext_2_setting == EXT_2_BANK_B and self.external_input_2)
-          or (ext_3_setting == EXT_3_BANK_B and self.external_input_3)
-          or (ext_4_setting == EXT_4_BANK_B and self.external_input_4)
+          (ext_1_setting is EXT_1_BANK_B and self.external_input_1)
+          or (ext_2_setting is EXT_2_BANK_B and self.external_input_2)
+          or (ext_3_setting is EXT_3_BANK_B and self.external_input_3)
+          or (ext_4_setting is EXT_4_BANK_B and self.external_input_4)
         )
       )
       bank_index: int = (2 * bank_b) + (1 * bank_a)
@@ -1612,12 +2168,28 @@ class SensorUnit:
     return self.active_bank_setting
   # ----------------------------------------------------------------------------
 
+  @property
+  def active_bank_setting(self) -> BANK_INDEX:
+    """
+    Currently selected bank number.
+
+    Setting it caches the matching Bank object so the hot accessors
+    below are plain attribute loads instead of a property chain.
+    """
+    return self._active_bank_setting
+
+  @active_bank_setting.setter
+  def active_bank_setting(self, value: BANK_INDEX) -> None:
+    self._active_bank_setting = value
+    self._active_bank = self.banks[value]
+  # ----------------------------------------------------------------------------
+
   @property
   def active_bank(self) -> Bank:
     """
     Get the currently active bank, switching method included.
     """
-    return self.banks[self.active_bank_index]
+    return self._active_bank
   # ----------------------------------------------------------------------------
 
   @property
@@ -1625,7 +2197,7 @@ class SensorUnit:
     """
     Get the active bank's HIGH threshold.
     """
-    return self.active_bank.threshold_high
+    return self._active_bank.threshold_high
   # ----------------------------------------------------------------------------
 
   @property
@@ -1633,7 +2205,7 @@ class SensorUnit:
     """
     Get the active bank's LOW threshold.
     """
-    return self.active_bank.threshold_low
+    return self._active_bank.threshold_low
   # ----------------------------------------------------------------------------
 
   @property
@@ -1641,10 +2213,11 @@ class SensorUnit:
     """
     Get the active bank's analog upper limit.
     """
-    if self.analog_output_scaling_mode == AnalogOutputScalingMode.BANK:
-      return self.active_bank.analog_upper_limit
-    elif self.analog_output_scaling_mode == AnalogOutputScalingMode.FREE_RANGE:
-      return self.free_analog_upper_limit
+    mode = self.analog_output_scaling_mode
+    if mode is _AOSM_BANK:
+      return self._active_bank.analog_upper_limit
+    elif mode is _AOSM_FREE_RANGE:
+      return self._free_analog_upper_limit
     return self.default_analog_upper_limit
   # ----------------------------------------------------------------------------
 
@@ -1653,10 +2226,11 @@ class SensorUnit:
     """
     Get the active bank's analog lower limit.
     """
-    if self.analog_output_scaling_mode == AnalogOutputScalingMode.BANK:
-      return self.active_bank.analog_lower_limit
-    elif self.analog_output_scaling_mode == AnalogOutputScalingMode.FREE_RANGE:
-      return self.free_analog_lower_limit
+    mode = self.analog_output_scaling_mode
+    if mode is _AOSM_BANK:
+      return self._active_bank.analog_lower_limit
+    elif mode is _AOSM_FREE_RANGE:
+      return self._free_analog_lower_limit
     return self.default_analog_lower_limit
   # ----------------------------------------------------------------------------
 
@@ -1665,7 +2239,7 @@ class SensorUnit:
     """
     Get the active bank's zero shift target.
     """
-    return self.active_bank.shift_target
+    return self._active_bank.shift_target
   # ----------------------------------------------------------------------------
 
   @property
@@ -1681,9 +2255,51 @@ class SensorUnit:
     """
     Set the raw value used by simulator.
     """
-    self._raw_value = value
-    # Updated raw value --> trigger upate of measurement value
-    self.update_R_V_value()
+    self._recompute_from_raw(value)
+  # ----------------------------------------------------------------------------
+
+  def _recompute_from_raw(self, raw: float | None) -> None:
+    """
+    Fused update of R.V., CALC, and P.V. after a raw-value change.
+
+    Equivalent to the update_R_V_value -> update_CALC_value ->
+    update_P_V_value cascade below, but writes the intermediate fields
+    directly, so one sample costs a single call instead of three
+    property-setter dispatches.
+    """
+    if raw is not None:
+      raw = float(raw)
+    self._raw_value = raw
+    if raw is None:
+      rv = None
+    else:
+      direction: float = -1 if self.reversed_measurement_direction else 1
+      tilt: float = 1.0
+      offset: float = 0.0
+      if self.calibration_use_user_settings:
+        tilt = self.calibration_tilt
+        offset = self.calibration_offset
+      # The way shift target and calibration interact is not 100% clear.
+      rv = tilt * (direction * raw - self.shift_target) + offset
+    if rv == self._r_v_value:
+      # Unchanged R.V. (None == None included): CALC would recompute to
+      # exactly what it already holds, so skip it and the partner
+      # notification. P.V. must still see the sample: the peak/bottom
+      # hold kernels accumulate state per call, and sample hold may
+      # have to resync a judgment latched by a timing edge.
+      self.update_P_V_value()
+      return
+    self._r_v_value = rv
+    if rv is None:
+      self._calc_value = None
+    elif self.is_main_unit:
+      self._calc_value = self.get_calculated_value()
+    else:
+      self._calc_value = rv
+    self.update_P_V_value()
+    if rv is not None and not self.is_main_unit:
+      for notify_partner in self._calc_subscribers:
+        notify_partner()
   # ----------------------------------------------------------------------------
 
   def update_R_V_value(self) -> None:
@@ -1691,7 +2307,7 @@ class SensorUnit:
     Updated raw value --> trigger upate of measurement value
     """
     if self._raw_value is None:
-      self.measurement_value = None
+      new_value = None
     else:
       direction: float = -1 if self.reversed_measurement_direction else 1
       tilt: float = 1.0
@@ -1700,9 +2316,11 @@ class SensorUnit:
         tilt = self.calibration_tilt
         offset = self.calibration_offset
       # The way shift target and calibration interact is not 100% clear.
-      self.measurement_value = (
+      new_value = (
         tilt * (direction * self._raw_value - self.shift_target) + offset
       )
+    if new_value != self._r_v_value:
+      self.measurement_value = new_value
   # ----------------------------------------------------------------------------
 
   @property
@@ -1718,24 +2336,71 @@ class SensorUnit:
     """
     Set the R.V. internal measurment value (raw + zero shift).
     """
-    self._r_v_value = value
+    self._r_v_value = value if value is None else float(value)
     # Updated measurement value --> trigger upate of calculation value
     self.update_CALC_value()
   # ----------------------------------------------------------------------------
 
-  def update_CALC_value(self, *, _from_sub_unit: bool = False) -> None:
+  def update_CALC_value(self) -> None:
     """
     Updated measurement value --> trigger upate of calculation value
     """
     if self._r_v_value is None:
-      self.calculation_value = None
+      new_value = None
+    elif self.is_main_unit:
+      new_value = self.get_calculated_value()
     else:
-      if self.is_main_unit:
-        self.calculation_value = self.get_calculated_value()
-      else:
-        self.calculation_value = self._r_v_value
-        if self.connected_amplifier is not None and not _from_sub_unit:
-          self.connected_amplifier.update_CALC_value(_from_sub_unit=True)
+      new_value = self._r_v_value
+    if new_value != self._calc_value:
+      self.calculation_value = new_value
+    else:
+      # Equal CALC still counts as a sample for the hold kernels.
+      self.update_P_V_value()
+    if self._r_v_value is not None and not self.is_main_unit:
+      for notify_partner in self._calc_subscribers:
+        notify_partner()
+  # ----------------------------------------------------------------------------
+
+  def _update_calc_from_partner(self) -> None:
+    """
+    Subscriber callback for a partner amplifier's new sample.
+
+    Refreshes the CALC value derived from the partner without publishing
+    onwards, so a main/expansion pair can never notify each other in a
+    loop.
+    """
+    if self._r_v_value is None:
+      new_value = None
+    elif self.is_main_unit:
+      new_value = self.get_calculated_value()
+    else:
+      new_value = self._r_v_value
+    if new_value != self._calc_value:
+      self.calculation_value = new_value
+    else:
+      # Equal CALC still counts as a sample for the hold kernels.
+      self.update_P_V_value()
+  # ----------------------------------------------------------------------------
+
+  @property
+  def connected_amplifier(self) -> Self | None:
+    """
+    Get the amplifier unit paired with this one on the D-bus.
+    """
+    return self._connected_amplifier
+  # ----------------------------------------------------------------------------
+
+  @connected_amplifier.setter
+  def connected_amplifier(self, value: Self | None) -> None:
+    """
+    Set the paired amplifier unit and rebuild the subscriber list that
+    receives this unit's sample notifications.
+    """
+    self._connected_amplifier = value
+    if value is None:
+      self._calc_subscribers = []
+    else:
+      self._calc_subscribers = [value._update_calc_from_partner]
   # ----------------------------------------------------------------------------
 
   @property
@@ -1751,7 +2416,7 @@ class SensorUnit:
     """
     Set the CALC value: calc(rv1, rv2).
     """
-    self._calc_value = value
+    self._calc_value = value if value is None else float(value)
     # Updated calculation value --> trigger upate of judgment value
     self.update_P_V_value()
   # ----------------------------------------------------------------------------
@@ -1769,7 +2434,8 @@ class SensorUnit:
     Peak Hold implementation for update_P_V_value()
     """
     if self.currently_sampling and not self._error_during_sampling:
-      if self.calculation_value is None:
+      calc = self._calc_value
+      if calc is None:
         # If the R.V. value (or CALC value) causes an alarm even once during
         # the sampling period, the hold results will be "-----".
         self._hold_value = None
@@ -1778,15 +2444,17 @@ class SensorUnit:
         # Stop further sampling during this sampling period
         self._error_during_sampling = True
       else:
-        self._hold_peak = (
-          self.calculation_value if self._hold_peak is None
-          else max(self._hold_peak, self.calculation_value)
-        )
-        self._hold_bottom = (
-          self.calculation_value if self._hold_bottom is None
-          else min(self._hold_bottom, self.calculation_value)
-        )
-        self._hold_value = self._hold_peak
+        # Work entirely on locals; each read above this point was a
+        # property dispatch per access before.
+        peak = self._hold_peak
+        bottom = self._hold_bottom
+        if peak is None or calc > peak:
+          peak = calc
+        if bottom is None or calc < bottom:
+          bottom = calc
+        self._hold_peak = peak
+        self._hold_bottom = bottom
+        self._hold_value = peak
   # ----------------------------------------------------------------------------
 
   def _bottom_hold(self) -> None:
@@ -1794,7 +2462,8 @@ class SensorUnit:
     Bottom Hold implementation for update_P_V_value()
     """
     if self.currently_sampling and not self._error_during_sampling:
-      if self.calculation_value is None:
+      calc = self._calc_value
+      if calc is None:
         # If the R.V. value (or CALC value) causes an alarm even once during
         # the sampling period, the hold results will be "-----".
         self._hold_value = None
@@ -1803,15 +2472,17 @@ class SensorUnit:
         # Stop further sampling during this sampling period
         self._error_during_sampling = True
       else:
-        self._hold_peak = (
-          self.calculation_value if self._hold_peak is None
-          else max(self._hold_peak, self.calculation_value)
-        )
-        self._hold_bottom = (
-          self.calculation_value if self._hold_bottom is None
-          else min(self._hold_bottom, self.calculation_value)
-        )
-        self._hold_value = self._hold_bottom
+        # Work entirely on locals; each read above this point was a
+        # property dispatch per access before.
+        peak = self._hold_peak
+        bottom = self._hold_bottom
+        if peak is None or calc > peak:
+          peak = calc
+        if bottom is None or calc < bottom:
+          bottom = calc
+        self._hold_peak = peak
+        self._hold_bottom = bottom
+        self._hold_value = bottom
   # ----------------------------------------------------------------------------
 
   def _peak_to_peak_hold(self) -> None:
@@ -1819,7 +2490,8 @@ class SensorUnit:
     Peak to Peak Hold implementation for update_P_V_value()
     """
     if self.currently_sampling and not self._error_during_sampling:
-      if self.calculation_value is None:
+      calc = self._calc_value
+      if calc is None:
         # If the R.V. value (or CALC value) causes an alarm even once during
         # the sampling period, the hold results will be "-----".
         self._hold_value = None
@@ -1828,15 +2500,17 @@ class SensorUnit:
         # Stop further sampling during this sampling period
         self._error_during_sampling = True
       else:
-        self._hold_peak = (
-          self.calculation_value if self._hold_peak is None
-          else max(self._hold_peak, self.calculation_value)
-        )
-        self._hold_bottom = (
-          self.calculation_value if self._hold_bottom is None
-          else min(self._hold_bottom, self.calculation_value)
-        )
-        self._hold_value = self._hold_peak - self._hold_bottom
+        # Work entirely on locals; each read above this point was a
+        # property dispatch per access before.
+        peak = self._hold_peak
+        bottom = self._hold_bottom
+        if peak is None or calc > peak:
+          peak = calc
+        if bottom is None or calc < bottom:
+          bottom = calc
+        self._hold_peak = peak
+        self._hold_bottom = bottom
+        self._hold_value = peak - bottom
   # ----------------------------------------------------------------------------
 
   def _auto_peak_hold(self) -> None:
@@ -1845,7 +2519,8 @@ class SensorUnit:
     """
     start_level: float = self.auto_trigger_level
     end_level: float = self.auto_trigger_level - self.hysteresis
-    if self.calculation_value is None or self.calculation_value < end_level:
+    calc = self.calculation_value
+    if calc is None or calc < end_level:
       # ## Stop sampling  ##
       # After the sampling starts, if the internal measurement value (R.V.)
       # becomes "-----" before the sampling falls below the specified trigger
@@ -1854,7 +2529,7 @@ class SensorUnit:
       self.currently_sampling = False
       self.judgment_value = self._hold_value
     elif (
-      self.calculation_value > start_level
+      calc > start_level
       and (self.currently_sampling or not self.timing_input)
     ):
       if not self.currently_sampling:
@@ -1863,15 +2538,15 @@ class SensorUnit:
         self._hold_peak = None
         self._hold_bottom = None
         self.currently_sampling = True
-      self._hold_peak = (
-        self.calculation_value if self._hold_peak is None
-        else max(self._hold_peak, self.calculation_value)
-      )
-      self._hold_bottom = (
-        self.calculation_value if self._hold_bottom is None
-        else min(self._hold_bottom, self.calculation_value)
-      )
-      self._hold_value = self._hold_peak
+      peak = self._hold_peak
+      bottom = self._hold_bottom
+      if peak is None or calc > peak:
+        peak = calc
+      if bottom is None or calc < bottom:
+        bottom = calc
+      self._hold_peak = peak
+      self._hold_bottom = bottom
+      self._hold_value = peak
   # ----------------------------------------------------------------------------
 
   def _auto_bottom_hold(self) -> None:
@@ -1880,7 +2555,8 @@ class SensorUnit:
     """
     start_level: float = self.auto_trigger_level
     end_level: float = self.auto_trigger_level + self.hysteresis
-    if self.calculation_value is None or self.calculation_value > end_level:
+    calc = self.calculation_value
+    if calc is None or calc > end_level:
       # ## Stop sampling  ##
       # After the sampling starts, if the internal measurement value (R.V.)
       # becomes "-----" before the sampling goes beyond the specified trigger
@@ -1889,7 +2565,7 @@ class SensorUnit:
       self.currently_sampling = False
       self.judgment_value = self._hold_value
     elif (
-      self.calculation_value < start_level
+      calc < start_level
       and (self.currently_sampling or not self.timing_input)
     ):
       if not self.currently_sampling:
@@ -1898,115 +2574,323 @@ class SensorUnit:
         self._hold_peak = None
         self._hold_bottom = None
         self.currently_sampling = True
-      self._hold_peak = (
-        self.calculation_value if self._hold_peak is None
-        else max(self._hold_peak, self.calculation_value)
+      peak = self._hold_peak
+      bottom = self._hold_bottom
+      if peak is None or calc > peak:
+        peak = calc
+      if bottom is None or calc < bottom:
+        bottom = calc
+      self._hold_peak = peak
+      self._hold_bottom = bottom
+      self._hold_value = bottom
+  # ----------------------------------------------------------------------------
+
+  # Hold kernels indexed by HoldFunctionSetting value. Stored unbound
+  # like the _read_table/_write_table entries; update_P_V_value passes
+  # self explicitly.
+  _HOLD_DISPATCH: ClassVar[tuple[Callable[['SensorUnit'], None], ...]] = (
+    _sample_hold,
+    _peak_hold,
+    _bottom_hold,
+    _peak_to_peak_hold,
+    _auto_peak_hold,
+    _auto_bottom_hold,
+  )
+
+  @property
+  def hold_function_setting(self) -> HoldFunctionSetting:
+    """
+    Get the sampling hold function setting.
+    """
+    return self._hold_function_setting
+  # ----------------------------------------------------------------------------
+
+  @hold_function_setting.setter
+  def hold_function_setting(self, value: HoldFunctionSetting) -> None:
+    """
+    Set the sampling hold function setting and resolve the matching hold
+    kernel once, so update_P_V_value dispatches without rebuilding a
+    mapping on every sample.
+    """
+    try:
+      self._hold_fn = self._HOLD_DISPATCH[value]
+    except IndexError:
+      raise ValueError(f"Invalid Holding Mode: {value}") from None
+    self._hold_function_setting = value
+  # ----------------------------------------------------------------------------
+
+  def update_P_V_value(self) -> None:
+    """
+    Updated calculation value --> trigger upate of judgment value
+    """
+    self._hold_fn(self)
+  # ----------------------------------------------------------------------------
+
+  @property
+  def judgment_value(self) -> float | None:
+    """
+    Get the P.V. judgment value (CALC + holding).
+    """
+    return self._p_v_value
+  # ----------------------------------------------------------------------------
+
+  @judgment_value.setter
+  def judgment_value(self, value: float | None) -> None:
+    """
+    Set the P.V. judgment value (CALC + holding).
+    """
+    self._p_v_value = value if value is None else float(value)
+  # ----------------------------------------------------------------------------
+
+  @property
+  def timing_input(self) -> bool:
+    """
+    Get the actual state of timing input (internal variable OR input signal)
+    """
+    return self._timing_input
+  # ----------------------------------------------------------------------------
+
+  @timing_input.setter
+  def timing_input(self, value: bool) -> None:
+    """
+    Set the actual state of timing input (internal variable OR input signal)
+    """
+    if value == self._timing_input:
+      # No edge: every branch below is a no-op, and the periodic caller
+      # hits this case almost every tick.
+      return
+    positive_edge: bool = value
+    negative_edge: bool = not value
+    self._timing_input = value
+
+    hold_mode = self.hold_function_setting
+
+    if hold_mode is HoldFunctionSetting.SAMPLE_HOLD:
+      if self.timing_input_on_edge and positive_edge:
+        self.judgment_value = self.calculation_value
+    elif hold_mode in (
+      HoldFunctionSetting.PEAK_HOLD,
+      HoldFunctionSetting.BOTTOM_HOLD,
+      HoldFunctionSetting.PEAK_TO_PEAK_HOLD,
+    ):
+      if positive_edge:
+        # stop sampling
+        self.currently_sampling = False
+        self._error_during_sampling = False
+        self.judgment_value = self._hold_value
+      if self.timing_input_on_edge or negative_edge:
+        # Restart sampling
+        self._hold_value = None
+        self._hold_peak = None
+        self._hold_bottom = None
+        self.currently_sampling = True
+  # ----------------------------------------------------------------------------
+
+  @property
+  def external_input_use_user_settings(self) -> bool:
+    """
+    Are the external input assignments taken from the user settings?
+
+    Setting it refreshes the cached timing-source bit.
+    """
+    return self._external_input_use_user_settings
+
+  @external_input_use_user_settings.setter
+  def external_input_use_user_settings(self, value: bool) -> None:
+    self._external_input_use_user_settings = value
+    self._refresh_timing_source()
+  # ----------------------------------------------------------------------------
+
+  def _refresh_timing_source(self) -> None:
+    """
+    Recompute whether external input 3 drives the timing input.
+
+    A no-op until __init__ has set both inputs.
+    """
+    try:
+      self._timing_source_is_ext3 = (
+        self._external_input_3_setting is ExternalInput3Setting.TIMING
+        or not self._external_input_use_user_settings
       )
-      self._hold_bottom = (
-        self.calculation_value if self._hold_bottom is None
-        else min(self._hold_bottom, self.calculation_value)
+    except AttributeError:
+      pass
+  # ----------------------------------------------------------------------------
+
+  def update_timing_input_status(self) -> None:
+    """
+    Update the state of timing input.
+
+    Call periodically to update `timing_input`
+    """
+    self.timing_input = (
+      (self._timing_source_is_ext3 and self._external_input_3)
+      or self.stored_timing_input
+    )
+  # ----------------------------------------------------------------------------
+
+  @property
+  def error_code(self) -> int:
+    """
+    Return first error code.
+
+    Derived from the lowest set bit of the error mask; computed once in
+    the internal_error setter since reads far outnumber error changes.
+    """
+    return self._error_code
+  # ----------------------------------------------------------------------------
+
+  def _refresh_ext_stop_active(self) -> None:
+    """
+    Recompute whether any external input is asserting laser stop.
+
+    A no-op until __init__ has set all eight inputs.
+    """
+    try:
+      self._ext_stop_active = (
+        (
+          self._external_input_1_setting
+          is ExternalInput1Setting.LASER_EMISSION_STOP
+          and self._external_input_1
+        )
+        or (
+          self._external_input_2_setting
+          is ExternalInput2Setting.LASER_EMISSION_STOP
+          and self._external_input_2
+        )
+        or (
+          self._external_input_3_setting
+          is ExternalInput3Setting.LASER_EMISSION_STOP
+          and self._external_input_3
+        )
+        or (
+          self._external_input_4_setting
+          is ExternalInput4Setting.LASER_EMISSION_STOP
+          and self._external_input_4
+        )
       )
-      self._hold_value = self._hold_bottom
+    except AttributeError:
+      pass
   # ----------------------------------------------------------------------------
 
-  def update_P_V_value(self) -> None:
+  @property
+  def external_input_1(self) -> bool:
     """
-    Updated calculation value --> trigger upate of judgment value
+    State of external input 1.
+
+    Setting it refreshes the cached laser-stop bit.
     """
-    hold_mapping = {
-      HoldFunctionSetting.SAMPLE_HOLD: self._sample_hold,
-      HoldFunctionSetting.PEAK_HOLD: self._peak_hold,
-      HoldFunctionSetting.BOTTOM_HOLD: self._bottom_hold,
-      HoldFunctionSetting.PEAK_TO_PEAK_HOLD: self._peak_to_peak_hold,
-      HoldFunctionSetting.AUTO_PEAK_HOLD: self._auto_peak_hold,
-      HoldFunctionSetting.AUTO_BOTTOM_HOLD: self._auto_bottom_hold,
-    }
-    holding_method = hold_mapping.get(self.hold_function_setting)
-    if holding_method is None:
-      raise ValueError(f"Invalid Holding Mode: {self.hold_function_setting}")
-    holding_method()
+    return self._external_input_1
+
+  @external_input_1.setter
+  def external_input_1(self, value: bool) -> None:
+    self._external_input_1 = value
+    self._refresh_ext_stop_active()
   # ----------------------------------------------------------------------------
 
   @property
-  def judgment_value(self) -> float | None:
+  def external_input_1_setting(self) -> ExternalInput1Setting:
     """
-    Get the P.V. judgment value (CALC + holding).
+    Function assigned to external input 1.
+
+    Setting it refreshes the cached laser-stop bit.
     """
-    return self._p_v_value
+    return self._external_input_1_setting
+
+  @external_input_1_setting.setter
+  def external_input_1_setting(self, value: ExternalInput1Setting) -> None:
+    self._external_input_1_setting = value
+    self._refresh_ext_stop_active()
   # ----------------------------------------------------------------------------
 
-  @judgment_value.setter
-  def judgment_value(self, value: float | None) -> None:
+  @property
+  def external_input_2(self) -> bool:
     """
-    Set the P.V. judgment value (CALC + holding).
+    State of external input 2.
+
+    Setting it refreshes the cached laser-stop bit.
     """
-    self._p_v_value = value
+    return self._external_input_2
+
+  @external_input_2.setter
+  def external_input_2(self, value: bool) -> None:
+    self._external_input_2 = value
+    self._refresh_ext_stop_active()
   # ----------------------------------------------------------------------------
 
   @property
-  def timing_input(self) -> bool:
+  def external_input_2_setting(self) -> ExternalInput2Setting:
     """
-    Get the actual state of timing input (internal variable OR input signal)
+    Function assigned to external input 2.
+
+    Setting it refreshes the cached laser-stop bit.
     """
-    return self._timing_input
+    return self._external_input_2_setting
+
+  @external_input_2_setting.setter
+  def external_input_2_setting(self, value: ExternalInput2Setting) -> None:
+    self._external_input_2_setting = value
+    self._refresh_ext_stop_active()
   # ----------------------------------------------------------------------------
 
-  @timing_input.setter
-  def timing_input(self, value: bool) -> None:
+  @property
+  def external_input_3(self) -> bool:
     """
-    Set the actual state of timing input (internal variable OR input signal)
+    State of external input 3.
+
+    Setting it refreshes the cached laser-stop bit.
     """
-    edge: bool = (value != self._timing_input)
-    positive_edge: bool = edge and value
-    negative_edge: bool = edge and not value
-    self._timing_input = value
+    return self._external_input_3
 
-    hold_mode = self.hold_function_setting
+  @external_input_3.setter
+  def external_input_3(self, value: bool) -> None:
+    self._external_input_3 = value
+    self._refresh_ext_stop_active()
+  # ----------------------------------------------------------------------------
 
-    if hold_mode == HoldFunctionSetting.SAMPLE_HOLD:
-      if self.timing_input_on_edge and positive_edge:
-        self.judgment_value = self.calculation_value
-    elif hold_mode in (
-      HoldFunctionSetting.PEAK_HOLD,
-      HoldFunctionSetting.BOTTOM_HOLD,
-      HoldFunctionSetting.PEAK_TO_PEAK_HOLD,
-    ):
-      if positive_edge:
-        # stop sampling
-        self.currently_sampling = False
-        self._error_during_sampling = False
-        self.judgment_value = self._hold_value
-      if edge and (self.timing_input_on_edge or negative_edge):
-        # Restart sampling
-        self._hold_value = None
-        self._hold_peak = None
-        self._hold_bottom = None
-        self.currently_sampling = True
+  @property
+  def external_input_3_setting(self) -> ExternalInput3Setting:
+    """
+    Function assigned to external input 3.
+
+    Setting it refreshes the cached laser-stop bit.
+    """
+    return self._external_input_3_setting
+
+  @external_input_3_setting.setter
+  def external_input_3_setting(self, value: ExternalInput3Setting) -> None:
+    self._external_input_3_setting = value
+    self._refresh_ext_stop_active()
+    self._refresh_timing_source()
   # ----------------------------------------------------------------------------
 
-  def update_timing_input_status(self) -> None:
+  @property
+  def external_input_4(self) -> bool:
     """
-    Update the state of timing input.
+    State of external input 4.
 
-    Call periodically to update `timing_input`
+    Setting it refreshes the cached laser-stop bit.
     """
-    self.timing_input = (
-      (
-        self.external_input_3_setting == ExternalInput3Setting.TIMING
-        or not self.external_input_use_user_settings
-      )
-      and self.external_input_3
-      or self.stored_timing_input
-    )
+    return self._external_input_4
+
+  @external_input_4.setter
+  def external_input_4(self, value: bool) -> None:
+    self._external_input_4 = value
+    self._refresh_ext_stop_active()
   # ----------------------------------------------------------------------------
 
   @property
-  def error_code(self) -> int:
+  def external_input_4_setting(self) -> ExternalInput4Setting:
     """
-    Return first error code.
+    Function assigned to external input 4.
+
+    Setting it refreshes the cached laser-stop bit.
     """
-    bitmask: int = int(self.internal_error)
-    return int(-bitmask & bitmask).bit_length()
+    return self._external_input_4_setting
+
+  @external_input_4_setting.setter
+  def external_input_4_setting(self, value: ExternalInput4Setting) -> None:
+    self._external_input_4_setting = value
+    self._refresh_ext_stop_active()
   # ----------------------------------------------------------------------------
 
   @property
@@ -2014,23 +2898,10 @@ class SensorUnit:
     """
     Is the Laser currently emiting radiation?
     """
-    ext_1_setting = self.external_input_1_setting
-    ext_2_setting = self.external_input_2_setting
-    ext_3_setting = self.external_input_3_setting
-    ext_4_setting = self.external_input_4_setting
-    EXT_1_STOP = ExternalInput1Setting.LASER_EMISSION_STOP
-    EXT_2_STOP = ExternalInput2Setting.LASER_EMISSION_STOP
-    EXT_3_STOP = ExternalInput3Setting.LASER_EMISSION_STOP
-    EXT_4_STOP = ExternalInput4Setting.LASER_EMISSION_STOP
     if (
-      self.external_input_use_user_settings and (
-        (ext_1_setting == EXT_1_STOP and self.external_input_1)
-        or (ext_2_setting == EXT_2_STOP and self.external_input_2)
-        or (ext_3_setting == EXT_3_STOP and self.external_input_3)
-        or (ext_4_setting == EXT_4_STOP and self.external_input_4)
-      )
+      (self.external_input_use_user_settings and self._ext_stop_active)
       or self.stored_laser_emission_stop
-      or self.internal_error == ILError.Sensor_Head
+      or self._internal_error == _ILE_SENSOR_HEAD
     ):
       return False
     return True
@@ -2042,15 +2913,8 @@ class SensorUnit:
     Output of the reference distance LED.
     """
     if self.head_display_mode == HeadDisplayMode.DEFAULT:
-      if (
-        isinstance(self.raw_value, (int, float))
-        and self.raw_value > (
-          self.reference_distance - self.reference_distance_tolerance
-        )
-        and self.raw_value < (
-          self.reference_distance + self.reference_distance_tolerance
-        )
-      ):
+      raw = self._raw_value
+      if raw is not None and self._ref_lo < raw < self._ref_hi:
         return LEDColor.GREEN
 
     elif self.head_display_mode == HeadDisplayMode.OK_NG:
@@ -2070,7 +2934,7 @@ class SensorUnit:
       if (
         self.high_output
         or self.low_output
-        or not isinstance(self.raw_value, (int, float))
+        or self.raw_value is None
       ):
         return nogo_color
 
@@ -2083,15 +2947,8 @@ class SensorUnit:
     Lights when in the range of the analog output.
     """
     if self.head_display_mode == HeadDisplayMode.DEFAULT:
-      if (
-        isinstance(self.raw_value, (int, float))
-        and self.raw_value > (
-          self.reference_distance - self.reference_distance_analog_tolerance
-        )
-        and self.raw_value < (
-          self.reference_distance + self.reference_distance_analog_tolerance
-        )
-      ):
+      raw = self._raw_value
+      if raw is not None and self._ref_analog_lo < raw < self._ref_analog_hi:
         return LEDColor.ORANGE
     return LEDColor.OFF
   # ----------------------------------------------------------------------------
@@ -2111,7 +2968,7 @@ class SensorUnit:
     """
     Lights up in the alarm state or error state.
     """
-    return self.internal_error != ILError.NO_ERROR
+    return self._err_any
   # ----------------------------------------------------------------------------
 
   @property
@@ -2119,16 +2976,13 @@ class SensorUnit:
     """
     Returns sampling rate in milliseconds.
     """
-    value_mapping = {
-      SamplingCycle.DEFAULT: self.default_sampling_cycle,
-      SamplingCycle.ONE_THIRD_MS: 0.33,
-      SamplingCycle.ONE_MS: 1.0,
-      SamplingCycle.TWO_MS: 2.0,
-      SamplingCycle.FIVE_MS: 5.0,
-    }
-    value = value_mapping.get(self.sampling_cycle)
+    try:
+      value = _SAMPLING_RATE_BY_CYCLE[self.sampling_cycle]
+    except IndexError:
+      raise ValueError(f"No valid sampling cycle: {self.sampling_cycle}") \
+        from None
     if value is None:
-      raise ValueError(f"No valid sampling cycle: {self.sampling_cycle}")
+      return self.default_sampling_cycle
     return value
   # ----------------------------------------------------------------------------
 
@@ -2137,21 +2991,35 @@ class SensorUnit:
     """
     Returns the amount of digits after the decimal points display on screen.
     """
-    value_mapping = {
-      DisplayDigit.DEFAULT: self.default_display_digit,
-      DisplayDigit.THREE_DIGITS: 3,
-      DisplayDigit.TWO_DIGITS: 2,
-      DisplayDigit.ONE_DIGIT: 1,
-      DisplayDigit.ZERO_DIGITS: 0,
-    }
-    value = value_mapping.get(self.display_digit_setting)
-    if value is None:
+    try:
+      value = _DISPLAY_DIGITS_BY_SETTING[self.display_digit_setting]
+    except IndexError:
       raise ValueError(
         f"Invalid display digits setting: {self.display_digit_setting}"
-      )
+      ) from None
+    if value is None:
+      return self.default_display_digit
     return value
   # ----------------------------------------------------------------------------
 
+  @property
+  def output_mode_normally_closed(self) -> bool:
+    """
+    Get the transistor output polarity (normally closed when True).
+    """
+    return self._output_mode_normally_closed
+  # ----------------------------------------------------------------------------
+
+  @output_mode_normally_closed.setter
+  def output_mode_normally_closed(self, value: bool) -> None:
+    """
+    Set the transistor output polarity. OUTPUT_TRUE / OUTPUT_FALSE are
+    just this flag and its negation, so the *_output properties read
+    the slot directly.
+    """
+    self._output_mode_normally_closed = value
+  # ----------------------------------------------------------------------------
+
   @property
   def OUTPUT_FALSE(self) -> bool:
     """
@@ -2160,7 +3028,7 @@ class SensorUnit:
 
     Default is Normally Open --> False
     """
-    return self.output_mode_normally_closed
+    return self._output_mode_normally_closed
   # ----------------------------------------------------------------------------
 
   @property
@@ -2171,7 +3039,7 @@ class SensorUnit:
 
     Default is Normally Open --> True
     """
-    return not self.output_mode_normally_closed
+    return not self._output_mode_normally_closed
   # ----------------------------------------------------------------------------
 
   @property
@@ -2181,10 +3049,7 @@ class SensorUnit:
     No Alarm: True
     Alarm: False
     """
-    if (
-      self.internal_error != ILError.NO_ERROR
-      or not isinstance(self.raw_value, (int, float))
-    ):
+    if self._err_any or self._raw_value is None:
       return True
     return False
   # ----------------------------------------------------------------------------
@@ -2194,22 +3059,19 @@ class SensorUnit:
     """
     Get theoretical state of HIGH output.
     """
-    if ILError.Overcurrent & self.internal_error:
+    if self._err_overcurrent:
       return False
-    if (
-      self.internal_error != ILError.NO_ERROR
-      and self.internal_error != ILError.EEPROM
-    ):
+    if self._err_blocking:
       return True
     if (
-      not self.laser_active
-      or not isinstance(self.raw_value, (int, float))
-      or not isinstance(self.judgment_value, (int, float))
+      self._raw_value is None
+      or self._p_v_value is None
+      or not self.laser_active
     ):
       return False
     if (
-      self.raw_value > self.upper_bound  # FFFF
-      or self.judgment_value > self.threshold_high
+      self._raw_value > self.upper_bound  # FFFF
+      or self._p_v_value > self.threshold_high
     ):
       return True
     return False
@@ -2220,22 +3082,19 @@ class SensorUnit:
     """
     Get theoretical state of LOW output.
     """
-    if ILError.Overcurrent & self.internal_error:
+    if self._err_overcurrent:
       return False
-    if (
-      self.internal_error != ILError.NO_ERROR
-      and self.internal_error != ILError.EEPROM
-    ):
+    if self._err_blocking:
       return True
     if (
-      not self.laser_active
-      or not isinstance(self.raw_value, (int, float))
-      or not isinstance(self.judgment_value, (int, float))
+      self._raw_value is None
+      or self._p_v_value is None
+      or not self.laser_active
     ):
       return False
     if (
-      self.raw_value < self.lower_bound  # -FFFF
-      or self.judgment_value < self.threshold_low
+      self._raw_value < self.lower_bound  # -FFFF
+      or self._p_v_value < self.threshold_low
     ):
       return True
     return False
@@ -2246,24 +3105,19 @@ class SensorUnit:
     """
     Get theoretical state of GO output.
     """
-    if ILError.Overcurrent & self.internal_error:
+    if self._err_overcurrent or self._err_blocking:
       return False
     if (
-      self.internal_error != ILError.NO_ERROR
-      and self.internal_error != ILError.EEPROM
-    ):
-      return False
-    if (
-      not self.laser_active
-      or not isinstance(self.raw_value, (int, float))
-      or not isinstance(self.judgment_value, (int, float))
+      self._raw_value is None
+      or self._p_v_value is None
+      or not self.laser_active
     ):
       return False
     if (
-      self.raw_value > self.upper_bound  # FFFF
-      or self.judgment_value > self.threshold_high
-      or self.raw_value < self.lower_bound  # -FFFF
-      or self.judgment_value < self.threshold_low
+      self._raw_value > self.upper_bound  # FFFF
+      or self._p_v_value > self.threshold_high
+      or self._raw_value < self.lower_bound  # -FFFF
+      or self._p_v_value < self.threshold_low
     ):
       return False
     return True
@@ -2284,7 +3138,8 @@ class SensorUnit:
     """
     Get physical state of HIGH output.
     """
-    return self.OUTPUT_TRUE if self.high_state else self.OUTPUT_FALSE
+    nc = self._output_mode_normally_closed
+    return not nc if self.high_state else nc
   # ----------------------------------------------------------------------------
 
   @property
@@ -2292,7 +3147,8 @@ class SensorUnit:
     """
     Get physical state of LOW output.
     """
-    return self.OUTPUT_TRUE if self.low_state else self.OUTPUT_FALSE
+    nc = self._output_mode_normally_closed
+    return not nc if self.low_state else nc
   # ----------------------------------------------------------------------------
 
   @property
@@ -2300,7 +3156,8 @@ class SensorUnit:
     """
     Get physical state of GO output.
     """
-    return self.OUTPUT_TRUE if self.go_state else self.OUTPUT_FALSE
+    nc = self._output_mode_normally_closed
+    return not nc if self.go_state else nc
   # ----------------------------------------------------------------------------
 
   @property
@@ -2310,7 +3167,7 @@ class SensorUnit:
     """
     return (
       not self.laser_active
-      or not isinstance(self.judgment_value, (int, float))
+      or self.judgment_value is None
     )
   # ----------------------------------------------------------------------------
 
@@ -2319,7 +3176,7 @@ class SensorUnit:
     """
     Does the adjusted value display '-FFFF'?
     """
-    if not isinstance(self.judgment_value, (int, float)):
+    if self.judgment_value is None:
       return False
     return (
       self.judgment_value < self.lower_bound
@@ -2331,7 +3188,7 @@ class SensorUnit:
     """
     Does the adjusted value display '+FFFF'?
     """
-    if not isinstance(self.judgment_value, (int, float)):
+    if self.judgment_value is None:
       return False
     return (
       self.judgment_value > self.upper_bound
@@ -2343,15 +3200,20 @@ class SensorUnit:
     """
     Get state for MS command.
     """
-    if self.internal_error != ILError.NO_ERROR:
+    # Fused evaluation of the high/low/go predicates: with no error
+    # pending their overcurrent/blocking branches are dead, so the
+    # shared validity and bound checks run once instead of per property.
+    if self._err_any:
       return OutputState.Error
-    if self.high_state:
+    raw = self._raw_value
+    jv = self._p_v_value
+    if raw is None or jv is None or not self.laser_active:
+      return OutputState.All_OFF
+    if raw > self.upper_bound or jv > self.threshold_high:
       return OutputState.HIGH
-    if self.low_state:
+    if raw < self.lower_bound or jv < self.threshold_low:
       return OutputState.LOW
-    if self.go_state:
-      return OutputState.GO
-    return OutputState.All_OFF
+    return OutputState.GO
   # ----------------------------------------------------------------------------
 
   @property
@@ -2359,7 +3221,21 @@ class SensorUnit:
     """
     Get formatted state for MS command.
     """
-    return f"{self.output_state.value:0>2}"
+    return _STATE_STR[self.output_state]
+  # ----------------------------------------------------------------------------
+
+  @property
+  def stringified_state_bytes(self) -> bytes:
+    """
+    Get formatted state for MS command as protocol bytes.
+
+    Cached until the next measurement, see _drop_stringified_caches.
+    """
+    cached = self._stringified_state_cache
+    if cached is None:
+      cached = _STATE_BYTES[self.output_state]
+      self._stringified_state_cache = cached
+    return cached
   # ----------------------------------------------------------------------------
 
   @property
@@ -2371,24 +3247,69 @@ class SensorUnit:
     return f"{value:+010d}"
   # ----------------------------------------------------------------------------
 
+  @property
+  def stringified_value_bytes(self) -> bytes:
+    """
+    Get formatted measurement value for M0/MS command as protocol bytes.
+
+    Cached until the next measurement, see _drop_stringified_caches.
+    """
+    cached = self._stringified_value_cache
+    if cached is None:
+      cached = b"%+010d" % self.judgment_value_for_communication_unit()
+      self._stringified_value_cache = cached
+    return cached
+  # ----------------------------------------------------------------------------
+
+  @property
+  def stringified_pair_bytes(self) -> bytes:
+    """
+    Get formatted state and measurement value for the MS command as one
+    protocol bytes field pair.
+
+    Cached until the next measurement, see _drop_stringified_caches.
+    """
+    cached = self._stringified_pair_cache
+    if cached is None:
+      cached = b"%02d,%+010d" % (
+        self.output_state,
+        self.judgment_value_for_communication_unit(),
+      )
+      self._stringified_pair_cache = cached
+    return cached
+  # ----------------------------------------------------------------------------
+
+  @property
+  def analog_output_mode(self) -> AnalogOutputMode:
+    """
+    Get the mode of the analog output (voltage/current/off).
+    """
+    return self._analog_output_mode
+  # ----------------------------------------------------------------------------
+
+  @analog_output_mode.setter
+  def analog_output_mode(self, value: AnalogOutputMode) -> None:
+    """
+    Set the analog output mode and refresh the display scale used by
+    read_042: current has 2 digit precision, voltage 3.
+    """
+    self._analog_output_mode = value
+    self._analog_read_scale = (
+      100 if value is AnalogOutputMode.CURRENT_4_TO_20 else 1000
+    )
+  # ----------------------------------------------------------------------------
+
   @property
   def max_analog_value(self) -> float:
     """
     Returns the maximum analog value (in Volts/Amps)
     """
-    value_mapping = {
-      AnalogOutputMode.OFF: 0,
-      AnalogOutputMode.CURRENT_4_TO_20: 20,
-      AnalogOutputMode.VOLTAGE_0_TO_5: 5,
-      AnalogOutputMode.VOLTAGE_1_TO_5: 5,
-      AnalogOutputMode.VOLTAGE_MINUS_5_TO_5: 5,
-    }
-    value = value_mapping.get(self.analog_output_mode)
-    if value is None:
+    try:
+      return _MAX_ANALOG_BY_MODE[self._analog_output_mode]
+    except IndexError:
       raise ValueError(
-        f"Invalid analog_output_mode: {self.analog_output_mode}"
-      )
-    return value
+        f"Invalid analog_output_mode: {self._analog_output_mode}"
+      ) from None
   # ----------------------------------------------------------------------------
 
   @property
@@ -2396,19 +3317,12 @@ class SensorUnit:
     """
     Returns the minimum analog value (in Volts/Amps)
     """
-    value_mapping = {
-      AnalogOutputMode.OFF: 0,
-      AnalogOutputMode.CURRENT_4_TO_20: 4,
-      AnalogOutputMode.VOLTAGE_0_TO_5: 0,
-      AnalogOutputMode.VOLTAGE_1_TO_5: 1,
-      AnalogOutputMode.VOLTAGE_MINUS_5_TO_5: -5,
-    }
-    value = value_mapping.get(self.analog_output_mode)
-    if value is None:
+    try:
+      return _MIN_ANALOG_BY_MODE[self._analog_output_mode]
+    except IndexError:
       raise ValueError(
-        f"Invalid analog_output_mode: {self.analog_output_mode}"
-      )
-    return value
+        f"Invalid analog_output_mode: {self._analog_output_mode}"
+      ) from None
   # ----------------------------------------------------------------------------
 
   @property
@@ -2417,32 +3331,38 @@ class SensorUnit:
     Transform the measurement value (Distance)
     into the value at the analog output (Voltage/Current)
     """
-    if self.analog_output_mode == AnalogOutputMode.OFF:
+    mode = self._analog_output_mode
+    if mode is AnalogOutputMode.OFF:
       return 0
-    if (
-      self.internal_error != ILError.NO_ERROR
-      or self.value_invalid
-    ):
-      if self.analog_output_mode == AnalogOutputMode.CURRENT_4_TO_20:
+    jv = self._p_v_value
+    # value_invalid inlined; laser_active last, it is the expensive term.
+    if self._err_any or jv is None or not self.laser_active:
+      if mode is AnalogOutputMode.CURRENT_4_TO_20:
         # Current
         return 3.0
       else:
         # Voltage
         return 5.5
 
-    assert isinstance(self.judgment_value, (int, float))
-    if self.judgment_value > self.analog_upper_limit:
-      return self.max_analog_value
-    if self.judgment_value <= self.analog_lower_limit:
-      return self.min_analog_value
-
-    return scale_values(
-      self.judgment_value,
-      self.analog_lower_limit,
-      self.min_analog_value,
-      self.analog_upper_limit,
-      self.max_analog_value
-    )
+    x1 = self.analog_lower_limit
+    y1 = self.min_analog_value
+    x2 = self.analog_upper_limit
+    y2 = self.max_analog_value
+    if jv > x2:
+      return y2
+    if jv <= x1:
+      return y1
+
+    # Pre-baked (tilt, offset), keyed by the endpoints they were derived
+    # from: the division in get_scale_values only reruns when the analog
+    # range or output mode actually changed, not per sample.
+    cache = self._analog_scale_cache
+    if cache is not None and cache[0:4] == (x1, y1, x2, y2):
+      tilt, offset = cache[4], cache[5]
+    else:
+      tilt, offset = get_scale_values(x1, y1, x2, y2)
+      self._analog_scale_cache = (x1, y1, x2, y2, tilt, offset)
+    return tilt * jv + offset
   # ----------------------------------------------------------------------------
 
   def handle_read(self, query_data: int) -> int | str:
@@ -2450,15 +3370,15 @@ class SensorUnit:
     Dispatch read calls for SR commands.
     """
     if query_data > 223:
-      raise QueryOutsideValidRangeError
-    handler_function = self.read_mapping.get(query_data)
+      raise QUERY_OUTSIDE_VALID_RANGE_ERROR
+    handler_function = self._read_table[query_data]
     if handler_function is None:
-      if query_data in self.write_mapping:
+      if self._write_table[query_data] is not None:
         # Write-Only function
-        raise QueryReadProtectedError
+        raise QUERY_READ_PROTECTED_ERROR
       # System-reserved:
-      raise InaccessibleIDOrQueryError
-    return handler_function()
+      raise INACCESSIBLE_ID_OR_QUERY_ERROR
+    return handler_function(self)
   # ----------------------------------------------------------------------------
 
   def handle_write(self, query_data: int, setting_data: int) -> None:
@@ -2466,15 +3386,15 @@ class SensorUnit:
     Dispatch write calls for SW commands.
     """
     if query_data > 223:
-      raise QueryOutsideValidRangeError
-    handler_function = self.write_mapping.get(query_data)
+      raise QUERY_OUTSIDE_VALID_RANGE_ERROR
+    handler_function = self._write_table[query_data]
     if handler_function is None:
-      if query_data in self.read_mapping:
+      if self._read_table[query_data] is not None:
         # Read-Only function
-        raise QueryWriteProtectedError
+        raise QUERY_WRITE_PROTECTED_ERROR
       # System-reserved:
-      raise InaccessibleIDOrQueryError
-    handler_function(setting_data)
+      raise INACCESSIBLE_ID_OR_QUERY_ERROR
+    handler_function(self, setting_data)
   # ----------------------------------------------------------------------------
 
   def write_001_zero_shift_execution_request(self, setting_data: int) -> None:
@@ -2486,14 +3406,14 @@ class SensorUnit:
     zero shift value memory function.
     """
     if setting_data != 1:
-      raise WriteDataOutsideValidRangeError
-    self.zero_shifting_result = OperationResult.OPERATING
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
+    self.zero_shifting_result = _OPR_OPERATING
     value = self.raw_value
     if value is None:
-      self.zero_shifting_result = OperationResult.ABNORMAL_TERMINATION
+      self.zero_shifting_result = _OPR_ABNORMAL
     else:
       self.change_shift_target(value)
-      self.zero_shifting_result = OperationResult.NORMAL_TERMINATION
+      self.zero_shifting_result = _OPR_NORMAL
   # ----------------------------------------------------------------------------
 
   def write_002_zero_shift_reset_request(self, setting_data: int) -> None:
@@ -2501,10 +3421,10 @@ class SensorUnit:
     Resets the zero shift value.
     """
     if setting_data != 1:
-      raise WriteDataOutsideValidRangeError
-    self.zero_shifting_result = OperationResult.OPERATING
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
+    self.zero_shifting_result = _OPR_OPERATING
     self.change_shift_target(0)
-    self.zero_shifting_result = OperationResult.NORMAL_TERMINATION
+    self.zero_shifting_result = _OPR_NORMAL
   # ----------------------------------------------------------------------------
 
   def write_003_reset_request(self, setting_data: int) -> None:
@@ -2512,10 +3432,10 @@ class SensorUnit:
     Executes resetting.
     """
     if setting_data != 1:
-      raise WriteDataOutsideValidRangeError
-    self.reset_request_result = OperationResult.OPERATING
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
+    self.reset_request_result = _OPR_OPERATING
     self.reset()
-    self.reset_request_result = OperationResult.NORMAL_TERMINATION
+    self.reset_request_result = _OPR_NORMAL
   # ----------------------------------------------------------------------------
 
   def write_005_initial_reset_request(self, setting_data: int) -> None:
@@ -2531,7 +3451,7 @@ class SensorUnit:
     (1).
     """
     if setting_data != 1:
-      raise WriteDataOutsideValidRangeError
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
     self.restore_default_settings()
   # ----------------------------------------------------------------------------
 
@@ -2548,7 +3468,7 @@ class SensorUnit:
     connected equipment.
     """
     if setting_data != 1:
-      raise WriteDataOutsideValidRangeError
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
     self.set_system_parameters()
   # ----------------------------------------------------------------------------
 
@@ -2560,18 +3480,18 @@ class SensorUnit:
     number 106 to set the tolerance setting range.
     """
     if setting_data != 1:
-      raise WriteDataOutsideValidRangeError
-    self.tuning_result = OperationResult.OPERATING
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
+    self.tuning_result = _OPR_OPERATING
 
-    if not isinstance(self.judgment_value, (int, float)):
-      self.tuning_result = OperationResult.ABNORMAL_TERMINATION
-      raise NonExecutableStateError
+    if self.judgment_value is None:
+      self.tuning_result = _OPR_ABNORMAL
+      raise NON_EXECUTABLE_STATE_ERROR
 
     new_upper_limit = self.judgment_value + self.tolerance_setting_range
     new_lower_limit = self.judgment_value - self.tolerance_setting_range
     self.change_high_threshold(new_upper_limit)
     self.change_low_threshold(new_lower_limit)
-    self.tuning_result = OperationResult.NORMAL_TERMINATION
+    self.tuning_result = _OPR_NORMAL
   # ----------------------------------------------------------------------------
 
   def write_015_2point_high_1st_point_request(
@@ -2583,13 +3503,13 @@ class SensorUnit:
     refer to the “IL Series User's Manual”.
     """
     if setting_data != 1:
-      raise WriteDataOutsideValidRangeError
-    self.tuning_result = OperationResult.OPERATING
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
+    self.tuning_result = _OPR_OPERATING
 
-    if not isinstance(self.measurement_value, (int, float)):
+    if self.measurement_value is None:
       self._two_point_high_side_1st_point = None
-      self.tuning_result = OperationResult.ABNORMAL_TERMINATION
-      raise NonExecutableStateError
+      self.tuning_result = _OPR_ABNORMAL
+      raise NON_EXECUTABLE_STATE_ERROR
 
     self._two_point_high_side_1st_point = self.measurement_value
   # ----------------------------------------------------------------------------
@@ -2603,23 +3523,23 @@ class SensorUnit:
     refer to the “IL Series User's Manual”.
     """
     if setting_data != 1:
-      raise WriteDataOutsideValidRangeError
-    self.tuning_result = OperationResult.OPERATING
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
+    self.tuning_result = _OPR_OPERATING
 
     if (
-      not isinstance(self.measurement_value, (int, float))
-      or not isinstance(self._two_point_high_side_1st_point, (int, float))
+      self.measurement_value is None
+      or self._two_point_high_side_1st_point is None
     ):
       self._two_point_high_side_1st_point = None
-      self.tuning_result = OperationResult.ABNORMAL_TERMINATION
-      raise NonExecutableStateError
+      self.tuning_result = _OPR_ABNORMAL
+      raise NON_EXECUTABLE_STATE_ERROR
 
     two_point_high_side_2nd_point = self.measurement_value
     new_high = (
       self._two_point_high_side_1st_point + two_point_high_side_2nd_point
     ) / 2
     self.change_high_threshold(new_high)
-    self.tuning_result = OperationResult.NORMAL_TERMINATION
+    self.tuning_result = _OPR_NORMAL
   # ----------------------------------------------------------------------------
 
   def write_017_2point_low_1st_point_request(
@@ -2631,13 +3551,13 @@ class SensorUnit:
     refer to the “IL Series User's Manual”.
     """
     if setting_data != 1:
-      raise WriteDataOutsideValidRangeError
-    self.tuning_result = OperationResult.OPERATING
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
+    self.tuning_result = _OPR_OPERATING
 
-    if not isinstance(self.measurement_value, (int, float)):
+    if self.measurement_value is None:
       self._two_point_low_side_1st_point = None
-      self.tuning_result = OperationResult.ABNORMAL_TERMINATION
-      raise NonExecutableStateError
+      self.tuning_result = _OPR_ABNORMAL
+      raise NON_EXECUTABLE_STATE_ERROR
 
     self._two_point_low_side_1st_point = self.measurement_value
   # ----------------------------------------------------------------------------
@@ -2651,23 +3571,23 @@ class SensorUnit:
     refer to the “IL Series User's Manual”.
     """
     if setting_data != 1:
-      raise WriteDataOutsideValidRangeError
-    self.tuning_result = OperationResult.OPERATING
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
+    self.tuning_result = _OPR_OPERATING
 
     if (
-      not isinstance(self.measurement_value, (int, float))
-      or not isinstance(self._two_point_low_side_1st_point, (int, float))
+      self.measurement_value is None
+      or self._two_point_low_side_1st_point is None
     ):
       self._two_point_low_side_1st_point = None
-      self.tuning_result = OperationResult.ABNORMAL_TERMINATION
-      raise NonExecutableStateError
+      self.tuning_result = _OPR_ABNORMAL
+      raise NON_EXECUTABLE_STATE_ERROR
 
     two_point_low_side_2nd_point = self.measurement_value
     new_low = (
       self._two_point_low_side_1st_point + two_point_low_side_2nd_point
     ) / 2
     self.change_low_threshold(new_low)
-    self.tuning_result = OperationResult.NORMAL_TERMINATION
+    self.tuning_result = _OPR_NORMAL
   # ----------------------------------------------------------------------------
 
   def write_019_calibration_set_1_request(self, setting_data: int) -> None:
@@ -2681,17 +3601,17 @@ class SensorUnit:
     For the operating procedure, refer to the “IL Series User's Manual”.
     """
     if setting_data != 1:
-      raise WriteDataOutsideValidRangeError
-    self.calibration_result = OperationResult.OPERATING
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
+    self.calibration_result = _OPR_OPERATING
 
-    if not isinstance(self.measurement_value, (int, float)):
-      self.calibration_result = OperationResult.ABNORMAL_TERMINATION
-      raise NonExecutableStateError
+    if self.measurement_value is None:
+      self.calibration_result = _OPR_ABNORMAL
+      raise NON_EXECUTABLE_STATE_ERROR
 
     if not self.calibration_use_user_settings:
       # TODO: Does this fail silently or loudly?
-      self.calibration_result = OperationResult.ABNORMAL_TERMINATION
-      raise NonExecutableStateError  # TODO: Not verified
+      self.calibration_result = _OPR_ABNORMAL
+      raise NON_EXECUTABLE_STATE_ERROR  # TODO: Not verified
 
     self._calibration_set_1_before = self.measurement_value
   # ----------------------------------------------------------------------------
@@ -2707,46 +3627,48 @@ class SensorUnit:
     For the operating procedure, refer to the “IL Series User's Manual”.
     """
     if setting_data != 1:
-      raise WriteDataOutsideValidRangeError
-    self.calibration_result = OperationResult.OPERATING
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
+    self.calibration_result = _OPR_OPERATING
 
-    if not isinstance(self.measurement_value, (int, float)):
-      self.calibration_result = OperationResult.ABNORMAL_TERMINATION
+    if self.measurement_value is None:
+      self.calibration_result = _OPR_ABNORMAL
       self._calibration_set_1_before = None
-      raise NonExecutableStateError  # TODO: Not verified
+      raise NON_EXECUTABLE_STATE_ERROR  # TODO: Not verified
 
-    if not isinstance(self._calibration_set_1_before, (int, float)):
-      self.calibration_result = OperationResult.ABNORMAL_TERMINATION
+    if self._calibration_set_1_before is None:
+      self.calibration_result = _OPR_ABNORMAL
       self._calibration_set_1_before = None
-      raise NonExecutableStateError  # TODO: Not verified
+      raise NON_EXECUTABLE_STATE_ERROR  # TODO: Not verified
 
     if not self.calibration_use_user_settings:
       # TODO: Does this fail silently or loudly?
-      self.calibration_result = OperationResult.ABNORMAL_TERMINATION
-      raise NonExecutableStateError  # TODO: Not verified
+      self.calibration_result = _OPR_ABNORMAL
+      raise NON_EXECUTABLE_STATE_ERROR  # TODO: Not verified
 
     _calibration_set_1_before: float = self._calibration_set_1_before
     _calibration_set_2_before: float = self.measurement_value
+    calibration_set_1: float = self.calibration_set_1
+    calibration_set_2: float = self.calibration_set_2
 
     calibration_factor: float = (
-      (self.calibration_set_2 - self.calibration_set_1)
+      (calibration_set_2 - calibration_set_1)
       / (_calibration_set_2_before - _calibration_set_1_before)
     )
 
     if not (0.5 <= calibration_factor <= 2.0):
-      self.calibration_result = OperationResult.ABNORMAL_TERMINATION
+      self.calibration_result = _OPR_ABNORMAL
       self._calibration_set_1_before = None
-      raise NonExecutableStateError  # TODO: Not verified
+      raise NON_EXECUTABLE_STATE_ERROR  # TODO: Not verified
 
     self.calibrate_sensor(
       _calibration_set_1_before,
-      self.calibration_set_1,
+      calibration_set_1,
       _calibration_set_2_before,
-      self.calibration_set_2
+      calibration_set_2
     )
     self._calibration_set_1_before = None
     self.start_eeprom_write()
-    self.calibration_result = OperationResult.NORMAL_TERMINATION
+    self.calibration_result = _OPR_NORMAL
   # ----------------------------------------------------------------------------
 
   def write_021_calc_2point_calibration_set_1_request(
@@ -2764,22 +3686,22 @@ class SensorUnit:
     For the operating procedure, refer to the “IL Series User's Manual”.
     """
     if setting_data != 1:
-      raise WriteDataOutsideValidRangeError
-    self.calibration_result = OperationResult.OPERATING
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
+    self.calibration_result = _OPR_OPERATING
 
-    if not isinstance(self.calculation_value, (int, float)):
-      self.calibration_result = OperationResult.ABNORMAL_TERMINATION
-      raise NonExecutableStateError  # TODO: Not verified
+    if self.calculation_value is None:
+      self.calibration_result = _OPR_ABNORMAL
+      raise NON_EXECUTABLE_STATE_ERROR  # TODO: Not verified
 
     if not self.calibration_use_user_settings:
       # TODO: Does this fail silently or loudly?
-      self.calibration_result = OperationResult.ABNORMAL_TERMINATION
-      raise NonExecutableStateError  # TODO: Not verified
+      self.calibration_result = _OPR_ABNORMAL
+      raise NON_EXECUTABLE_STATE_ERROR  # TODO: Not verified
 
     if not self.calc_calibration_mode == CalculationCalibrationMode.TWO_POINT:
       # TODO: Does this fail silently or loudly?
-      self.calibration_result = OperationResult.ABNORMAL_TERMINATION
-      raise NonExecutableStateError  # TODO: Not verified
+      self.calibration_result = _OPR_ABNORMAL
+      raise NON_EXECUTABLE_STATE_ERROR  # TODO: Not verified
 
     self._calc_2p_calibration_set_1_before_calc = self.calculation_value
   # ----------------------------------------------------------------------------
@@ -2799,58 +3721,57 @@ class SensorUnit:
     For the operating procedure, refer to the “IL Series User's Manual”.
     """
     if setting_data != 1:
-      raise WriteDataOutsideValidRangeError
-    self.calibration_result = OperationResult.OPERATING
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
+    self.calibration_result = _OPR_OPERATING
 
-    if not isinstance(self.calculation_value, (int, float)):
-      self.calibration_result = OperationResult.ABNORMAL_TERMINATION
+    if self.calculation_value is None:
+      self.calibration_result = _OPR_ABNORMAL
       self._calc_2p_calibration_set_1_before_calc = None
-      raise NonExecutableStateError  # TODO: Not verified
+      raise NON_EXECUTABLE_STATE_ERROR  # TODO: Not verified
 
-    if not isinstance(
-      self._calc_2p_calibration_set_1_before_calc,
-      (int, float)
-    ):
-      self.calibration_result = OperationResult.ABNORMAL_TERMINATION
+    if self._calc_2p_calibration_set_1_before_calc is None:
+      self.calibration_result = _OPR_ABNORMAL
       self._calc_2p_calibration_set_1_before_calc = None
-      raise NonExecutableStateError  # TODO: Not verified
+      raise NON_EXECUTABLE_STATE_ERROR  # TODO: Not verified
 
     if not self.calibration_use_user_settings:
       # TODO: Does this fail silently or loudly?
-      self.calibration_result = OperationResult.ABNORMAL_TERMINATION
+      self.calibration_result = _OPR_ABNORMAL
       self._calc_2p_calibration_set_1_before_calc = None
-      raise NonExecutableStateError  # TODO: Not verified
+      raise NON_EXECUTABLE_STATE_ERROR  # TODO: Not verified
 
     if not self.calc_calibration_mode == CalculationCalibrationMode.TWO_POINT:
       # TODO: Does this fail silently or loudly?
-      self.calibration_result = OperationResult.ABNORMAL_TERMINATION
+      self.calibration_result = _OPR_ABNORMAL
       self._calc_2p_calibration_set_1_before_calc = None
-      raise NonExecutableStateError  # TODO: Not verified
+      raise NON_EXECUTABLE_STATE_ERROR  # TODO: Not verified
 
     set_1_before_calc: float = (
       self._calc_2p_calibration_set_1_before_calc
     )
     set_2_before_calc: float = self.calculation_value
+    calc_2p_set_1: float = self.calc_2p_calibration_set_1
+    calc_2p_set_2: float = self.calc_2p_calibration_set_2
 
     calibration_factor: float = (
-      (self.calc_2p_calibration_set_2 - self.calc_2p_calibration_set_1)
+      (calc_2p_set_2 - calc_2p_set_1)
       / (set_2_before_calc - set_1_before_calc)
     )
 
     if not (0.5 <= calibration_factor <= 2.0):
-      self.calibration_result = OperationResult.ABNORMAL_TERMINATION
+      self.calibration_result = _OPR_ABNORMAL
       self._calc_2p_calibration_set_1_before_calc = None
-      raise NonExecutableStateError  # TODO: Not verified
+      raise NON_EXECUTABLE_STATE_ERROR  # TODO: Not verified
 
     self.calibrate_calc(
       set_1_before_calc,
-      self.calc_2p_calibration_set_1,
+      calc_2p_set_1,
       set_2_before_calc,
-      self.calc_2p_calibration_set_2
+      calc_2p_set_2
     )
     self._calc_2p_calibration_set_1_before_calc = None
     self.start_eeprom_write()
-    self.calibration_result = OperationResult.NORMAL_TERMINATION
+    self.calibration_result = _OPR_NORMAL
   # ----------------------------------------------------------------------------
 
   def write_023_calc_3point_calibration_set_1_request(
@@ -2868,40 +3789,40 @@ class SensorUnit:
     For the operating procedure, refer to the “IL Series User's Manual”.
     """
     if setting_data != 1:
-      raise WriteDataOutsideValidRangeError
-    self.calibration_result = OperationResult.OPERATING
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
+    self.calibration_result = _OPR_OPERATING
 
     if not self.is_main_unit or self.connected_amplifier is None:
-      self.calibration_result = OperationResult.ABNORMAL_TERMINATION
-      raise NonExecutableStateError  # TODO: Not verified
+      self.calibration_result = _OPR_ABNORMAL
+      raise NON_EXECUTABLE_STATE_ERROR  # TODO: Not verified
 
     expansion_unit = self.connected_amplifier
-    if not isinstance(self.measurement_value, (int, float)):
-      self.calibration_result = OperationResult.ABNORMAL_TERMINATION
-      raise NonExecutableStateError  # TODO: Not verified
+    if self.measurement_value is None:
+      self.calibration_result = _OPR_ABNORMAL
+      raise NON_EXECUTABLE_STATE_ERROR  # TODO: Not verified
 
-    if not isinstance(expansion_unit.measurement_value, (int, float)):
-      self.calibration_result = OperationResult.ABNORMAL_TERMINATION
-      raise NonExecutableStateError  # TODO: Not verified
+    if expansion_unit.measurement_value is None:
+      self.calibration_result = _OPR_ABNORMAL
+      raise NON_EXECUTABLE_STATE_ERROR  # TODO: Not verified
 
-    if not isinstance(self.calculation_value, (int, float)):
-      self.calibration_result = OperationResult.ABNORMAL_TERMINATION
-      raise NonExecutableStateError  # TODO: Not verified
+    if self.calculation_value is None:
+      self.calibration_result = _OPR_ABNORMAL
+      raise NON_EXECUTABLE_STATE_ERROR  # TODO: Not verified
 
     if not self.calibration_use_user_settings:
       # TODO: Does this fail silently or loudly?
-      self.calibration_result = OperationResult.ABNORMAL_TERMINATION
-      raise NonExecutableStateError  # TODO: Not verified
+      self.calibration_result = _OPR_ABNORMAL
+      raise NON_EXECUTABLE_STATE_ERROR  # TODO: Not verified
 
     if not self.calc_calibration_mode == CalculationCalibrationMode.THREE_POINT:
       # TODO: Does this fail silently or loudly?
-      self.calibration_result = OperationResult.ABNORMAL_TERMINATION
-      raise NonExecutableStateError  # TODO: Not verified
+      self.calibration_result = _OPR_ABNORMAL
+      raise NON_EXECUTABLE_STATE_ERROR  # TODO: Not verified
 
-    self._calc_3p_calibration_set_1_before_calc = self.calculation_value
-    self._calc_3p_calibration_set_1_before_rv_main = self.measurement_value
-    self._calc_3p_calibration_set_1_before_rv_expansion = (
-      expansion_unit.measurement_value
+    self._calc_3p_state = _Calc3pState(
+      set_1_calc=self.calculation_value,
+      set_1_rv_main=self.measurement_value,
+      set_1_rv_expansion=expansion_unit.measurement_value
     )
   # ----------------------------------------------------------------------------
 
@@ -2920,81 +3841,49 @@ class SensorUnit:
     For the operating procedure, refer to the “IL Series User's Manual”.
     """
     if setting_data != 1:
-      raise WriteDataOutsideValidRangeError
-    self.calibration_result = OperationResult.OPERATING
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
+    self.calibration_result = _OPR_OPERATING
 
     if not self.is_main_unit or self.connected_amplifier is None:
-      self.calibration_result = OperationResult.ABNORMAL_TERMINATION
-      self._calc_3p_calibration_set_1_before_calc = None
-      self._calc_3p_calibration_set_1_before_rv_main = None
-      self._calc_3p_calibration_set_1_before_rv_expansion = None
-      raise NonExecutableStateError  # TODO: Not verified
+      self._abort_calc_3p_calibration()
 
     expansion_unit = self.connected_amplifier
 
-    if not isinstance(self.measurement_value, (int, float)):
-      self.calibration_result = OperationResult.ABNORMAL_TERMINATION
-      self._calc_3p_calibration_set_1_before_calc = None
-      self._calc_3p_calibration_set_1_before_rv_main = None
-      self._calc_3p_calibration_set_1_before_rv_expansion = None
-      raise NonExecutableStateError  # TODO: Not verified
-
-    if not isinstance(expansion_unit.measurement_value, (int, float)):
-      self.calibration_result = OperationResult.ABNORMAL_TERMINATION
-      self._calc_3p_calibration_set_1_before_calc = None
-      self._calc_3p_calibration_set_1_before_rv_main = None
-      self._calc_3p_calibration_set_1_before_rv_expansion = None
-      raise NonExecutableStateError  # TODO: Not verified
-
-    if not isinstance(self.calculation_value, (int, float)):
-      self.calibration_result = OperationResult.ABNORMAL_TERMINATION
-      self._calc_3p_calibration_set_1_before_calc = None
-      self._calc_3p_calibration_set_1_before_rv_main = None
-      self._calc_3p_calibration_set_1_before_rv_expansion = None
-      raise NonExecutableStateError  # TODO: Not verified
+    if self.measurement_value is None:
+      self._abort_calc_3p_calibration()
+
+    if expansion_unit.measurement_value is None:
+      self._abort_calc_3p_calibration()
+
+    if self.calculation_value is None:
+      self._abort_calc_3p_calibration()
 
     if not self.calibration_use_user_settings:
       # TODO: Does this fail silently or loudly?
-      self.calibration_result = OperationResult.ABNORMAL_TERMINATION
-      self._calc_3p_calibration_set_1_before_calc = None
-      self._calc_3p_calibration_set_1_before_rv_main = None
-      self._calc_3p_calibration_set_1_before_rv_expansion = None
-      raise NonExecutableStateError  # TODO: Not verified
+      self._abort_calc_3p_calibration()
 
     if not self.calc_calibration_mode == CalculationCalibrationMode.THREE_POINT:
       # TODO: Does this fail silently or loudly?
-      self.calibration_result = OperationResult.ABNORMAL_TERMINATION
-      self._calc_3p_calibration_set_1_before_calc = None
-      self._calc_3p_calibration_set_1_before_rv_main = None
-      self._calc_3p_calibration_set_1_before_rv_expansion = None
-      raise NonExecutableStateError  # TODO: Not verified
+      self._abort_calc_3p_calibration()
 
-    if not (
-      isinstance(
-        self._calc_3p_calibration_set_1_before_calc,
-        (int, float)
-      )
-      and isinstance(
-        self._calc_3p_calibration_set_1_before_rv_main,
-        (int, float)
-      )
-      and isinstance(
-        self._calc_3p_calibration_set_1_before_rv_expansion,
-        (int, float)
-      )
-    ):
+    calc_3p_state = self._calc_3p_state
+    if calc_3p_state is None:
       # TODO: Does this fail silently or loudly?
-      self.calibration_result = OperationResult.ABNORMAL_TERMINATION
-      self._calc_3p_calibration_set_1_before_calc = None
-      self._calc_3p_calibration_set_1_before_rv_main = None
-      self._calc_3p_calibration_set_1_before_rv_expansion = None
-      raise NonExecutableStateError  # TODO: Not verified
-
-    self._calc_3p_calibration_set_2_before_calc = self.calculation_value
-    self._calc_3p_calibration_set_2_before_rv_main = self.measurement_value
-    self._calc_3p_calibration_set_2_before_rv_expansion = (
-      expansion_unit.measurement_value
-    )
+      self._abort_calc_3p_calibration()
+
+    calc_3p_state.set_2_calc = self.calculation_value
+    calc_3p_state.set_2_rv_main = self.measurement_value
+    calc_3p_state.set_2_rv_expansion = expansion_unit.measurement_value
+  # ----------------------------------------------------------------------------
+
+  def _abort_calc_3p_calibration(self) -> NoReturn:
+    """
+    Abort a calculated-value three-point calibration: record the
+    abnormal result, discard the staged samples and raise.
+    """
+    self.calibration_result = _OPR_ABNORMAL
+    self._calc_3p_state = None
+    raise NON_EXECUTABLE_STATE_ERROR  # TODO: Not verified
   # ----------------------------------------------------------------------------
 
   def write_025_calc_3point_calibration_set_3_request(
@@ -3012,130 +3901,51 @@ class SensorUnit:
     For the operating procedure, refer to the “IL Series User's Manual”.
     """
     if setting_data != 1:
-      raise WriteDataOutsideValidRangeError
-    self.calibration_result = OperationResult.OPERATING
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
+    self.calibration_result = _OPR_OPERATING
 
     if not self.is_main_unit or self.connected_amplifier is None:
-      self.calibration_result = OperationResult.ABNORMAL_TERMINATION
-      self._calc_3p_calibration_set_1_before_calc = None
-      self._calc_3p_calibration_set_1_before_rv_main = None
-      self._calc_3p_calibration_set_1_before_rv_expansion = None
-      self._calc_3p_calibration_set_2_before_calc = None
-      self._calc_3p_calibration_set_2_before_rv_main = None
-      self._calc_3p_calibration_set_2_before_rv_expansion = None
-      raise NonExecutableStateError  # TODO: Not verified
+      self._abort_calc_3p_calibration()
 
     expansion_unit = self.connected_amplifier
 
-    if not isinstance(self.measurement_value, (int, float)):
-      self.calibration_result = OperationResult.ABNORMAL_TERMINATION
-      self._calc_3p_calibration_set_1_before_calc = None
-      self._calc_3p_calibration_set_1_before_rv_main = None
-      self._calc_3p_calibration_set_1_before_rv_expansion = None
-      self._calc_3p_calibration_set_2_before_calc = None
-      self._calc_3p_calibration_set_2_before_rv_main = None
-      self._calc_3p_calibration_set_2_before_rv_expansion = None
-      raise NonExecutableStateError  # TODO: Not verified
-
-    if not isinstance(expansion_unit.measurement_value, (int, float)):
-      self.calibration_result = OperationResult.ABNORMAL_TERMINATION
-      self._calc_3p_calibration_set_1_before_calc = None
-      self._calc_3p_calibration_set_1_before_rv_main = None
-      self._calc_3p_calibration_set_1_before_rv_expansion = None
-      self._calc_3p_calibration_set_2_before_calc = None
-      self._calc_3p_calibration_set_2_before_rv_main = None
-      self._calc_3p_calibration_set_2_before_rv_expansion = None
-      raise NonExecutableStateError  # TODO: Not verified
-
-    if not isinstance(self.calculation_value, (int, float)):
-      self.calibration_result = OperationResult.ABNORMAL_TERMINATION
-      self._calc_3p_calibration_set_1_before_calc = None
-      self._calc_3p_calibration_set_1_before_rv_main = None
-      self._calc_3p_calibration_set_1_before_rv_expansion = None
-      self._calc_3p_calibration_set_2_before_calc = None
-      self._calc_3p_calibration_set_2_before_rv_main = None
-      self._calc_3p_calibration_set_2_before_rv_expansion = None
-      raise NonExecutableStateError  # TODO: Not verified
+    if self.measurement_value is None:
+      self._abort_calc_3p_calibration()
+
+    if expansion_unit.measurement_value is None:
+      self._abort_calc_3p_calibration()
+
+    if self.calculation_value is None:
+      self._abort_calc_3p_calibration()
 
     if not self.calibration_use_user_settings:
       # TODO: Does this fail silently or loudly?
-      self.calibration_result = OperationResult.ABNORMAL_TERMINATION
-      self._calc_3p_calibration_set_1_before_calc = None
-      self._calc_3p_calibration_set_1_before_rv_main = None
-      self._calc_3p_calibration_set_1_before_rv_expansion = None
-      self._calc_3p_calibration_set_2_before_calc = None
-      self._calc_3p_calibration_set_2_before_rv_main = None
-      self._calc_3p_calibration_set_2_before_rv_expansion = None
-      raise NonExecutableStateError  # TODO: Not verified
+      self._abort_calc_3p_calibration()
 
     if not self.calc_calibration_mode == CalculationCalibrationMode.THREE_POINT:
       # TODO: Does this fail silently or loudly?
-      self.calibration_result = OperationResult.ABNORMAL_TERMINATION
-      self._calc_3p_calibration_set_1_before_calc = None
-      self._calc_3p_calibration_set_1_before_rv_main = None
-      self._calc_3p_calibration_set_1_before_rv_expansion = None
-      self._calc_3p_calibration_set_2_before_calc = None
-      self._calc_3p_calibration_set_2_before_rv_main = None
-      self._calc_3p_calibration_set_2_before_rv_expansion = None
-      raise NonExecutableStateError  # TODO: Not verified
+      self._abort_calc_3p_calibration()
 
     if self.calculation_mode == CalculationMode.OFF:
       # TODO: Does this fail silently or loudly?
-      self.calibration_result = OperationResult.ABNORMAL_TERMINATION
-      self._calc_3p_calibration_set_1_before_calc = None
-      self._calc_3p_calibration_set_1_before_rv_main = None
-      self._calc_3p_calibration_set_1_before_rv_expansion = None
-      self._calc_3p_calibration_set_2_before_calc = None
-      self._calc_3p_calibration_set_2_before_rv_main = None
-      self._calc_3p_calibration_set_2_before_rv_expansion = None
-      raise NonExecutableStateError  # TODO: Not verified
+      self._abort_calc_3p_calibration()
 
-    if not (
-      isinstance(
-        self._calc_3p_calibration_set_1_before_calc,
-        (int, float)
-      )
-      and isinstance(
-        self._calc_3p_calibration_set_1_before_rv_main,
-        (int, float)
-      )
-      and isinstance(
-        self._calc_3p_calibration_set_1_before_rv_expansion,
-        (int, float)
-      )
-      and isinstance(
-        self._calc_3p_calibration_set_2_before_calc,
-        (int, float)
-      )
-      and isinstance(
-        self._calc_3p_calibration_set_2_before_rv_main,
-        (int, float)
-      )
-      and isinstance(
-        self._calc_3p_calibration_set_2_before_rv_expansion,
-        (int, float)
-      )
+    calc_3p_state = self._calc_3p_state
+    if (
+      calc_3p_state is None
+      or calc_3p_state.set_2_calc is None
+      or calc_3p_state.set_2_rv_main is None
+      or calc_3p_state.set_2_rv_expansion is None
     ):
       # TODO: Does this fail silently or loudly?
-      self.calibration_result = OperationResult.ABNORMAL_TERMINATION
-      self._calc_3p_calibration_set_1_before_calc = None
-      self._calc_3p_calibration_set_1_before_rv_main = None
-      self._calc_3p_calibration_set_1_before_rv_expansion = None
-      self._calc_3p_calibration_set_2_before_calc = None
-      self._calc_3p_calibration_set_2_before_rv_main = None
-      self._calc_3p_calibration_set_2_before_rv_expansion = None
-      raise NonExecutableStateError  # TODO: Not verified
-
-    set_1_before_calc: float = self._calc_3p_calibration_set_1_before_calc
-    set_1_before_rv_main: float = self._calc_3p_calibration_set_1_before_rv_main
-    set_1_before_rv_expansion: float = (
-      self._calc_3p_calibration_set_1_before_rv_expansion
-    )
-    # set_2_before_calc: float = self._calc_3p_calibration_set_2_before_calc
-    set_2_before_rv_main: float = self._calc_3p_calibration_set_2_before_rv_main
-    set_2_before_rv_expansion: float = (
-      self._calc_3p_calibration_set_2_before_rv_expansion
-    )
+      self._abort_calc_3p_calibration()
+
+    set_1_before_calc: float = calc_3p_state.set_1_calc
+    set_1_before_rv_main: float = calc_3p_state.set_1_rv_main
+    set_1_before_rv_expansion: float = calc_3p_state.set_1_rv_expansion
+    # set_2_before_calc: float = calc_3p_state.set_2_calc
+    set_2_before_rv_main: float = calc_3p_state.set_2_rv_main
+    set_2_before_rv_expansion: float = calc_3p_state.set_2_rv_expansion
     set_3_before_calc: float = self.calculation_value
     # set_3_before_rv_main: float = self.measurement_value
     # set_3_before_rv_expansion: float = expansion_unit.measurement_value
@@ -3144,7 +3954,9 @@ class SensorUnit:
       (self.calc_3p_calibration_set_3 - self.calc_3p_calibration_set_1)
       / (set_3_before_calc - set_1_before_calc)
     )
-    coeff: float = -1 if self.calculation_mode.ADDITION else 1
+    coeff: float = (
+      -1 if self.calculation_mode is CalculationMode.ADDITION else 1
+    )
     calibration_factor_2: float = (
       coeff * (set_2_before_rv_expansion - set_1_before_rv_expansion)
       / (set_2_before_rv_main - set_1_before_rv_main)
@@ -3154,18 +3966,11 @@ class SensorUnit:
       (0.5 <= calibration_factor_1 <= 2.0)
       and (0.5 <= calibration_factor_2 <= 2.0)
     ):
-      self.calibration_result = OperationResult.ABNORMAL_TERMINATION
-      self._calc_3p_calibration_set_1_before_calc = None
-      self._calc_3p_calibration_set_1_before_rv_main = None
-      self._calc_3p_calibration_set_1_before_rv_expansion = None
-      self._calc_3p_calibration_set_2_before_calc = None
-      self._calc_3p_calibration_set_2_before_rv_main = None
-      self._calc_3p_calibration_set_2_before_rv_expansion = None
-      raise NonExecutableStateError  # TODO: Not verified
+      self._abort_calc_3p_calibration()
 
     # TODO: Implement calibration
     self.start_eeprom_write()
-    self.calibration_result = OperationResult.NORMAL_TERMINATION
+    self.calibration_result = _OPR_NORMAL
   # ----------------------------------------------------------------------------
 
   def write_026_diff_count_filter_1point_tuning_request(
@@ -3178,17 +3983,17 @@ class SensorUnit:
     For the operating procedure, refer to the “IL Series User's Manual”.
     """
     if setting_data != 1:
-      raise WriteDataOutsideValidRangeError
-    self.tuning_result = OperationResult.OPERATING
-    if not isinstance(self.judgment_value, (int, float)):
-      self.tuning_result = OperationResult.ABNORMAL_TERMINATION
-      raise NonExecutableStateError
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
+    self.tuning_result = _OPR_OPERATING
+    if self.judgment_value is None:
+      self.tuning_result = _OPR_ABNORMAL
+      raise NON_EXECUTABLE_STATE_ERROR
 
     new_high: float = abs(self.judgment_value * 2)
     new_low: float = abs(self.judgment_value / 2)
     self.change_high_threshold(new_high)
     self.change_low_threshold(new_low)
-    self.tuning_result = OperationResult.NORMAL_TERMINATION
+    self.tuning_result = _OPR_NORMAL
   # ----------------------------------------------------------------------------
 
   def write_027_diff_count_filter_2point_1st_point_request(
@@ -3200,12 +4005,12 @@ class SensorUnit:
     For the operating procedure, refer to the “IL Series User's Manual”.
     """
     if setting_data != 1:
-      raise WriteDataOutsideValidRangeError
-    self.tuning_result = OperationResult.OPERATING
-    if not isinstance(self.measurement_value, (int, float)):
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
+    self.tuning_result = _OPR_OPERATING
+    if self.measurement_value is None:
       self._two_point_diff_count_1st_point = None
-      self.tuning_result = OperationResult.ABNORMAL_TERMINATION
-      raise NonExecutableStateError
+      self.tuning_result = _OPR_ABNORMAL
+      raise NON_EXECUTABLE_STATE_ERROR
 
     self._two_point_diff_count_1st_point = self.measurement_value
   # ----------------------------------------------------------------------------
@@ -3219,15 +4024,15 @@ class SensorUnit:
     For the operating procedure, refer to the “IL Series User's Manual”.
     """
     if setting_data != 1:
-      raise WriteDataOutsideValidRangeError
-    self.tuning_result = OperationResult.OPERATING
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
+    self.tuning_result = _OPR_OPERATING
     if (
-      not isinstance(self.measurement_value, (int, float))
-      or not isinstance(self._two_point_diff_count_1st_point, (int, float))
+      self.measurement_value is None
+      or self._two_point_diff_count_1st_point is None
     ):
       self._two_point_diff_count_1st_point = None
-      self.tuning_result = OperationResult.ABNORMAL_TERMINATION
-      raise NonExecutableStateError
+      self.tuning_result = _OPR_ABNORMAL
+      raise NON_EXECUTABLE_STATE_ERROR
 
     _two_point_diff_count_2nd_point = self.measurement_value
     expected_step_size = (
@@ -3237,7 +4042,7 @@ class SensorUnit:
     new_low = abs(expected_step_size / 2)
     self.change_high_threshold(new_high)
     self.change_low_threshold(new_low)
-    self.tuning_result = OperationResult.NORMAL_TERMINATION
+    self.tuning_result = _OPR_NORMAL
   # ----------------------------------------------------------------------------
 
   def read_033_sensor_amplifier_error(self) -> int:
@@ -3270,29 +4075,46 @@ class SensorUnit:
     Bit3:Alarm output
     """
     return (
-      2**0 * self.high_output
-      + 2**1 * self.low_output
-      + 2**2 * self.go_output
-      + 2**3 * self.alarm_output
+      self.high_output
+      | self.low_output << 1
+      | self.go_output << 2
+      | self.alarm_output << 3
     )
   # ----------------------------------------------------------------------------
 
-  def read_037_judgment_value(self) -> int:
+  def _bounded_mm_int(
+    self,
+    value: float | None,
+    require_main: bool = False
+  ) -> int:
     """
-    Indicates the judgment value (P.V. value).
+    Shared unavailable/saturation/scale pipeline behind the value reads.
 
-    Parameter range: -99.999 to +99.999
+    Returns -99998 when the laser is off, the value is unavailable or
+    (with require_main) the unit is not the main unit, saturates at
+    +-99999 outside the measuring range and scales in-range values to
+    Protocol integers.
     """
     if (
       not self.laser_active
-      or not isinstance(self.judgment_value, (int, float))
+      or value is None
+      or (require_main and not self.is_main_unit)
     ):
       return -99998
-    if self.judgment_value > self.upper_bound:
+    if value > self.upper_bound:
       return 99999
-    if self.judgment_value < self.lower_bound:
+    if value < self.lower_bound:
       return -99999
-    return self.mm_to_int(self.judgment_value)
+    return int(value * self._int_scale)
+  # ----------------------------------------------------------------------------
+
+  def read_037_judgment_value(self) -> int:
+    """
+    Indicates the judgment value (P.V. value).
+
+    Parameter range: -99.999 to +99.999
+    """
+    return self._bounded_mm_int(self.judgment_value)
   # ----------------------------------------------------------------------------
 
   def read_038_internal_measurement_value(self) -> int:
@@ -3301,16 +4123,7 @@ class SensorUnit:
 
     Parameter range:-99.999 to +99.999
     """
-    if (
-      not self.laser_active
-      or not isinstance(self.measurement_value, (int, float))
-    ):
-      return -99998
-    if self.measurement_value > self.upper_bound:
-      return 99999
-    if self.measurement_value < self.lower_bound:
-      return -99999
-    return self.mm_to_int(self.measurement_value)
+    return self._bounded_mm_int(self.measurement_value)
   # ----------------------------------------------------------------------------
 
   def read_039_peak_hold_value_during_hold_period(self) -> int:
@@ -3356,17 +4169,7 @@ class SensorUnit:
 
     Parameter range: -99.999 to +99.999
     """
-    if (
-      not self.laser_active
-      or not isinstance(self.calculation_value, (int, float))
-      or not self.is_main_unit
-    ):
-      return -99998
-    if self.calculation_value > self.upper_bound:
-      return 99999
-    if self.calculation_value < self.lower_bound:
-      return -99999
-    return self.mm_to_int(self.calculation_value)
+    return self._bounded_mm_int(self.calculation_value, require_main=True)
   # ----------------------------------------------------------------------------
 
   def read_042_analog_output_value(self) -> int:
@@ -3378,14 +4181,14 @@ class SensorUnit:
     4 to 20 mA: +4.00 to +20.00 (+3.00 for error)
     OFF: Fixed to 0
     """
-    if not self.is_main_unit or self.analog_output_mode == AnalogOutputMode.OFF:
+    if (
+      not self.is_main_unit
+      or self._analog_output_mode is AnalogOutputMode.OFF
+    ):
       return 0
     # The documentation is not super clear on this, but it looks like
     # Current only has 2 digit precision, while Voltage has 3 digit precision
-    if self.analog_output_mode == AnalogOutputMode.CURRENT_4_TO_20:
-      return int(self.analog_value * 100)
-    else:
-      return int(self.analog_value * 1000)
+    return int(self.analog_value * self._analog_read_scale)
   # ----------------------------------------------------------------------------
 
   def read_043_bank_status(self) -> int:
@@ -3415,7 +4218,7 @@ class SensorUnit:
     0: During Sampling
     1: Not during sampling
     """
-    return 1 * self.timing_input
+    return int(self.timing_input)
   # ----------------------------------------------------------------------------
 
   def read_050_laser_emission_stop_status(self) -> int:
@@ -3430,7 +4233,7 @@ class SensorUnit:
     1:Laser stopped (Emission stop input ON/Laser error/
     Sensor head error)
     """
-    return 1 * (not self.laser_active)
+    return int(not self.laser_active)
   # ----------------------------------------------------------------------------
 
   def read_051_abnormal_setting(self) -> int:
@@ -3441,7 +4244,7 @@ class SensorUnit:
     1:Abnormal setting
     """
     # TODO: Implement real detection of abnormal settings
-    return 1 * self.abnormal_settings
+    return int(self.abnormal_settings)
   # ----------------------------------------------------------------------------
 
   def read_052_external_input_status(self) -> int:
@@ -3460,10 +4263,10 @@ class SensorUnit:
     Bit3:External input 4
     """
     output: int = 0
-    output += 2**0 * (self.external_input_1)
-    output += 2**1 * (self.external_input_2)
-    output += 2**2 * (self.external_input_3)
-    output += 2**3 * (self.external_input_4)
+    output |= self.external_input_1
+    output |= self.external_input_2 << 1
+    output |= self.external_input_3 << 2
+    output |= self.external_input_4 << 3
     return output
   # ----------------------------------------------------------------------------
 
@@ -3523,10 +4326,9 @@ class SensorUnit:
     011: 1 to 5 V
     100: 4 to 20 mA
     """
-    output: int = 0
-    output += 1 * int(self.transistor_mode)
+    output: int = int(self.transistor_mode)
     if self.is_main_unit:
-      output += 2 * int(self.analog_output_mode)
+      output |= int(self._analog_output_mode) << 1
     return output
   # ----------------------------------------------------------------------------
 
@@ -3575,8 +4377,8 @@ class SensorUnit:
     Parameter range: -99.999 to +99.999
     (initial value: +5.000)
     """
-    if setting_data not in range(-99999, 99999 + 1):
-      raise WriteDataOutsideValidRangeError
+    if not -99999 <= setting_data <= 99999:
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
     self.change_high_threshold(self.int_to_mm(setting_data), bank_index)
   # ----------------------------------------------------------------------------
 
@@ -3601,8 +4403,8 @@ class SensorUnit:
     Parameter range: -99.999 to +99.999
     (initial value: -5.000)
     """
-    if setting_data not in range(-99999, 99999 + 1):
-      raise WriteDataOutsideValidRangeError
+    if not -99999 <= setting_data <= 99999:
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
     self.change_low_threshold(self.int_to_mm(setting_data), bank_index)
   # ----------------------------------------------------------------------------
 
@@ -3627,8 +4429,8 @@ class SensorUnit:
     Parameter range: -99.999 to +99.999
     (initial value: 0)
     """
-    if setting_data not in range(-99999, 99999 + 1):
-      raise WriteDataOutsideValidRangeError
+    if not -99999 <= setting_data <= 99999:
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
     self.change_shift_target(self.int_to_mm(setting_data), bank_index)
   # ----------------------------------------------------------------------------
 
@@ -3644,7 +4446,7 @@ class SensorUnit:
     (initial value: +10.000)
     """
     # if not self.is_main_unit:
-    #   raise NonExecutableStateError
+    #   raise NON_EXECUTABLE_STATE_ERROR
     return self.mm_to_int(self.read_analog_upper_limit(bank_index))
   # ----------------------------------------------------------------------------
 
@@ -3661,9 +4463,9 @@ class SensorUnit:
     (initial value: +10.000)
     """
     if not self.is_main_unit:
-      raise QueryWriteProtectedError
-    if setting_data not in range(-99999, 99999 + 1):
-      raise WriteDataOutsideValidRangeError
+      raise QUERY_WRITE_PROTECTED_ERROR
+    if not -99999 <= setting_data <= 99999:
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
     self.change_analog_upper_limit(self.int_to_mm(setting_data), bank_index)
   # ----------------------------------------------------------------------------
 
@@ -3678,7 +4480,7 @@ class SensorUnit:
     (initial value: 1.0000)
     """
     # if not self.is_main_unit:
-    #   raise NonExecutableStateError
+    #   raise NON_EXECUTABLE_STATE_ERROR
     return self.mm_to_int(self.read_analog_lower_limit(bank_index))
   # ----------------------------------------------------------------------------
 
@@ -3694,9 +4496,9 @@ class SensorUnit:
     (initial value: 1.0000)
     """
     if not self.is_main_unit:
-      raise QueryWriteProtectedError
-    if setting_data not in range(-99999, 99999 + 1):
-      raise WriteDataOutsideValidRangeError
+      raise QUERY_WRITE_PROTECTED_ERROR
+    if not -99999 <= setting_data <= 99999:
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
     self.change_analog_lower_limit(self.int_to_mm(setting_data), bank_index)
   # ----------------------------------------------------------------------------
 
@@ -3708,7 +4510,7 @@ class SensorUnit:
     0: Unlock
     1: Key lock
     """
-    return 1 * self.key_locked
+    return int(self.key_locked)
   # ----------------------------------------------------------------------------
 
   def write_097_key_lock_function(self, setting_data: int) -> None:
@@ -3719,8 +4521,8 @@ class SensorUnit:
     0: Unlock
     1: Key lock
     """
-    if setting_data not in (0, 1):
-      raise WriteDataOutsideValidRangeError
+    if not 0 <= setting_data <= 1:
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
     self.key_locked = bool(setting_data)
     self.start_eeprom_write()
   # ----------------------------------------------------------------------------
@@ -3752,8 +4554,8 @@ class SensorUnit:
     2: Switches to bank 2.
     3: Switches to bank 3.
     """
-    if setting_data not in (0, 1, 2, 3):
-      raise WriteDataOutsideValidRangeError
+    if not 0 <= setting_data <= 3:
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
     if not self.switch_banks_via_external_input:
       self.change_bank(setting_data)  # type: ignore[arg-type]  # Mypy is dumb
   # ----------------------------------------------------------------------------
@@ -3773,7 +4575,7 @@ class SensorUnit:
     0:Timing input OFF
     1:Timing input ON
     """
-    return 1 * self.stored_timing_input
+    return int(self.stored_timing_input)
   # ----------------------------------------------------------------------------
 
   def write_099_timing_input(self, setting_data: int) -> None:
@@ -3791,8 +4593,8 @@ class SensorUnit:
     0:Timing input OFF
     1:Timing input ON
     """
-    if setting_data not in (0, 1):
-      raise WriteDataOutsideValidRangeError
+    if not 0 <= setting_data <= 1:
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
     self.stored_timing_input = bool(setting_data)
     self.start_eeprom_write()
     # Update the internal state and process edge triggers
@@ -3814,7 +4616,7 @@ class SensorUnit:
     0:Emission stop input OFF
     1:Emission stop input ON
     """
-    return 1 * self.stored_laser_emission_stop
+    return int(self.stored_laser_emission_stop)
   # ----------------------------------------------------------------------------
 
   def write_100_laser_emission_on_stop_input(self, setting_data: int) -> None:
@@ -3832,8 +4634,8 @@ class SensorUnit:
     0:Emission stop input OFF
     1:Emission stop input ON
     """
-    if setting_data not in (0, 1):
-      raise WriteDataOutsideValidRangeError
+    if not 0 <= setting_data <= 1:
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
     self.stored_laser_emission_stop = bool(setting_data)
     self.start_eeprom_write()
   # ----------------------------------------------------------------------------
@@ -3865,9 +4667,9 @@ class SensorUnit:
     4: Zero shift value screen
     5: CALC value screen
     """
-    if setting_data not in (0, 1, 2, 3, 4, 5):
-      raise WriteDataOutsideValidRangeError
-    self.subdisplay_screen_mode = SubdisplayScreenMode(setting_data)
+    if not 0 <= setting_data <= 5:
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
+    self.subdisplay_screen_mode = _cached_member(SubdisplayScreenMode, setting_data)
     self.start_eeprom_write()
   # ----------------------------------------------------------------------------
 
@@ -3895,10 +4697,9 @@ class SensorUnit:
     011: 1 to 5V
     100: 4 to 20mA
     """
-    output: int = 0
-    output += 1 * int(self.future_transistor_mode)
+    output: int = int(self.future_transistor_mode)
     if self.is_main_unit:
-      output += 2 * int(self.future_analog_output_mode)
+      output |= int(self.future_analog_output_mode) << 1
     return output
   # ----------------------------------------------------------------------------
 
@@ -3926,16 +4727,15 @@ class SensorUnit:
     011: 1 to 5V
     100: 4 to 20mA
     """
+    # Valid frames are bit_123 0b000..0b100 with no higher bits set,
+    # which is exactly setting_data 0b0000..0b1001: one chained compare
+    # replaces the mask/shift/range cascade.
+    if not 0b0000 <= setting_data <= 0b1001:
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
     bit_0: int = setting_data & 0b0001
-    bit_123: int = (setting_data & 0b1110) >> 1
-    rest_bits: int = setting_data >> 4
-    if (
-      rest_bits != 0
-      or bit_123 not in (0b000, 0b001, 0b010, 0b011, 0b100)
-    ):
-      raise WriteDataOutsideValidRangeError
-    self.future_transistor_mode = TransistorMode(bit_0)
-    self.future_analog_output_mode = AnalogOutputMode(bit_123)
+    bit_123: int = setting_data >> 1
+    self.future_transistor_mode = _cached_member(TransistorMode, bit_0)
+    self.future_analog_output_mode = _cached_member(AnalogOutputMode, bit_123)
   # ----------------------------------------------------------------------------
 
   def read_106_tolerance_tuning_setting_range(self) -> int:
@@ -3953,8 +4753,8 @@ class SensorUnit:
 
     Parameter range: 0.000 to 99.999
     """
-    if setting_data not in range(0, 99999 + 1):
-      raise WriteDataOutsideValidRangeError
+    if not 0 <= setting_data <= 99999:
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
     self.tolerance_setting_range = self.int_to_mm(setting_data)
     self.start_eeprom_write()
   # ----------------------------------------------------------------------------
@@ -3967,7 +4767,7 @@ class SensorUnit:
     0:Initial state
     1:User setting
     """
-    return 1 * self.calibration_use_user_settings
+    return int(self.calibration_use_user_settings)
   # ----------------------------------------------------------------------------
 
   def write_107_calibration_function(self, setting_data: int) -> None:
@@ -3978,8 +4778,8 @@ class SensorUnit:
     0:Initial state
     1:User setting
     """
-    if setting_data not in (0, 1):
-      raise WriteDataOutsideValidRangeError
+    if not 0 <= setting_data <= 1:
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
     self.calibration_use_user_settings = bool(setting_data)
     self.start_eeprom_write()
   # ----------------------------------------------------------------------------
@@ -3999,8 +4799,8 @@ class SensorUnit:
 
     Parameter range: -99.999 to 99.999 (initial value: 0.000)
     """
-    if setting_data not in range(-99999, 99999 + 1):
-      raise WriteDataOutsideValidRangeError
+    if not -99999 <= setting_data <= 99999:
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
     self.calibration_set_1 = self.int_to_mm(setting_data)
     self.start_eeprom_write()
   # ----------------------------------------------------------------------------
@@ -4020,8 +4820,8 @@ class SensorUnit:
 
     Parameter range: -99.999 to 99.999 (initial value: +5.000)
     """
-    if setting_data not in range(-99999, 99999 + 1):
-      raise WriteDataOutsideValidRangeError
+    if not -99999 <= setting_data <= 99999:
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
     self.calibration_set_2 = self.int_to_mm(setting_data)
     self.start_eeprom_write()
   # ----------------------------------------------------------------------------
@@ -4051,10 +4851,10 @@ class SensorUnit:
     2:Calculated 3-p calibration
     """
     if not self.is_main_unit:
-      raise QueryWriteProtectedError
-    if setting_data not in (0, 1, 2):
-      raise WriteDataOutsideValidRangeError
-    self.calc_calibration_mode = CalculationCalibrationMode(setting_data)
+      raise QUERY_WRITE_PROTECTED_ERROR
+    if not 0 <= setting_data <= 2:
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
+    self.calc_calibration_mode = _cached_member(CalculationCalibrationMode, setting_data)
     self.start_eeprom_write()
   # ----------------------------------------------------------------------------
 
@@ -4081,9 +4881,9 @@ class SensorUnit:
     (initial value: +5.000)
     """
     if not self.is_main_unit:
-      raise QueryWriteProtectedError
-    if setting_data not in range(-99999, 99999 + 1):
-      raise WriteDataOutsideValidRangeError
+      raise QUERY_WRITE_PROTECTED_ERROR
+    if not -99999 <= setting_data <= 99999:
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
     self.calc_2p_calibration_set_1 = self.int_to_mm(setting_data)
     self.start_eeprom_write()
   # ----------------------------------------------------------------------------
@@ -4109,9 +4909,9 @@ class SensorUnit:
     (initial value: +10.000)
     """
     if not self.is_main_unit:
-      raise QueryWriteProtectedError
-    if setting_data not in range(-99999, 99999 + 1):
-      raise WriteDataOutsideValidRangeError
+      raise QUERY_WRITE_PROTECTED_ERROR
+    if not -99999 <= setting_data <= 99999:
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
     self.calc_2p_calibration_set_2 = self.int_to_mm(setting_data)
     self.start_eeprom_write()
   # ----------------------------------------------------------------------------
@@ -4139,9 +4939,9 @@ class SensorUnit:
     (initial value: +5.000)
     """
     if not self.is_main_unit:
-      raise QueryWriteProtectedError
-    if setting_data not in range(-99999, 99999 + 1):
-      raise WriteDataOutsideValidRangeError
+      raise QUERY_WRITE_PROTECTED_ERROR
+    if not -99999 <= setting_data <= 99999:
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
     self.calc_3p_calibration_set_1 = self.int_to_mm(setting_data)
     self.start_eeprom_write()
   # ----------------------------------------------------------------------------
@@ -4169,9 +4969,9 @@ class SensorUnit:
     (initial value: +10.000)
     """
     if not self.is_main_unit:
-      raise QueryWriteProtectedError
-    if setting_data not in range(-99999, 99999 + 1):
-      raise WriteDataOutsideValidRangeError
+      raise QUERY_WRITE_PROTECTED_ERROR
+    if not -99999 <= setting_data <= 99999:
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
     self.calc_3p_calibration_set_3 = self.int_to_mm(setting_data)
     self.start_eeprom_write()
   # ----------------------------------------------------------------------------
@@ -4198,13 +4998,18 @@ class SensorUnit:
     2: Subtraction mode
     """
     if not self.is_main_unit or self.connected_amplifier is None:
-      raise QueryWriteProtectedError
-    if setting_data not in (0, 1, 2):
-      raise WriteDataOutsideValidRangeError
-    self.calculation_mode = CalculationMode(setting_data)
-    if self.calculation_mode != CalculationMode.OFF:
-      self.connected_amplifier.filter_setting = self.filter_setting
-      self.connected_amplifier.sampling_cycle = self.sampling_cycle
+      raise QUERY_WRITE_PROTECTED_ERROR
+    if not 0 <= setting_data <= 2:
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
+    self.calculation_mode = _cached_member(CalculationMode, setting_data)
+    if self.calculation_mode is not CalculationMode.OFF:
+      # Only propagate settings that actually differ: the amplifier
+      # setters refresh derived state on every assignment.
+      amplifier = self.connected_amplifier
+      if amplifier.filter_setting is not self.filter_setting:
+        amplifier.filter_setting = self.filter_setting
+      if amplifier.sampling_cycle is not self.sampling_cycle:
+        amplifier.sampling_cycle = self.sampling_cycle
     self.start_eeprom_write()
   # ----------------------------------------------------------------------------
 
@@ -4216,7 +5021,7 @@ class SensorUnit:
     0:n or
     1: rEv
     """
-    return 1 * self.reversed_measurement_direction
+    return int(self.reversed_measurement_direction)
   # ----------------------------------------------------------------------------
 
   def write_131_measurement_direction(self, setting_data: int) -> None:
@@ -4227,8 +5032,8 @@ class SensorUnit:
     0:n or
     1: rEv
     """
-    if setting_data not in (0, 1):
-      raise WriteDataOutsideValidRangeError
+    if not 0 <= setting_data <= 1:
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
     self.reversed_measurement_direction = bool(setting_data)
     self.start_eeprom_write()
   # ----------------------------------------------------------------------------
@@ -4258,9 +5063,9 @@ class SensorUnit:
     3: 2 ms
     4: 5 ms
     """
-    if setting_data not in (0, 1, 2, 3, 4):
-      raise WriteDataOutsideValidRangeError
-    self.sampling_cycle = SamplingCycle(setting_data)
+    if not 0 <= setting_data <= 4:
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
+    self.sampling_cycle = _cached_member(SamplingCycle, setting_data)
     self.start_eeprom_write()
   # ----------------------------------------------------------------------------
 
@@ -4312,9 +5117,9 @@ class SensorUnit:
     13: Diff. count filter
     14: High-pass filter
     """
-    if setting_data not in (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14):
-      raise WriteDataOutsideValidRangeError
-    self.filter_setting = FilterSetting(setting_data)
+    if not 0 <= setting_data <= 14:
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
+    self.filter_setting = _cached_member(FilterSetting, setting_data)
     self.start_eeprom_write()
   # ----------------------------------------------------------------------------
 
@@ -4326,7 +5131,7 @@ class SensorUnit:
     0: N.O.
     1: N.C.
     """
-    return 1 * self.output_mode_normally_closed
+    return int(self.output_mode_normally_closed)
   # ----------------------------------------------------------------------------
 
   def write_134_output_mode(self, setting_data: int) -> None:
@@ -4337,8 +5142,8 @@ class SensorUnit:
     0: N.O.
     1: N.C.
     """
-    if setting_data not in (0, 1):
-      raise WriteDataOutsideValidRangeError
+    if not 0 <= setting_data <= 1:
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
     self.output_mode_normally_closed = bool(setting_data)
     self.start_eeprom_write()
   # ----------------------------------------------------------------------------
@@ -4370,9 +5175,9 @@ class SensorUnit:
     4:Auto peak hold
     5:Auto bottom hold
     """
-    if setting_data not in (0, 1, 2, 3, 4, 5):
-      raise WriteDataOutsideValidRangeError
-    self.hold_function_setting = HoldFunctionSetting(setting_data)
+    if not 0 <= setting_data <= 5:
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
+    self.hold_function_setting = _cached_member(HoldFunctionSetting, setting_data)
     self.start_eeprom_write()
   # ----------------------------------------------------------------------------
 
@@ -4393,8 +5198,8 @@ class SensorUnit:
     Parameter range: -99.999 to +99.999
     (initial value: +1.000)
     """
-    if setting_data not in range(-99999, 99999 + 1):
-      raise WriteDataOutsideValidRangeError
+    if not -99999 <= setting_data <= 99999:
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
     self.auto_trigger_level = self.int_to_mm(setting_data)
     self.start_eeprom_write()
   # ----------------------------------------------------------------------------
@@ -4407,7 +5212,7 @@ class SensorUnit:
     0:Level
     1:Edge
     """
-    return 1 * self.timing_input_on_edge
+    return int(self.timing_input_on_edge)
   # ----------------------------------------------------------------------------
 
   def write_138_timing_input_setting(self, setting_data: int) -> None:
@@ -4418,8 +5223,8 @@ class SensorUnit:
     0:Level
     1:Edge
     """
-    if setting_data not in (0, 1):
-      raise WriteDataOutsideValidRangeError
+    if not 0 <= setting_data <= 1:
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
     self.timing_input_on_edge = bool(setting_data)
     self.start_eeprom_write()
   # ----------------------------------------------------------------------------
@@ -4447,9 +5252,9 @@ class SensorUnit:
     2:Off delay
     3:One-shot
     """
-    if setting_data not in (0, 1, 2, 3):
-      raise WriteDataOutsideValidRangeError
-    self.delay_timer_setting = DelayTimerSetting(setting_data)
+    if not 0 <= setting_data <= 3:
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
+    self.delay_timer_setting = _cached_member(DelayTimerSetting, setting_data)
     self.start_eeprom_write()
   # ----------------------------------------------------------------------------
 
@@ -4468,19 +5273,37 @@ class SensorUnit:
 
     Parameter range: 5 to 9999 (Initial value: 60)
     """
-    if setting_data not in range(5, 9999 + 1):
-      raise WriteDataOutsideValidRangeError
+    if not 5 <= setting_data <= 9999:
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
     self.timer_duration = setting_data
     self.start_eeprom_write()
   # ----------------------------------------------------------------------------
 
+  @property
+  def hysteresis(self) -> float:
+    """
+    Get the hysteresis width applied around thresholds and triggers.
+    """
+    return self._hysteresis
+  # ----------------------------------------------------------------------------
+
+  @hysteresis.setter
+  def hysteresis(self, value: float) -> None:
+    """
+    Set the hysteresis width and refresh the protocol int that
+    read_141 serves.
+    """
+    self._hysteresis = value
+    self._hysteresis_raw = self.mm_to_int(value)
+  # ----------------------------------------------------------------------------
+
   def read_141_hyseresis(self) -> int:
     """
     Set up hysteresis.
 
     Parameter range: 0.000 to 99.999
     """
-    return self.mm_to_int(self.hysteresis)
+    return self._hysteresis_raw
   # ----------------------------------------------------------------------------
 
   def write_141_hyseresis(self, setting_data: int) -> None:
@@ -4489,9 +5312,12 @@ class SensorUnit:
 
     Parameter range: 0.000 to 99.999
     """
-    if setting_data not in range(0, 99999 + 1):
-      raise WriteDataOutsideValidRangeError
+    if not 0 <= setting_data <= 99999:
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
     self.hysteresis = self.int_to_mm(setting_data)
+    # Keep the exact protocol int: the float round trip truncates one
+    # count low for some values.
+    self._hysteresis_raw = setting_data
     self.start_eeprom_write()
   # ----------------------------------------------------------------------------
 
@@ -4517,13 +5343,31 @@ class SensorUnit:
     2:Bank
     """
     if not self.is_main_unit:
-      raise QueryWriteProtectedError
-    if setting_data not in (0, 1, 2):
-      raise WriteDataOutsideValidRangeError
-    self.analog_output_scaling_mode = AnalogOutputScalingMode(setting_data)
+      raise QUERY_WRITE_PROTECTED_ERROR
+    if not 0 <= setting_data <= 2:
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
+    self.analog_output_scaling_mode = _cached_member(AnalogOutputScalingMode, setting_data)
     self.start_eeprom_write()
   # ----------------------------------------------------------------------------
 
+  @property
+  def free_analog_upper_limit(self) -> float:
+    """
+    Get the free range upper limit of the analog output.
+    """
+    return self._free_analog_upper_limit
+  # ----------------------------------------------------------------------------
+
+  @free_analog_upper_limit.setter
+  def free_analog_upper_limit(self, value: float) -> None:
+    """
+    Set the free range upper limit and refresh the protocol int that
+    read_143 serves.
+    """
+    self._free_analog_upper_limit = value
+    self._free_analog_upper_limit_raw = self.mm_to_int(value)
+  # ----------------------------------------------------------------------------
+
   def read_143_analog_output_upper_limit_value(self) -> int:
     """
     Set up upper limit of analog output.
@@ -4531,7 +5375,7 @@ class SensorUnit:
     Parameter range: -99.999 to 99.999
     (Initial value: +10.000)
     """
-    return self.mm_to_int(self.free_analog_upper_limit)
+    return self._free_analog_upper_limit_raw
   # ----------------------------------------------------------------------------
 
   def write_143_analog_output_upper_limit_value(
@@ -4545,18 +5389,37 @@ class SensorUnit:
     (Initial value: +10.000)
     """
     if not self.is_main_unit:
-      raise QueryWriteProtectedError
-    if setting_data not in range(-99999, 99999 + 1):
-      raise WriteDataOutsideValidRangeError
+      raise QUERY_WRITE_PROTECTED_ERROR
+    if not -99999 <= setting_data <= 99999:
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
     value: float = self.int_to_mm(setting_data)
     if self.analog_output_scaling_mode == AnalogOutputScalingMode.BANK:
       # TODO: not verified, may fail siltently or change the free range value
-      raise NonExecutableStateError
+      raise NON_EXECUTABLE_STATE_ERROR
     elif self.analog_output_scaling_mode == AnalogOutputScalingMode.FREE_RANGE:
       self.free_analog_upper_limit = value
+      self._free_analog_upper_limit_raw = setting_data
       self.start_eeprom_write()
     else:
-      raise QueryWriteProtectedError  # could also be NonExecutableStateError
+      raise QUERY_WRITE_PROTECTED_ERROR  # could also be NonExecutableStateError
+  # ----------------------------------------------------------------------------
+
+  @property
+  def free_analog_lower_limit(self) -> float:
+    """
+    Get the free range lower limit of the analog output.
+    """
+    return self._free_analog_lower_limit
+  # ----------------------------------------------------------------------------
+
+  @free_analog_lower_limit.setter
+  def free_analog_lower_limit(self, value: float) -> None:
+    """
+    Set the free range lower limit and refresh the protocol int that
+    read_144 serves.
+    """
+    self._free_analog_lower_limit = value
+    self._free_analog_lower_limit_raw = self.mm_to_int(value)
   # ----------------------------------------------------------------------------
 
   def read_144_analog_output_lower_limit_value(self) -> int:
@@ -4566,7 +5429,7 @@ class SensorUnit:
     Parameter range: -99.999 to 99.999
     (initial value: -10.000)
     """
-    return self.mm_to_int(self.free_analog_lower_limit)
+    return self._free_analog_lower_limit_raw
   # ----------------------------------------------------------------------------
 
   def write_144_analog_output_lower_limit_value(
@@ -4580,18 +5443,19 @@ class SensorUnit:
     (initial value: -10.000)
     """
     if not self.is_main_unit:
-      raise QueryWriteProtectedError
-    if setting_data not in range(-99999, 99999 + 1):
-      raise WriteDataOutsideValidRangeError
+      raise QUERY_WRITE_PROTECTED_ERROR
+    if not -99999 <= setting_data <= 99999:
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
     value: float = self.int_to_mm(setting_data)
     if self.analog_output_scaling_mode == AnalogOutputScalingMode.BANK:
       # TODO: not verified, may fail siltently or change the free range value
-      raise NonExecutableStateError
+      raise NON_EXECUTABLE_STATE_ERROR
     elif self.analog_output_scaling_mode == AnalogOutputScalingMode.FREE_RANGE:
       self.free_analog_lower_limit = value
+      self._free_analog_lower_limit_raw = setting_data
       self.start_eeprom_write()
     else:
-      raise QueryWriteProtectedError  # could also be NonExecutableStateError
+      raise QUERY_WRITE_PROTECTED_ERROR  # could also be NonExecutableStateError
   # ----------------------------------------------------------------------------
 
   def read_145_external_input(self) -> int:
@@ -4603,7 +5467,7 @@ class SensorUnit:
     0:Initial state
     1:User setting
     """
-    return 1 * self.external_input_use_user_settings
+    return int(self.external_input_use_user_settings)
   # ----------------------------------------------------------------------------
 
   def write_145_external_input(self, setting_data: int) -> None:
@@ -4615,9 +5479,11 @@ class SensorUnit:
     0:Initial state
     1:User setting
     """
-    if setting_data not in (0, 1):
-      raise WriteDataOutsideValidRangeError
+    if not 0 <= setting_data <= 1:
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
     self.external_input_use_user_settings = bool(setting_data)
+    # Wake the input thread to re-derive timing input from the new setting
+    self._loop.call_soon_threadsafe(self._input_event.set)
     self.start_eeprom_write()
   # ----------------------------------------------------------------------------
 
@@ -4646,9 +5512,9 @@ class SensorUnit:
     3:Laser emission stop input
     4:Not used
     """
-    if setting_data not in (0, 1, 2, 3, 4):
-      raise WriteDataOutsideValidRangeError
-    self.external_input_1_setting = ExternalInput1Setting(setting_data)
+    if not 0 <= setting_data <= 4:
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
+    self.external_input_1_setting = _cached_member(ExternalInput1Setting, setting_data)
     self.start_eeprom_write()
   # ----------------------------------------------------------------------------
 
@@ -4677,9 +5543,9 @@ class SensorUnit:
     3:Laser emission stop input
     4:Not used
     """
-    if setting_data not in (0, 1, 2, 3, 4):
-      raise WriteDataOutsideValidRangeError
-    self.external_input_2_setting = ExternalInput2Setting(setting_data)
+    if not 0 <= setting_data <= 4:
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
+    self.external_input_2_setting = _cached_member(ExternalInput2Setting, setting_data)
     self.start_eeprom_write()
   # ----------------------------------------------------------------------------
 
@@ -4708,9 +5574,11 @@ class SensorUnit:
     3:Laser emission stop input
     4:Not used
     """
-    if setting_data not in (0, 1, 2, 3, 4):
-      raise WriteDataOutsideValidRangeError
-    self.external_input_3_setting = ExternalInput3Setting(setting_data)
+    if not 0 <= setting_data <= 4:
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
+    self.external_input_3_setting = _cached_member(ExternalInput3Setting, setting_data)
+    # Wake the input thread to re-derive timing input from the new setting
+    self._loop.call_soon_threadsafe(self._input_event.set)
     self.start_eeprom_write()
   # ----------------------------------------------------------------------------
 
@@ -4737,9 +5605,9 @@ class SensorUnit:
     2:Bank B input
     3:Laser emission stop input
     """
-    if setting_data not in (0, 1, 2, 3):
-      raise WriteDataOutsideValidRangeError
-    self.external_input_4_setting = ExternalInput4Setting(setting_data)
+    if not 0 <= setting_data <= 3:
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
+    self.external_input_4_setting = _cached_member(ExternalInput4Setting, setting_data)
     self.start_eeprom_write()
   # ----------------------------------------------------------------------------
 
@@ -4751,7 +5619,7 @@ class SensorUnit:
     0:Button
     1:External input
     """
-    return 1 * self.switch_banks_via_external_input
+    return int(self.switch_banks_via_external_input)
   # ----------------------------------------------------------------------------
 
   def write_150_bank_switching_method(self, setting_data: int) -> None:
@@ -4762,8 +5630,8 @@ class SensorUnit:
     0:Button
     1:External input
     """
-    if setting_data not in (0, 1):
-      raise WriteDataOutsideValidRangeError
+    if not 0 <= setting_data <= 1:
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
     self.switch_banks_via_external_input = bool(setting_data)
     self.start_eeprom_write()
   # ----------------------------------------------------------------------------
@@ -4776,7 +5644,7 @@ class SensorUnit:
     0: OFF
     1: ON
     """
-    return 1 * self.zero_shift_saved_in_memory
+    return int(self.zero_shift_saved_in_memory)
   # ----------------------------------------------------------------------------
 
   def write_152_zero_shift_value_memory_function(
@@ -4790,8 +5658,8 @@ class SensorUnit:
     0: OFF
     1: ON
     """
-    if setting_data not in (0, 1):
-      raise WriteDataOutsideValidRangeError
+    if not 0 <= setting_data <= 1:
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
     self.zero_shift_saved_in_memory = bool(setting_data)
     self.start_eeprom_write()
   # ----------------------------------------------------------------------------
@@ -4804,7 +5672,7 @@ class SensorUnit:
     0:Interference prevention OFF
     1:Interference prevention ON
     """
-    return 1 * self.mutual_interference_prevention_active
+    return int(self.mutual_interference_prevention_active)
   # ----------------------------------------------------------------------------
 
   def write_153_mutual_interference_prevention_function(
@@ -4819,9 +5687,9 @@ class SensorUnit:
     1:Interference prevention ON
     """
     if not self.is_main_unit:
-      raise IDOutsideValidRangeError
-    if setting_data not in (0, 1):
-      raise WriteDataOutsideValidRangeError
+      raise ID_OUTSIDE_VALID_RANGE_ERROR
+    if not 0 <= setting_data <= 1:
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
     self.mutual_interference_prevention_active = bool(setting_data)
     self.start_eeprom_write()
   # ----------------------------------------------------------------------------
@@ -4849,9 +5717,9 @@ class SensorUnit:
     4:0.1
     5:1
     """
-    if setting_data not in (0, 1, 2, 3, 4, 5):
-      raise WriteDataOutsideValidRangeError
-    self.display_digit_setting = DisplayDigit(setting_data)
+    if not 0 <= setting_data <= 5:
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
+    self.display_digit_setting = _cached_member(DisplayDigit, setting_data)
     self.start_eeprom_write()
   # ----------------------------------------------------------------------------
 
@@ -4876,9 +5744,9 @@ class SensorUnit:
     1:Half
     2:All
     """
-    if setting_data not in (0, 1, 2):
-      raise WriteDataOutsideValidRangeError
-    self.power_saving_mode = PowerSavingMode(setting_data)
+    if not 0 <= setting_data <= 2:
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
+    self.power_saving_mode = _cached_member(PowerSavingMode, setting_data)
     self.start_eeprom_write()
   # ----------------------------------------------------------------------------
 
@@ -4903,9 +5771,9 @@ class SensorUnit:
     1:OK/NG display
     2:OFF
     """
-    if setting_data not in (0, 1, 2):
-      raise WriteDataOutsideValidRangeError
-    self.head_display_mode = HeadDisplayMode(setting_data)
+    if not 0 <= setting_data <= 2:
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
+    self.head_display_mode = _cached_member(HeadDisplayMode, setting_data)
     self.start_eeprom_write()
   # ----------------------------------------------------------------------------
 
@@ -4930,9 +5798,9 @@ class SensorUnit:
     1:GO Red
     2:Always Red
     """
-    if setting_data not in (0, 1, 2):
-      raise WriteDataOutsideValidRangeError
-    self.display_color = DisplayColor(setting_data)
+    if not 0 <= setting_data <= 2:
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
+    self.display_color = _cached_member(DisplayColor, setting_data)
     self.start_eeprom_write()
   # ----------------------------------------------------------------------------
 
@@ -4954,8 +5822,8 @@ class SensorUnit:
 
     Parameter range: 2 to 9999 (initial value: 10)
     """
-    if setting_data not in range(2, 9999 + 1):
-      raise WriteDataOutsideValidRangeError
+    if not 2 <= setting_data <= 9999:
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
     self.diff_count_filter_timer_duration = setting_data
     self.start_eeprom_write()
   # ----------------------------------------------------------------------------
@@ -4998,9 +5866,9 @@ class SensorUnit:
     8: 50Hz
     9: 100Hz
     """
-    if setting_data not in (0, 1, 2, 3, 4, 5, 6, 7, 8, 9):
-      raise WriteDataOutsideValidRangeError
-    self.high_pass_cutoff_frequency = HighPassCutoffFrequency(setting_data)
+    if not 0 <= setting_data <= 9:
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
+    self.high_pass_cutoff_frequency = _cached_member(HighPassCutoffFrequency, setting_data)
     self.start_eeprom_write()
   # ----------------------------------------------------------------------------
 
@@ -5028,9 +5896,9 @@ class SensorUnit:
     # This is function is listed as Read-Only in DL-EN1 user manual,
     # while the DL-RS1A user manual has it as R/W.
     # I asssume this is a printing error in the DL-EN1 manual.
-    if setting_data not in (0, 1, 2):
-      raise WriteDataOutsideValidRangeError
-    self.alarm_setting = AlarmSetting(setting_data)
+    if not 0 <= setting_data <= 2:
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
+    self.alarm_setting = _cached_member(AlarmSetting, setting_data)
     self.start_eeprom_write()
   # ----------------------------------------------------------------------------
 
@@ -5052,12 +5920,44 @@ class SensorUnit:
     # This is function is listed as Read-Only in DL-EN1 user manual,
     # while the DL-RS1A user manual has it as R/W.
     # I asssume this is a printing error in the DL-EN1 manual.
-    if setting_data not in range(0, 1000 + 1):
-      raise WriteDataOutsideValidRangeError
+    if not 0 <= setting_data <= 1000:
+      raise WRITE_DATA_OUTSIDE_VALID_RANGE_ERROR
     self.alarm_count = setting_data
     self.start_eeprom_write()
   # ----------------------------------------------------------------------------
 
+  @property
+  def is_main_unit(self) -> bool:
+    """
+    Is this the main unit or an expansion unit?
+
+    Setting it refreshes the precomputed identity primitives returned
+    by the SR identity handlers.
+    """
+    return self._is_main_unit
+
+  @is_main_unit.setter
+  def is_main_unit(self, value: bool) -> None:
+    self._is_main_unit = value
+    self._product_code = 4022 if value else 4023
+    self._product_name = "IL-1000/1500" if value else "IL-1050/1550"
+  # ----------------------------------------------------------------------------
+
+  @property
+  def connected_sensor_head(self) -> SensorHeadCode:
+    """
+    Model of sensor head connected to the amplifier.
+
+    Setting it caches the plain-int code returned by read_195.
+    """
+    return self._connected_sensor_head
+
+  @connected_sensor_head.setter
+  def connected_sensor_head(self, value: SensorHeadCode) -> None:
+    self._connected_sensor_head = value
+    self._connected_sensor_head_int = int(value)
+  # ----------------------------------------------------------------------------
+
   def read_193_product_code(self) -> int:
     """
     Indicates the product code.
@@ -5065,8 +5965,8 @@ class SensorUnit:
     Main unit : 4022
     Expansion unit : 4023
     """
-    return 4022 if self.is_main_unit else 4023
-  # ----------------------------------------------------------------------------
+    return self._product_code
+  # ------------------------------------------------------------------------------
 
   def read_194_revision(self) -> int:
     """
@@ -5097,7 +5997,7 @@ class SensorUnit:
     208:IL-S100
     311:IL-2000
     """
-    return int(self.connected_sensor_head)
+    return self._connected_sensor_head_int
   # ----------------------------------------------------------------------------
 
   def read_200_product_name(self) -> str:
@@ -5107,7 +6007,7 @@ class SensorUnit:
     Main unit : "IL-1000/1500"
     Expansion unit : "IL-1050/1550"
     """
-    return "IL-1000/1500" if self.is_main_unit else "IL-1050/1550"
+    return self._product_name
   # ----------------------------------------------------------------------------
 
   def read_215_series_code(self) -> int:
@@ -5117,7 +6017,7 @@ class SensorUnit:
     Main unit : 4022
     Expansion unit : 4023
     """
-    return 4022 if self.is_main_unit else 4023
+    return self._product_code
   # ----------------------------------------------------------------------------
 
   def read_216_series_version(self) -> int:
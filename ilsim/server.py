@@ -2,10 +2,12 @@
 
 # native imports
 import json
+import logging
 import sys
 from dataclasses import dataclass
 from socketserver import StreamRequestHandler
-from socketserver import TCPServer
+from socketserver import ThreadingTCPServer
+from threading import Lock
 from time import sleep
 from typing import Any, ClassVar
 
@@ -15,7 +17,10 @@ from .sensor import FACTORY_MAPPING
 from .sensor import SensorUnit
 
 
-@dataclass
+log = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
 class Config:
   """
   Container class for parsed config data.
@@ -23,6 +28,7 @@ class Config:
   communication_unit: CommunicationUnit
   host: str
   port: int
+  artificial_delay: float
 
 
 def load_config(filename: str = "config.json") -> Config:
@@ -33,19 +39,30 @@ def load_config(filename: str = "config.json") -> Config:
     raw_config = json.load(file)
   host: str = raw_config['host']
   port: int = raw_config['port']
+  # Simulated device latency per query, in seconds; 0 disables it.
+  artificial_delay: float = raw_config.get('artificial_delay', 0.020)
   communication_unit: CommunicationUnit = CommunicationUnit()
-  for sensor_config in raw_config['sensors']:
+  for index, sensor_config in enumerate(raw_config['sensors']):
     sensor_type: str = sensor_config['type']
     overrides: dict[str, Any] = sensor_config['overrides']
     factory = FACTORY_MAPPING[sensor_type]
     sensor: SensorUnit = factory()
     for attribute, value in overrides.items():
-      setattr(sensor, attribute, value)
+      # SensorUnit uses __slots__, so a mistyped override name raises
+      # AttributeError here instead of going silently undetected.
+      try:
+        setattr(sensor, attribute, value)
+      except AttributeError:
+        raise ValueError(
+          f"Unknown sensor override {attribute!r}"
+          f" in sensors[{index}] ({sensor_type})"
+        ) from None
     communication_unit.add_unit(sensor)
   return Config(
     communication_unit=communication_unit,
     host=host,
-    port=port
+    port=port,
+    artificial_delay=artificial_delay
   )
 
 
@@ -55,44 +72,67 @@ class DLEN1TCPHandler(StreamRequestHandler):
   to/from communication_unit.
   """
   communication_unit: ClassVar[CommunicationUnit | None] = None
+  artificial_delay: ClassVar[float] = 0.020
+  # Serializes access to the shared communication unit across client
+  # threads, including the RELOAD_CONFIG swap.
+  _query_lock: ClassVar[Lock] = Lock()
 
   def handle(self) -> None:
     assert isinstance(self.communication_unit, CommunicationUnit)
-    print(f"{self.client_address} established connection")
+    log.info("%s established connection", self.client_address)
     # self.rfile is a file-like object created by the handler;
     # we can now use e.g. readline() instead of raw recv() calls
     while True:
       self.data = self.rfile.readline()
       if self.data == b'':
-        print(f"{self.client_address} closed connection")
+        log.info("%s closed connection", self.client_address)
         break
       if self.data == b'RELOAD_CONFIG\r\n':
         cfg: Config = load_config()
-        self.__class__.communication_unit = cfg.communication_unit
-        print("Config reloaded")
-        self.wfile.write(b"Config reloaded")
+        with self._query_lock:
+          self.__class__.communication_unit = cfg.communication_unit
+          self.__class__.artificial_delay = cfg.artificial_delay
+        log.info("Config reloaded")
+        self.request.sendall(b"Config reloaded")
         continue
-      print(f"Received: {self.data!r}")
-      # Likewise, self.wfile is a file-like object used to write back
-      # to the client
-      sleep(0.020)  # Artifical delay
-      response = self.communication_unit.handle_query(self.data)
-      print(f"Response: {response!r}")
-      self.wfile.write(response)
+      log.debug("Received: %r", self.data)
+      if self.artificial_delay:
+        sleep(self.artificial_delay)  # Artifical delay
+      # Framing is handled here: the CRLF trailer is stripped once on
+      # input and handle_query appends it once to the reply.
+      with self._query_lock:
+        response = self.communication_unit.handle_query(
+          self.data.removesuffix(b'\r\n')
+        )
+      log.debug("Response: %r", response)
+      # sendall writes straight to the socket and loops until the whole
+      # reply is out; wfile is an unbuffered SocketIO wrapper that only
+      # guarantees a single send per write.
+      self.request.sendall(response)
+
+
+class DLEN1TCPServer(ThreadingTCPServer):
+  """
+  Threading TCP server so multiple clients are served concurrently.
+  """
+  daemon_threads = True
+  allow_reuse_address = True
 
 
 def main() -> None:
   """
   Entry point for servers.
   """
+  logging.basicConfig(level=logging.INFO)
   try:
     config_file: str = sys.argv[1]
   except IndexError:
     config_file = 'config.json'
   config: Config = load_config(config_file)
   DLEN1TCPHandler.communication_unit = config.communication_unit
+  DLEN1TCPHandler.artificial_delay = config.artificial_delay
 
-  with TCPServer((config.host, config.port), DLEN1TCPHandler) as server:
+  with DLEN1TCPServer((config.host, config.port), DLEN1TCPHandler) as server:
     # Activate the server; this will keep running until you
     # interrupt the program with Ctrl-C
     try: